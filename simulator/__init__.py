@@ -3,22 +3,33 @@ from .helper_functions import (
     display_topology,
     show_scenario_overview,
     display_simulation_metrics,
+    stream_json,
     display_reliability_metrics,
     display_application_info,
     
     # Mathematical and Normalization Functions
     uniform,
     min_max_norm,
+    min_max_norm_array,
     find_minimum_and_maximum,
     get_norm,
+    get_norm_array,
+    get_access_session_arrays,
     normalize_cpu_and_memory,
     get_normalized_capacity,
     get_normalized_free_capacity,
     get_normalized_demand,
+    get_normalized_demand_array,
+    get_normalized_free_capacity_array,
+    get_edge_server_arrays,
+    get_edge_server_demand_arrays,
+    get_available_server_mask,
+    get_available_edge_servers,
     
     # Network and Path Functions
     get_shortest_path,
     get_delay,
+    get_delay_matrix,
     find_shortest_path,
     calculate_path_delay,
     sign,
@@ -27,7 +38,9 @@ from .helper_functions import (
     # Provisioning and User Functions
     deprovision_service,
     user_set_communication_path,
+    user_peek_delay,
     is_user_accessing_application,
+    refresh_active_applications,
     randomized_closest_fit,
     
     # Metrics Collection Functions
@@ -43,6 +56,8 @@ from .helper_functions import (
     
     # Downtime and Reliability Functions
     update_user_perceived_downtime_for_current_step,
+    initialize_perceived_downtime_tracking,
+    get_step_registries,
     get_user_perceived_downtime_count,
     get_user_perceived_downtime,
     get_application_downtime,
@@ -65,6 +80,11 @@ from .helper_functions import (
     get_server_conditional_reliability,
     get_time_since_last_repair,
     get_server_trust_cost,
+    ServerStats,
+    compute_server_stats,
+    compute_all_server_stats,
+    server_stats_to_dict,
+    FailureReliabilityEvents,
     init_failure_reliability_tracking,
     record_server_failure_reliability,
     print_failure_reliability_summary,
@@ -92,22 +112,33 @@ __all__ = [
     "display_topology",
     "show_scenario_overview",
     "display_simulation_metrics",
+    "stream_json",
     "display_reliability_metrics",
     "display_application_info",
     
     # Mathematical and Normalization Functions
     "uniform",
     "min_max_norm",
+    "min_max_norm_array",
     "find_minimum_and_maximum",
     "get_norm",
+    "get_norm_array",
+    "get_access_session_arrays",
     "normalize_cpu_and_memory",
     "get_normalized_capacity",
     "get_normalized_free_capacity",
     "get_normalized_demand",
+    "get_normalized_demand_array",
+    "get_normalized_free_capacity_array",
+    "get_edge_server_arrays",
+    "get_edge_server_demand_arrays",
+    "get_available_server_mask",
+    "get_available_edge_servers",
     
     # Network and Path Functions
     "get_shortest_path",
     "get_delay",
+    "get_delay_matrix",
     "find_shortest_path",
     "calculate_path_delay",
     "sign",
@@ -116,7 +147,9 @@ __all__ = [
     # Provisioning and User Functions
     "deprovision_service",
     "user_set_communication_path",
+    "user_peek_delay",
     "is_user_accessing_application",
+    "refresh_active_applications",
     "randomized_closest_fit",
     
     # Metrics Collection Functions
@@ -132,6 +165,8 @@ __all__ = [
     
     # Downtime and Reliability Functions
     "update_user_perceived_downtime_for_current_step",
+    "initialize_perceived_downtime_tracking",
+    "get_step_registries",
     "get_user_perceived_downtime_count",
     "get_user_perceived_downtime",
     "get_application_downtime",
@@ -154,6 +189,11 @@ __all__ = [
     "get_server_conditional_reliability",
     "get_time_since_last_repair",
     "get_server_trust_cost",
+    "ServerStats",
+    "compute_server_stats",
+    "compute_all_server_stats",
+    "server_stats_to_dict",
+    "FailureReliabilityEvents",
     "init_failure_reliability_tracking",
     "record_server_failure_reliability",
     "print_failure_reliability_summary",
@@ -32,6 +32,11 @@ def load_edgesimpy_extensions():
     Application.availability_history = availability_history
     Application.downtime_history = downtime_history
 
+    # Flags de desprovisionamento (valor padrão na classe; instâncias só guardam valores definidos)
+    Service._pending_deprovision = None
+    Service._deprovision_reason = None
+    Service._pending_origin_server = None
+
 
 def main(parameters: dict):
     """Executa a simulação com os parâmetros fornecidos."""
@@ -88,6 +93,7 @@ def main(parameters: dict):
     simulator.output_file_name = parameters_string
 
     User.set_communication_path = user_set_communication_path
+    User.peek_delay = user_peek_delay
     Topology.collect = topology_collect
 
     # Initializing the simulated scenario
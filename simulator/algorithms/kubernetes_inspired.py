@@ -946,7 +946,7 @@ def reactive_pod_recreation(current_step):
         print(f"[K8S] Serviço {service.id} (App {app.id}) estava no servidor {failed_server.id} (FALHOU)")
         
         # Kubernetes Scheduler Logic: Escolher node com recursos disponíveis
-        candidates = [s for s in EdgeServer.all() if s.status == "available" and s.has_capacity_to_host(service)]
+        candidates = [s for s in get_available_edge_servers() if s.has_capacity_to_host(service)]
         
         if candidates:
             # ✅ CORREÇÃO 1: Passar 'user' e 'app' que faltavam (causava o TypeError)
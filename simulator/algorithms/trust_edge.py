@@ -1404,6 +1404,9 @@ def trust_edge_v3(parameters: dict = {}):
     print(f"  M3 (P2P Layer Download):     {'ON ✅' if _te_enable_p2p else 'OFF ❌'}")
     print(f"  M4 (Live Migration):         {'ON ✅' if _te_enable_live else 'OFF ❌'}\n")
 
+    # ✅ OTIMIZAÇÃO: Usuários, servidores e serviços materializados uma vez por step (model._users etc.)
+    get_step_registries(model)
+
     # Inicializar acumulador de tempo no modelo (apenas no step 1)
     if not hasattr(model, '_trust_edge_total_execution_time'):
         model._trust_edge_total_execution_time = 0.0
@@ -1504,7 +1507,7 @@ def trust_edge_v3(parameters: dict = {}):
         diagnose_layer_downloads(current_step)
 
     # Isso garante que a estimativa leve em conta falhas recentes IMEDIATAMENTE.
-    for server in EdgeServer.all():
+    for server in get_step_registries()[1]:
         # Verifica se o servidor acabou de se recuperar ou falhar
         # Se o tamanho do histórico mudou desde a última checagem, invalida cache
         if not hasattr(server, '_last_history_len'):
@@ -1691,7 +1694,7 @@ def check_ongoing_migrations(current_step):
     migrations_active = 0
     services_to_requeue = []
 
-    for service in Service.all():
+    for service in get_step_registries()[2]:
         if not hasattr(service, '_Service__migrations') or len(service._Service__migrations) == 0:
             continue
             
@@ -1969,7 +1972,7 @@ def identify_services_for_migration(current_step, reliability_threshold, delay_t
     # Impede que um serviço migre novamente menos de 5 steps após chegar
     MIGRATION_COOLDOWN = 5
 
-    for user in User.all():
+    for user in get_step_registries()[0]:
         # ✅ PULAR usuários fazendo nova requisição (provisionamento em andamento)
         if is_making_request(user, current_step):
             continue
@@ -2736,7 +2739,7 @@ def update_application_delays(current_step):
     
     # ✅ Coletar latências para análise (mantido)
     global _raw_latencies
-    for user in User.all():
+    for user in get_step_registries()[0]:
         for app in user.applications:
             if is_user_accessing_application(user, app, current_step):
                 current_val = user.delays.get(str(app.id), 0)
@@ -2804,7 +2807,7 @@ def check_and_deprovision_inactive_services(current_step):
     # ═══════════════════════════════════════════════════════════════
     # PARTE 1: LIMPAR SERVIÇOS ÓRFÃOS DE TODOS OS SERVIDORES
     # ═══════════════════════════════════════════════════════════════
-    for server in EdgeServer.all():
+    for server in get_step_registries()[1]:
         services_to_remove = []
         
         for service in list(server.services):
@@ -2898,7 +2901,7 @@ def check_and_deprovision_inactive_services(current_step):
     # ═══════════════════════════════════════════════════════════════
     # PARTE 2: IDENTIFICAR SERVIÇOS INATIVOS PARA DESPROVISIONAMENTO
     # ═══════════════════════════════════════════════════════════════
-    for service in Service.all():
+    for service in get_step_registries()[2]:
         app = service.application
         
         if not app or not app.users:
@@ -3150,7 +3153,7 @@ def collect_new_request_metadata(current_step):
     """Coleta metadados de aplicações com novas requisições."""
     apps_metadata = []
     
-    for user in User.all():
+    for user in get_step_registries()[0]:
         if is_making_request(user, current_step):
             for app in user.applications:
                 app_attrs = {
@@ -3168,16 +3171,21 @@ def collect_new_request_metadata(current_step):
 
 def sort_applications_by_priority(apps_metadata):
     """Ordena aplicações por prioridade usando normalização."""
+    if not apps_metadata:
+        return []
+
     min_and_max_app = find_minimum_and_maximum(metadata=apps_metadata)
+    minimum, maximum = min_and_max_app["minimum"], min_and_max_app["maximum"]
   
-    return sorted(
-        apps_metadata, 
-        key=lambda app: (
-        get_norm(metadata=app, attr_name="delay_cost", min=min_and_max_app["minimum"], max=min_and_max_app["maximum"]) +
-        get_norm(metadata=app, attr_name="intensity_score", min=min_and_max_app["minimum"], max=min_and_max_app["maximum"]) +
-        (1 - get_norm(metadata=app, attr_name="demand_resource", min=min_and_max_app["minimum"], max=min_and_max_app["maximum"]))
-    ), reverse=True
-    )
+    # ✅ OTIMIZAÇÃO: Normalização Min-Max vetorizada por atributo (uma passada NumPy por coluna)
+    priority_scores = (
+        get_norm_array(metadata=apps_metadata, attr_name="delay_cost", min=minimum, max=maximum) +
+        get_norm_array(metadata=apps_metadata, attr_name="intensity_score", min=minimum, max=maximum) +
+        (1 - get_norm_array(metadata=apps_metadata, attr_name="demand_resource", min=minimum, max=maximum))
+    ).tolist()
+
+    order = sorted(range(len(apps_metadata)), key=priority_scores.__getitem__, reverse=True)
+    return [apps_metadata[index] for index in order]
 
 def process_application_request(app_metadata, all_apps_metadata, ephemeral_load_tracker=None):
     """Processa requisição de uma aplicação específica."""
@@ -3356,14 +3364,27 @@ def sort_host_candidates(edge_servers, delay_sla=None, reason="provisioning", ep
     max_queue = max([s["projected_queue_size"] for s in edge_servers]) if edge_servers else 1
     if max_queue == 0: max_queue = 1
 
-    for s in edge_servers:
-        s["trust_cost_norm"] = get_norm(metadata=s, attr_name="trust_cost", min=min_and_max["minimum"], max=min_and_max["maximum"])
-        s["uncached_layers_norm"] = get_norm(metadata=s, attr_name="amount_of_uncached_layers", min=min_and_max["minimum"], max=min_and_max["maximum"])
-        s["delay_norm"] = get_norm(metadata=s, attr_name="overall_delay", min=min_and_max["minimum"], max=min_and_max["maximum"])
-        s["capacity_norm"] = 1 - get_norm(metadata=s, attr_name="free_capacity", min=min_and_max["minimum"], max=min_and_max["maximum"])
+    # ✅ OTIMIZAÇÃO: Normalização Min-Max vetorizada por atributo (uma passada NumPy por coluna)
+    minimum, maximum = min_and_max["minimum"], min_and_max["maximum"]
+    normalized_columns = zip(
+        get_norm_array(metadata=edge_servers, attr_name="trust_cost", min=minimum, max=maximum).tolist(),
+        get_norm_array(metadata=edge_servers, attr_name="amount_of_uncached_layers", min=minimum, max=maximum).tolist(),
+        get_norm_array(metadata=edge_servers, attr_name="overall_delay", min=minimum, max=maximum).tolist(),
+        (1 - get_norm_array(metadata=edge_servers, attr_name="free_capacity", min=minimum, max=maximum)).tolist(),
+        get_norm_array(metadata=edge_servers, attr_name="estimated_provisioning_time", min=minimum, max=maximum).tolist(),
+        get_norm_array(metadata=edge_servers, attr_name="total_uncached_mb", min=minimum, max=maximum).tolist(),
+    )
+
+    for s, (trust_cost_norm, uncached_layers_norm, delay_norm, capacity_norm, provisioning_time_norm, uncached_mb_norm) in zip(
+        edge_servers, normalized_columns
+    ):
+        s["trust_cost_norm"] = trust_cost_norm
+        s["uncached_layers_norm"] = uncached_layers_norm
+        s["delay_norm"] = delay_norm
+        s["capacity_norm"] = capacity_norm
         
-        s["provisioning_time_norm"] = get_norm(metadata=s, attr_name="estimated_provisioning_time", min=min_and_max["minimum"], max=min_and_max["maximum"])
-        s["uncached_mb_norm"] = get_norm(metadata=s, attr_name="total_uncached_mb", min=min_and_max["minimum"], max=min_and_max["maximum"])
+        s["provisioning_time_norm"] = provisioning_time_norm
+        s["uncached_mb_norm"] = uncached_mb_norm
         s["queue_norm"] = s["projected_queue_size"] / max_queue
 
     # -------------------------------------------------------------------------
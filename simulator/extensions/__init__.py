@@ -4,7 +4,7 @@ __version__ = "1.1.0"
 
 # Importing simulator extensions
 from .base_failure_model import BaseFailureGroupModel
-from .edge_server_extensions import edge_server_step, failure_history, available_history, _rebuild_layer_index
+from .edge_server_extensions import edge_server_step, failure_history, available_history, _rebuild_layer_index, get_server_status_version
 from .application_extensions import application_step, availability_status, availability_history, downtime_history
 from .user_extensions import user_step
 from .service_extensions import service_step
@@ -22,4 +22,5 @@ __all__ = [
     "user_step",
     "service_step",
     "_rebuild_layer_index",
+    "get_server_status_version",
 ]
@@ -10,9 +10,9 @@ def availability_status(self):
 
 @property
 def availability_history(self):
-    """Returns the history of the application's availability."""
+    """Returns the history of the application's availability (one byte per step: 1 = available, 0 = unavailable)."""
     if not hasattr(self, "_availability_history"):
-        self._availability_history = []
+        self._availability_history = bytearray()
 
     current_step = self.model.schedule.steps
     if len(self._availability_history) <= current_step:
@@ -170,6 +170,73 @@ class BaseFailureGroupModel(ComponentManager):
         }
         return dictionary
 
+    def get_history_arrays(self) -> tuple:
+        """Returns the failure history as NumPy arrays (synced lazily, as the failure history is append-only).
+
+        Returns:
+            failure_starts (np.ndarray): Time step in which each failure started.
+            becomes_available (np.ndarray): Time step in which the device became available after each failure (may be inf).
+        """
+        if not hasattr(self, "_failure_starts") or len(self._failure_starts) > len(self.failure_history):
+            # Histórico foi substituído (ex.: carregado de dataset): reconstruir do zero
+            self._failure_starts = np.empty(0, dtype=float)
+            self._becomes_available = np.empty(0, dtype=float)
+
+        if len(self._failure_starts) < len(self.failure_history):
+            new_failures = self.failure_history[len(self._failure_starts) :]
+            self._failure_starts = np.concatenate((self._failure_starts, [f["failure_starts_at"] for f in new_failures]))
+            self._becomes_available = np.concatenate((self._becomes_available, [f["becomes_available_at"] for f in new_failures]))
+
+        return self._failure_starts, self._becomes_available
+
+    def get_trace_arrays(self) -> tuple:
+        """Returns the flattened failure trace as sorted NumPy arrays (failure groups are only appended, never modified).
+
+        Returns:
+            failure_starts (np.ndarray): Time step in which each planned failure starts.
+            becomes_available (np.ndarray): Time step in which the device becomes available after each planned failure (may be inf).
+        """
+        if not hasattr(self, "_flat_failure_trace") or self._synced_failure_groups > len(self.failure_trace):
+            self._synced_failure_groups = 0
+            self._flat_failure_trace = []
+            self._trace_starts = np.empty(0, dtype=float)
+            self._trace_becomes_available = np.empty(0, dtype=float)
+
+        if self._synced_failure_groups < len(self.failure_trace):
+            new_failures = [failure for failure_group in self.failure_trace[self._synced_failure_groups :] for failure in failure_group]
+            self._flat_failure_trace.extend(new_failures)
+            self._trace_starts = np.concatenate((self._trace_starts, [f["failure_starts_at"] for f in new_failures]))
+            self._trace_becomes_available = np.concatenate(
+                (self._trace_becomes_available, [f.get("becomes_available_at", float("inf")) for f in new_failures])
+            )
+            self._synced_failure_groups = len(self.failure_trace)
+
+        return self._trace_starts, self._trace_becomes_available
+
+    def get_failure_at(self, time_step: int, include_end: bool = False) -> dict:
+        """Finds the planned failure that covers a given time step using binary search over the failure trace.
+
+        Args:
+            time_step (int): Time step to be checked.
+            include_end (bool, optional): Whether the step in which the device becomes available is part of the failure. Defaults to False.
+
+        Returns:
+            failure (dict): Failure covering the time step (None if there is no such failure).
+        """
+        failure_starts, becomes_available = self.get_trace_arrays()
+        index = int(np.searchsorted(failure_starts, time_step, side="right")) - 1
+
+        if include_end:
+            # Com intervalos fechados, a falha anterior pode terminar exatamente onde a próxima começa
+            if index > 0 and time_step <= becomes_available[index - 1]:
+                index -= 1
+            if index >= 0 and time_step <= becomes_available[index]:
+                return self._flat_failure_trace[index]
+        elif index >= 0 and time_step < becomes_available[index]:
+            return self._flat_failure_trace[index]
+
+        return None
+
     def collect(self) -> dict:
         """Method that collects a set of metrics for the object.
 
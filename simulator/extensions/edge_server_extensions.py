@@ -11,6 +11,24 @@ import networkx as nx
 from random import randint
 
 
+# ═══════════════════════════════════════════════════════════════
+# ✅ OTIMIZAÇÃO: Versão do status dos servidores
+# ═══════════════════════════════════════════════════════════════
+
+_SERVER_STATUS_VERSION = 0  # Incrementada a cada transição de status (falha/boot/recuperação)
+
+
+def get_server_status_version():
+    """Retorna a versão atual do status dos servidores (permite invalidar caches de disponibilidade)."""
+    return _SERVER_STATUS_VERSION
+
+
+def _bump_server_status_version():
+    """Registra que o status de algum servidor mudou."""
+    global _SERVER_STATUS_VERSION
+    _SERVER_STATUS_VERSION += 1
+
+
 # ═══════════════════════════════════════════════════════════════
 # ✅ OTIMIZAÇÃO: Índice Reverso de Camadas
 # ═══════════════════════════════════════════════════════════════
@@ -126,21 +144,19 @@ class FailureManagementExecutor:
     
     def get_ongoing_failure(self):
         """Retorna a falha em curso (se houver)."""
-        flatten_failure_trace = [
-            item for failure_group in self.server.failure_model.failure_trace 
-            for item in failure_group
-        ]
-        
-        return next(
-            (
-                failure for failure in flatten_failure_trace
-                if failure["failure_starts_at"] <= self.current_step <= failure["becomes_available_at"]
-            ),
-            None,
-        )
+        # ✅ OTIMIZAÇÃO: busca binária no trace em vez de achatar e varrer todas as falhas
+        return self.server.failure_model.get_failure_at(self.current_step, include_end=True)
     
     def update_server_status(self, ongoing_failure):
         """Atualiza o status do servidor baseado na falha em curso."""
+        previous_status = self.server.status
+        self._apply_status_transition(ongoing_failure)
+        
+        if self.server.status != previous_status:
+            _bump_server_status_version()
+    
+    def _apply_status_transition(self, ongoing_failure):
+        """Aplica a transição de status (available → failing → booting → available)."""
         if ongoing_failure is None:
             self.server.status = "available"
             self.server.available = True
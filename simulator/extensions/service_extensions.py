@@ -2,8 +2,13 @@
 from edge_sim_py.components import *
 
 # Python libraries
+import logging
 import networkx as nx
 
+# Logger compartilhado da simulação (mensagens de debug desabilitadas por padrão;
+# habilitar com logging.basicConfig(level=logging.DEBUG))
+logger = logging.getLogger("trustedge.sim")
+
 
 # ═══════════════════════════════════════════════════════════════
 # ✅ CONFIGURATION FLAGS (Global - set by algorithm)
@@ -71,24 +76,23 @@ def service_step(self):
         origin_available = origin.available if origin else "N/A"
         target_available = target.available if target else "N/A"
         
-        print(f"\n[SERVICE_STEP] === Serviço {self.id} - Step {current_step} ===")
-        print(f"[SERVICE_STEP] migration_reason: '{migration_reason}'")
-        print(f"[SERVICE_STEP] origin: {origin_id_debug} (available: {origin_available})")
-        print(f"[SERVICE_STEP] target: {target_id_debug} (available: {target_available})")
-        print(f"[SERVICE_STEP] Status da migração: {migration.get('status', 'N/A')}")
-        
         # ✅ DETECÇÃO DE MIGRAÇÃO DE RECUPERAÇÃO
         is_recovery_migration = (migration_reason == "server_failed")
         
-        print(f"[SERVICE_STEP] is_recovery_migration: {is_recovery_migration}")
-        
-        # ✅ MOSTRAR CONFIGURAÇÃO (apenas primeira vez)
-        if not hasattr(migration, "_config_logged"):
-            print(f"[SERVICE_STEP] Live Migration: {'ENABLED' if config['enable_live_migration'] else 'DISABLED'}")
-            print(f"[SERVICE_STEP] State Transfer: {'ENABLED' if config['enable_state_transfer'] else 'DISABLED'}")
-            migration["_config_logged"] = True
-        
-        print()
+        # ✅ OTIMIZAÇÃO: formatação do banner só acontece com DEBUG habilitado
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[SERVICE_STEP] === Serviço %s - Step %s ===", self.id, current_step)
+            logger.debug("[SERVICE_STEP] migration_reason: '%s'", migration_reason)
+            logger.debug("[SERVICE_STEP] origin: %s (available: %s)", origin_id_debug, origin_available)
+            logger.debug("[SERVICE_STEP] target: %s (available: %s)", target_id_debug, target_available)
+            logger.debug("[SERVICE_STEP] Status da migração: %s", migration.get('status', 'N/A'))
+            logger.debug("[SERVICE_STEP] is_recovery_migration: %s", is_recovery_migration)
+            
+            # ✅ MOSTRAR CONFIGURAÇÃO (apenas primeira vez)
+            if not migration.get("_config_logged"):
+                logger.debug("[SERVICE_STEP] Live Migration: %s", 'ENABLED' if config['enable_live_migration'] else 'DISABLED')
+                logger.debug("[SERVICE_STEP] State Transfer: %s", 'ENABLED' if config['enable_state_transfer'] else 'DISABLED')
+                migration["_config_logged"] = True
         
         # ✅ DEBUG: Validar consistência
         if relationships_created_by_algorithm:
@@ -115,9 +119,9 @@ def service_step(self):
 
             if self.server != expected_server:
                 mode = "Live" if config["enable_live_migration"] else "Cold"
-                print(f"[SERVICE_STEP] ⚠️ INCONSISTÊNCIA ({mode} Migration): service.server={server_id}, esperado={expected_id_debug}")
-                print(f"              Status: {migration.get('status')}")
-                print(f"              Corrigindo automaticamente...")
+                logger.warning("[SERVICE_STEP] ⚠️ INCONSISTÊNCIA (%s Migration): service.server=%s, esperado=%s", mode, server_id, expected_id_debug)
+                logger.debug("              Status: %s", migration.get('status'))
+                logger.debug("              Corrigindo automaticamente...")
                 
                 self.server = expected_server
                 if expected_server and self not in expected_server.services:
@@ -153,7 +157,7 @@ def service_step(self):
                     is_accessing = (last_access["start"] <= current_step <= last_access["end"])
                     
                     if not is_accessing:
-                        print(f"[SERVICE_STEP] Usuário parou de acessar - cancelando migração")
+                        logger.debug("[SERVICE_STEP] Usuário parou de acessar - cancelando migração")
 
                         # ✅ CORREÇÃO: Usar 'self' em vez de 'service'
                         if origin and self in origin.services:
@@ -223,29 +227,28 @@ def service_step(self):
                 (migration["status"] == "waiting" and total_downloading > 0)  # Transitando para pulling
             )
             
-            if should_log:
-                print()
-                print(f"[SERVICE_STEP] Serviço {self.id} - Status: {migration['status']}")
+            if should_log and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[SERVICE_STEP] Serviço %s - Status: %s", self.id, migration['status'])
                 
                 # ✅ USAR IDs SEGUROS
                 if is_recovery_migration:
-                    print(f"              🔄 MIGRAÇÃO DE RECUPERAÇÃO")
-                    print(f"              Origem {origin_id_debug} (FALHOU) → Destino {target_id_debug}")
+                    logger.debug("              🔄 MIGRAÇÃO DE RECUPERAÇÃO")
+                    logger.debug("              Origem %s (FALHOU) → Destino %s", origin_id_debug, target_id_debug)
                 
-                print(f"              Alocado no servidor: {target_id_debug}")
-                print(f"              Camadas do serviço: {total_needed}")
-                print(f"              ✓ Baixadas: {total_downloaded}")
-                print(f"              ⏳ Baixando: {total_downloading}")
-                print(f"              ⏸ Aguardando: {total_waiting}")
+                logger.debug("              Alocado no servidor: %s", target_id_debug)
+                logger.debug("              Camadas do serviço: %s", total_needed)
+                logger.debug("              ✓ Baixadas: %s", total_downloaded)
+                logger.debug("              ⏳ Baixando: %s", total_downloading)
+                logger.debug("              ⏸ Aguardando: %s", total_waiting)
                 
                 # ✅ INFORMAÇÃO SOBRE O SERVIDOR
-                print(f"              Servidor {target_id_debug}:")
-                print(f"                - Downloads totais ativos: {total_downloads_on_server}")
-                print(f"                - Waiting queue total: {len(target.waiting_queue)}")
+                logger.debug("              Servidor %s:", target_id_debug)
+                logger.debug("                - Downloads totais ativos: %s", total_downloads_on_server)
+                logger.debug("                - Waiting queue total: %s", len(target.waiting_queue))
 
                 # ✅ MOSTRAR DE ONDE cada camada está sendo baixada
                 if total_downloading > 0:
-                    print(f"              Detalhes dos downloads:")
+                    logger.debug("              Detalhes dos downloads:")
                     for flow in target.download_queue:
                         if flow.metadata["object"].digest in image.layers_digests:
                             layer = flow.metadata["object"]
@@ -263,19 +266,19 @@ def service_step(self):
                                 )
                                 source_type = "Registry" if is_registry else "Edge Server"
                             
-                            print(f"                - Camada {layer.digest} - Size {layer.size} bytes - From {source_type} {source_id}")
+                            logger.debug("                - Camada %s - Size %s bytes - From %s %s", layer.digest, layer.size, source_type, source_id)
 
         # ✅ TRANSIÇÃO: waiting → pulling_layers
         if migration["status"] == "waiting":
             layers_on_target_server = layers_downloaded + layers_on_download_queue
             if len(layers_on_target_server) > 0:
                 migration["status"] = "pulling_layers"
-                print(f"[SERVICE_STEP] Serviço {self.id}: Iniciando download de camadas")
-                print(f"              {len(layers_downloaded)} já no servidor, {len(layers_on_download_queue)} baixando")
+                logger.debug("[SERVICE_STEP] Serviço %s: Iniciando download de camadas", self.id)
+                logger.debug("              %s já no servidor, %s baixando", len(layers_downloaded), len(layers_on_download_queue))
 
         # ✅ TRANSIÇÃO: pulling_layers → finished (ou migrating_service_state)
         if migration["status"] == "pulling_layers" and len(image.layers_digests) == len(layers_downloaded):
-            print(f"[SERVICE_STEP] Serviço {self.id}: ✅ Todas as {len(image.layers_digests)} camadas no servidor!")
+            logger.debug("[SERVICE_STEP] Serviço %s: ✅ Todas as %s camadas no servidor!", self.id, len(image.layers_digests))
             
             # Criar imagem no servidor de destino
             if not any([img.digest == self.image_digest for img in target.container_images]):
@@ -305,12 +308,12 @@ def service_step(self):
                     # ✅ Seguro: Liberar recursos
                     origin.cpu_demand = max(0, origin.cpu_demand - self.cpu_demand)
                     origin.memory_demand = max(0, origin.memory_demand - self.memory_demand)
-                    print(f"[SERVICE_STEP] Recursos liberados da origem {origin.id}")
+                    logger.debug("[SERVICE_STEP] Recursos liberados da origem %s", origin.id)
                 else:
                     # ⚠️ Origem falhou antes de liberar recursos
-                    print(f"[SERVICE_STEP] ⚠️ Origem {origin_id_debug} indisponível - recursos não liberados (já resetados pelo edge_server_step)")
+                    logger.warning("[SERVICE_STEP] ⚠️ Origem %s indisponível - recursos não liberados (já resetados pelo edge_server_step)", origin_id_debug)
             elif is_recovery_migration:
-                print(f"[SERVICE_STEP] Origem {origin_id_debug} indisponível - sem recursos para liberar")
+                logger.debug("[SERVICE_STEP] Origem %s indisponível - sem recursos para liberar", origin_id_debug)
 
             # ═══════════════════════════════════════════════════════════
             # DECISÃO: Migrar estado ou finalizar?
@@ -338,7 +341,7 @@ def service_step(self):
                     reason.append("origin failed before state transfer")  # ✅ NOVA
                 
                 reason_str = f" ({', '.join(reason)})" if reason else " (sem estado para migrar)"
-                print(f"[SERVICE_STEP] Serviço {self.id}: Finalizando{reason_str}")
+                logger.debug("[SERVICE_STEP] Serviço %s: Finalizando%s", self.id, reason_str)
             else:
                 migration["status"] = "migrating_service_state"
                 
@@ -346,7 +349,7 @@ def service_step(self):
                 # ✅ LIVE MIGRATION: Agora perde disponibilidade (cutover)
                 self._available = False
                 
-                print(f"[SERVICE_STEP] Serviço {self.id}: Iniciando migração de estado ({self.state} bytes)")
+                logger.debug("[SERVICE_STEP] Serviço %s: Iniciando migração de estado (%s bytes)", self.id, self.state)
                 
                 path = nx.shortest_path(
                     G=self.model.topology,
@@ -375,25 +378,25 @@ def service_step(self):
         # ✅ FINALIZAÇÃO
         if migration["status"] == "finished":
             migration["end"] = self.model.schedule.steps + 1
-            print(f"[SERVICE_STEP] Serviço {self.id}: Migração FINALIZADA")
-            print(f"              Origin: {origin.id if origin else 'None'}, Target: {target.id}")
+            logger.debug("[SERVICE_STEP] Serviço %s: Migração FINALIZADA", self.id)
+            logger.debug("              Origin: %s, Target: %s", origin.id if origin else 'None', target.id)
             
             if is_recovery_migration:
-                print(f"              🔄 Recuperação de falha concluída")
+                logger.debug("              🔄 Recuperação de falha concluída")
 
             if relationships_created_by_algorithm:
                 # ✅ Algoritmo já criou relacionamentos - apenas limpar origem
                 if origin and origin.available and self in origin.services:
                     origin.services.remove(self)
-                    print(f"[SERVICE_STEP] ✓ Removido da origem {origin.id}")
+                    logger.debug("[SERVICE_STEP] ✓ Removido da origem %s", origin.id)
                 
                 # Validar consistência
                 if self.server != target:
-                    print(f"[SERVICE_STEP] ⚠️ Corrigindo: service.server={self.server.id if self.server else None} → {target.id}")
+                    logger.warning("[SERVICE_STEP] ⚠️ Corrigindo: service.server=%s → %s", self.server.id if self.server else None, target.id)
                     self.server = target
                 
                 if self not in target.services:
-                    print(f"[SERVICE_STEP] ⚠️ Adicionando ao destino {target.id}")
+                    logger.warning("[SERVICE_STEP] ⚠️ Adicionando ao destino %s", target.id)
                     target.services.append(self)
             else:
                 # ✅ EdgeSimPy gerencia relacionamentos
@@ -414,7 +417,7 @@ def service_step(self):
             self._available = True
             self.being_provisioned = False
             
-            print(f"[SERVICE_STEP] ✅ Serviço {self.id} DISPONÍVEL no servidor {self.server.id}")
+            logger.debug("[SERVICE_STEP] ✅ Serviço %s DISPONÍVEL no servidor %s", self.id, self.server.id)
 
             # Atualizar caminhos
             app = self.application
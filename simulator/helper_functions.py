@@ -5,9 +5,15 @@ from random import choice, shuffle, sample
 import matplotlib.pyplot as plt
 import networkx as nx
 from json import dumps
+from dataclasses import dataclass
+from collections import Counter, defaultdict, deque
+from collections.abc import Iterator
+from operator import itemgetter
 from random import sample, randint
+import logging
+import sys
 import math  # Adicionado para cálculos matemáticos mais precisos
-from math import isinf, sqrt
+from math import inf, sqrt
 import numpy as np
 from scipy import stats
 
@@ -16,9 +22,127 @@ from edge_sim_py import *
 
 # Importing EdgeSimPy extensions
 from simulator.extensions import *
+from simulator.extensions.service_extensions import get_migration_config
+
+# Logger compartilhado da simulação (mensagens de debug desabilitadas por padrão;
+# habilitar com logging.basicConfig(level=logging.DEBUG))
+logger = logging.getLogger("trustedge.sim")
+
+# Delay de um serviço inacessível (constante compartilhada, sem alocar float('inf') a cada verificação)
+_INF = inf
+
+
+def _app_id_str(app: object) -> str:
+    """Returns the application ID as an interned string (key of the users' per-application dictionaries).
+
+    ✅ OTIMIZAÇÃO: A string é criada uma única vez por aplicação e reaproveitada em todos os steps.
+    """
+    app_id = getattr(app, "_id_str", None)
+    if app_id is None:
+        app_id = app._id_str = sys.intern(str(app.id))
+    return app_id
+
+def get_step_registries(model: object = None) -> tuple:
+    """Returns the users, edge servers and services of the simulation, materialized once per step.
+
+    ✅ OTIMIZAÇÃO: As listas ficam em model._users / model._edge_servers / model._services e são
+    reaproveitadas por todas as funções executadas no mesmo step (sem refazer .all() a cada chamada).
+
+    Args:
+        model (object, optional): Simulation model. Defaults to the model of the first Topology.
+
+    Returns:
+        (tuple): Users, edge servers and services.
+    """
+    if model is None:
+        model = Topology.first().model
+
+    current_step = model.schedule.steps
+    if getattr(model, "_registries_step", None) != current_step:
+        model._users = User.all()
+        model._edge_servers = EdgeServer.all()
+        model._services = Service.all()
+        model._registries_step = current_step
+
+    return model._users, model._edge_servers, model._services
+
+def _session_downtime_kernel(session_starts, session_ends, downtime_prefix, downtime_sla):
+    """Kernel numérico do downtime percebido em cada sessão e das sessões que violaram o SLA de downtime.
+
+    Args:
+        session_starts (np.ndarray): Step de início de cada sessão.
+        session_ends (np.ndarray): Step de término (inclusivo) de cada sessão.
+        downtime_prefix (np.ndarray): Soma acumulada do histórico de downtime por step (downtime_prefix[0] = 0).
+        downtime_sla (float): Downtime máximo permitido por sessão.
+
+    Returns:
+        session_downtimes (np.ndarray): Downtime percebido em cada sessão.
+        violated (np.ndarray): Máscara das sessões cujo downtime excedeu o SLA.
+    """
+    # Histórico começa em índice 0 (= step 1); steps além do histórico não contam
+    history_length = downtime_prefix.size - 1
+    first_index = np.clip(session_starts - 1, 0, history_length).astype(np.int64)
+    last_index = np.clip(np.maximum(session_ends, first_index), 0, history_length).astype(np.int64)
+    session_downtimes = downtime_prefix[last_index] - downtime_prefix[first_index]
+    return session_downtimes, session_downtimes > downtime_sla
+
+
+def get_access_session_arrays(access_pattern: object) -> tuple:
+    """Returns the access sessions of an access pattern as NumPy arrays (synced lazily, as the access history is append-only).
+
+    Args:
+        access_pattern (object): Access pattern whose history will be converted.
+
+    Returns:
+        session_starts (np.ndarray): Time step in which each session started.
+        session_ends (np.ndarray): Time step in which each session ended (inclusive).
+    """
+    history = access_pattern.history
+    if getattr(access_pattern, "_synced_sessions", None) is None or access_pattern._synced_sessions > len(history):
+        # Histórico foi substituído (ex.: carregado de dataset): reconstruir do zero
+        access_pattern._synced_sessions = 0
+        access_pattern.session_starts = np.empty(0, dtype=np.int64)
+        access_pattern.session_ends = np.empty(0, dtype=np.int64)
+
+    if access_pattern._synced_sessions < len(history):
+        # Sessões sem início/fim definidos são ignoradas
+        new_sessions = [
+            (session["start"], session["end"])
+            for session in history[access_pattern._synced_sessions :]
+            if session.get("start") is not None and session.get("end") is not None
+        ]
+        if new_sessions:
+            new_bounds = np.array(new_sessions, dtype=np.int64)
+            access_pattern.session_starts = np.concatenate((access_pattern.session_starts, new_bounds[:, 0]))
+            access_pattern.session_ends = np.concatenate((access_pattern.session_ends, new_bounds[:, 1]))
+        access_pattern._synced_sessions = len(history)
+
+    return access_pattern.session_starts, access_pattern.session_ends
+
 
 class SimulationMetrics:
     """Class that encapsulates a set of metrics collected during the simulation execution."""
+
+    # ✅ OTIMIZAÇÃO: Atributos fixos (sem __dict__ por instância)
+    __slots__ = (
+        "total_delay_sla_violations",
+        "sla_violations",
+        "delay_violations_per_delay_sla",
+        "delay_violations_per_access_pattern",
+        "delay_violations_per_application",
+        "total_perceived_downtime",
+        "downtime_reasons",
+        "_step_scalars",
+        "occupation_samples_per_model",
+        "total_power_per_model",
+        "active_servers_per_model",
+        "simulation_steps",
+        "total_servers_per_model",
+        "available_occupation_samples_per_model",
+        "_service_metadata_cache",
+        "_consolidated_metrics_cache",
+        "_dirty",
+    )
     
     def __init__(self):
         self.reset_all()
@@ -28,25 +152,32 @@ class SimulationMetrics:
         # SLA metrics
         self.total_delay_sla_violations = 0 
         self.sla_violations = 0
-        self.delay_violations_per_delay_sla = {}
-        self.delay_violations_per_access_pattern = {}
-        self.delay_violations_per_application = {}
+        # ✅ OTIMIZAÇÃO: Contadores (Counter/defaultdict) dispensam a verificação "if key not in d" a cada atualização
+        self.delay_violations_per_delay_sla = Counter()
+        self.delay_violations_per_access_pattern = Counter()
+        self.delay_violations_per_application = Counter()
         self.total_perceived_downtime = 0
 
         # Downtime Reasons Metrics (NOVO)
-        self.downtime_reasons = {}
+        self.downtime_reasons = Counter()
 
         # Infraestructure usage metrics
-        self.total_overloaded_servers = 0
-        self.total_occupation_steps = 0.0
-        self.occupation_samples_per_model = {}
-        self.total_power_consumption = 0.0
-        self.power_samples_per_model = {}
-        self.active_servers_per_model = {}
+        # ✅ OTIMIZAÇÃO: Escalares de cada step (ocupação geral, ocupação disponível, consumo de energia e
+        # servidores sobrecarregados) são apenas armazenados; as somas são feitas de uma vez na consolidação
+        self._step_scalars = []
+        self.occupation_samples_per_model = defaultdict(list)
+        self.total_power_per_model = defaultdict(float)
+        self.active_servers_per_model = defaultdict(set)
         self.simulation_steps = 0
         self.total_servers_per_model = {}
-        self.available_occupation_steps = 0.0
-        self.available_occupation_samples_per_model = {}
+        self.available_occupation_samples_per_model = defaultdict(list)
+
+        # Metadados estáticos (usuário, SLAs e padrão de acesso) de cada serviço acessado por um usuário
+        self._service_metadata_cache = None
+
+        # Resultado de get_consolidated_metrics() (recalculado apenas após novas métricas serem adicionadas)
+        self._consolidated_metrics_cache = None
+        self._dirty = True
 
     def add_sla_violations(self, user_violations):
         """Adds SLA violations collected in the current step to the overall SLA violations.
@@ -54,30 +185,46 @@ class SimulationMetrics:
         Args:
             user_violations (dict): Dictionary that contains the SLA violations collected in the current step.
         """
+        self._dirty = True
+
         # Acumular violações totais
-        self.sla_violations += user_violations['delay_sla_violations']
-        self.total_delay_sla_violations += user_violations['delay_sla_violations']  # ✅ ADICIONAR
+        delay_sla_violations = user_violations['delay_sla_violations']
+        self.sla_violations += delay_sla_violations
+        self.total_delay_sla_violations += delay_sla_violations  # ✅ ADICIONAR
         
+        # ✅ OTIMIZAÇÃO: Counter.update soma as contagens do step diretamente (sem laço Python por chave)
         # Acumular violações por delay SLA
-        for delay_sla, violations in user_violations['delay_violations_per_delay_sla'].items():
-            self.delay_violations_per_delay_sla[delay_sla] = (
-                self.delay_violations_per_delay_sla.get(delay_sla, 0) + violations
-            )
+        self.delay_violations_per_delay_sla.update(user_violations['delay_violations_per_delay_sla'])
         
         # Acumular violações por padrão de acesso
-        for duration, violations in user_violations['delay_violations_per_access_pattern'].items():
-            self.delay_violations_per_access_pattern[duration] = (
-                self.delay_violations_per_access_pattern.get(duration, 0) + violations
-            )
+        self.delay_violations_per_access_pattern.update(user_violations['delay_violations_per_access_pattern'])
     
     def add_downtime_reason(self, reason):
         """Incrementa o contador para um motivo específico de downtime."""
-        if reason not in self.downtime_reasons:
-            self.downtime_reasons[reason] = 0
+        self._dirty = True
         self.downtime_reasons[reason] += 1
 
+    def add_delay_violation(self, app_id, delay_sla, access_pattern_duration):
+        """Contabiliza uma violação de SLA de delay por aplicação, por SLA e por padrão de acesso."""
+        self._dirty = True
+        self.delay_violations_per_application[app_id] += 1
+        self.delay_violations_per_delay_sla[delay_sla] += 1
+        self.delay_violations_per_access_pattern[access_pattern_duration] += 1
+
+    def add_delay_sla_violations(self, violations):
+        """Acumula as violações de SLA de delay contabilizadas de forma centralizada no step."""
+        self._dirty = True
+        self.total_delay_sla_violations += violations
+
+    def add_perceived_downtime(self, downtime):
+        """Acumula os steps de downtime percebido pelos usuários no step."""
+        self._dirty = True
+        self.total_perceived_downtime += downtime
+
     def add_infrastructure_metrics(self, step_metrics):
         """Adiciona métricas de infraestrutura de um step às métricas globais."""
+        self._dirty = True
+
         # Incrementar contador de steps
         self.simulation_steps += 1
 
@@ -85,89 +232,142 @@ class SimulationMetrics:
         if not self.total_servers_per_model:
             self.total_servers_per_model = step_metrics['total_servers_per_model'].copy()
         
-        # Acumular servidores sobrecarregados
-        self.total_overloaded_servers += step_metrics['overloaded_edge_servers']
-        
-        # Acumular ocupação geral
-        self.total_occupation_steps += step_metrics['overall_occupation']
-
-        # Acumular ocupação disponível
-        self.available_occupation_steps += step_metrics['available_overall_occupation']
-
-        # Acumular consumo de energia total
-        self.total_power_consumption += step_metrics['overall_power_consumption']
+        # Armazenar ocupação geral, ocupação disponível, consumo de energia total e servidores sobrecarregados
+        self._step_scalars.append((
+            step_metrics['overall_occupation'],
+            step_metrics['available_overall_occupation'],
+            step_metrics['overall_power_consumption'],
+            step_metrics['overloaded_edge_servers'],
+        ))
         
+        # ✅ OTIMIZAÇÃO: Acumuladores ligados a variáveis locais (uma busca de atributo por chamada, não por item)
         # Acumular ocupação por modelo
+        occupation_samples_per_model = self.occupation_samples_per_model
         for model_name, occupation in step_metrics['occupation_per_model'].items():
-            if model_name not in self.occupation_samples_per_model:
-                self.occupation_samples_per_model[model_name] = []
-            self.occupation_samples_per_model[model_name].append(occupation)
+            occupation_samples_per_model[model_name].append(occupation)
 
         #Acumular ocupação por modelo (apenas servidores disponíveis)
+        available_occupation_samples_per_model = self.available_occupation_samples_per_model
         for model_name, occupation in step_metrics['available_occupation_per_model'].items():
-            if model_name not in self.available_occupation_samples_per_model:
-                self.available_occupation_samples_per_model[model_name] = []
-            self.available_occupation_samples_per_model[model_name].append(occupation)
+            available_occupation_samples_per_model[model_name].append(occupation)
         
         # Acumular consumo por modelo
-        for model_name, power_list in step_metrics['power_consumption_per_server_model'].items():
-            if model_name not in self.power_samples_per_model:
-                self.power_samples_per_model[model_name] = []
-            self.power_samples_per_model[model_name].extend(power_list)
+        total_power_per_model = self.total_power_per_model
+        for model_name, power_consumption in step_metrics['power_consumption_per_server_model'].items():
+            total_power_per_model[model_name] += power_consumption
         
         # Acumular servidores ativos por modelo
-        for model_name, active_count in step_metrics['active_servers_per_model'].items():
-            if model_name not in self.active_servers_per_model:
-                self.active_servers_per_model[model_name] = set()
-            
+        # ✅ OTIMIZAÇÃO: Apenas os servidores do próprio modelo são verificados (O(servidores do modelo), não O(modelos × servidores))
+        servers_by_model = get_edge_server_arrays()["servers_by_model"]
+        for model_name in step_metrics['active_servers_per_model']:
             # Adicionar os IDs dos servidores ativos deste step
-            for edge_server in EdgeServer.all():
-                if (edge_server.model_name == model_name and 
-                    edge_server.status == "available" and
+            active_servers = self.active_servers_per_model[model_name]
+            for edge_server in servers_by_model.get(model_name, ()):
+                if (edge_server.status == "available" and
                     (edge_server.cpu_demand > 0 or edge_server.memory_demand > 0 or edge_server.disk_demand > 0)):
-                    self.active_servers_per_model[model_name].add(edge_server.id)
+                    active_servers.add(edge_server.id)
     
+    def build_service_metadata(self):
+        """Builds (once) the mapping service_id -> user, SLAs and access pattern of the application that owns the service.
+
+        Users, applications and SLAs are fixed once the scenario is created, so the mapping is cached
+        and reused by every get_consolidated_metrics() call.
+
+        Returns:
+            service_metadata (dict): Metadata of each service accessed by a user.
+        """
+        if self._service_metadata_cache is None:
+            service_metadata = {}
+            for user in User.all():
+                for app in user.applications:
+                    app_id = _app_id_str(app)
+                    service = app.services[0]
+
+                    access_pattern = user.access_patterns[app_id]
+                    service_metadata[service.id] = {
+                        'app_id': app_id,
+                        'user': user,
+                        'access_pattern': access_pattern,
+                        'access_pattern_duration': access_pattern.duration_values[0] if access_pattern.duration_values else 0,
+                        'delay_sla': user.delay_slas[app_id],
+                        'downtime_sla': user.maximum_downtime_allowed.get(app_id, float('inf')),
+                    }
+
+            # Mesma ordem de Service.all() (serviços sem usuário associado são ignorados), para que os
+            # dicionários/listas das métricas consolidadas mantenham a ordem de inserção determinística
+            self._service_metadata_cache = {
+                service.id: service_metadata[service.id] for service in Service.all() if service.id in service_metadata
+            }
+
+        return self._service_metadata_cache
+
     def get_consolidated_metrics(self):
-        """Retorna as métricas consolidadas da simulação."""
+        """Retorna as métricas consolidadas da simulação.
+
+        ✅ OTIMIZAÇÃO: O resultado é reaproveitado entre chamadas até que um método add_* registre novas métricas.
+        """
+        if self._dirty or self._consolidated_metrics_cache is None:
+            self._consolidated_metrics_cache = self._compute_consolidated_metrics()
+            self._dirty = False
+
+        # Cópia rasa: chamadores podem alterar o dicionário retornado sem afetar o cache
+        return dict(self._consolidated_metrics_cache)
+
+    def _compute_consolidated_metrics(self):
+        """Calcula as métricas consolidadas da simulação."""
         # Calcular médias e totais
+        # ✅ OTIMIZAÇÃO: Uma única redução NumPy sobre os escalares de todos os steps
+        total_occupation_steps, _, total_power_consumption, total_overloaded_servers = (
+            np.asarray(self._step_scalars, dtype=float).reshape(-1, 4).sum(axis=0)
+        )
         avg_overall_occupation = (
-            self.total_occupation_steps / self.simulation_steps 
+            float(total_occupation_steps) / self.simulation_steps 
             if self.simulation_steps > 0 else 0
         )
       
-        # Calcular ocupação média por modelo
-        avg_occupation_per_model = {}
-        for model_name, samples in self.occupation_samples_per_model.items():
-            avg_occupation_per_model[model_name] = sum(samples) / len(samples) if samples else 0
-        
         # Calcular consumo de energia total por modelo
-        total_power_per_model = {}
-        for model_name, samples in self.power_samples_per_model.items():
-            total_power_per_model[model_name] = sum(samples)
+        total_power_per_model = dict(self.total_power_per_model)
 
-        #Calcular ocupação média por modelo (apenas servidores disponíveis)
+        # ✅ OTIMIZAÇÃO: Um único laço por modelo calcula a ocupação média (geral e apenas de servidores
+        # disponíveis), a média ponderada pelo número de servidores e a contagem de servidores ativos
+        occupation_samples_per_model = self.occupation_samples_per_model
+        available_occupation_samples_per_model = self.available_occupation_samples_per_model
+        active_servers_per_model = self.active_servers_per_model
+        total_servers_per_model = self.total_servers_per_model
+
+        avg_occupation_per_model = {}
         avg_available_occupation_per_model = {}
-        for model_name, samples in self.available_occupation_samples_per_model.items():
-            avg_available_occupation_per_model[model_name] = sum(samples) / len(samples) if samples else 0
-        
-        # Calcular média ponderada usando os valores por modelo e número de servidores
+        active_servers_count_per_model = {}
         total_weighted_available = 0
         total_servers = 0
-        
-        for model_name, avg_occupation in avg_available_occupation_per_model.items():
-            num_servers = self.total_servers_per_model.get(model_name, 0)
-            total_weighted_available += avg_occupation * num_servers
-            total_servers += num_servers
-        
+
+        # Modelos na ordem de inserção (ocupação geral primeiro), sem duplicatas
+        all_models = {**occupation_samples_per_model, **available_occupation_samples_per_model, **active_servers_per_model}
+        for model_name in all_models:
+            # Ocupação média por modelo
+            samples = occupation_samples_per_model.get(model_name)
+            if samples is not None:
+                avg_occupation_per_model[model_name] = sum(samples) / len(samples) if samples else 0
+
+            # Ocupação média por modelo (apenas servidores disponíveis) e média ponderada pelo número de servidores
+            samples = available_occupation_samples_per_model.get(model_name)
+            if samples is not None:
+                avg_occupation = sum(samples) / len(samples) if samples else 0
+                avg_available_occupation_per_model[model_name] = avg_occupation
+
+                num_servers = total_servers_per_model.get(model_name, 0)
+                total_weighted_available += avg_occupation * num_servers
+                total_servers += num_servers
+
+            # Converter sets de servidores ativos para contagens
+            server_set = active_servers_per_model.get(model_name)
+            if server_set is not None:
+                active_servers_count_per_model[model_name] = len(server_set)
+
         avg_available_overall_occupation = (
             total_weighted_available / total_servers 
             if total_servers > 0 else 0
         )
-        
-        # Converter sets de servidores ativos para contagens
-        active_servers_count_per_model = {}
-        for model_name, server_set in self.active_servers_per_model.items():
-            active_servers_count_per_model[model_name] = len(server_set)
 
         # ═══════════════════════════════════════════════════════════════
         # ✅ CORREÇÃO: USAR downtime_reasons COMO FONTE DE VERDADE
@@ -178,108 +378,68 @@ class SimulationMetrics:
         # ═══════════════════════════════════════════════════════════════
         # ✅ CORREÇÃO: CALCULAR VIOLAÇÕES DE SLA DE DOWNTIME POR SESSÃO
         # ═══════════════════════════════════════════════════════════════
-        total_perceived_downtime_per_access_pattern = {}
-        total_perceived_downtime_per_delay_sla = {}
+        total_perceived_downtime_per_access_pattern = defaultdict(int)
+        total_perceived_downtime_per_delay_sla = defaultdict(int)
         total_violations_sla_downtime = 0
-        apps_violations_sla_downtime = []
-        total_violations_per_access_pattern = {}
-        total_violations_per_delay_sla = {}
+        apps_violations_sla_downtime = {}  # Usado como conjunto ordenado (membership O(1), ordem de inserção preservada)
+        total_violations_per_access_pattern = defaultdict(int)
+        total_violations_per_delay_sla = defaultdict(int)
 
         # ✅ NOVO: Mapear downtime_reasons para access_pattern e delay_sla
-        # Como downtime_reasons não tem app_id, precisamos extrair de Service.all()
-        
-        # Primeiro, criar mapeamento service_id -> (app_id, access_pattern, delay_sla)
-        service_metadata = {}
-        for user in User.all():
-            for app in user.applications:
-                app_id = str(app.id)
-                service = app.services[0]
-                
-                access_pattern = user.access_patterns[app_id]
-                duration = access_pattern.duration_values[0] if access_pattern.duration_values else 0
-                delay_sla = user.delay_slas[app_id]
-                downtime_sla = user.maximum_downtime_allowed.get(app_id, float('inf'))
-                
-                service_metadata[service.id] = {
-                    'app_id': app_id,
-                    'user': user,
-                    'access_pattern_duration': duration,
-                    'delay_sla': delay_sla,
-                    'downtime_sla': downtime_sla,
-                    'access_history': access_pattern.history
-                }
-        
-        # ✅ Processar downtime_reasons e acumular por access_pattern/delay_sla
-        # IMPORTANTE: downtime_reasons tem formato "categoria_detalhada"
-        # Mas NÃO tem service_id diretamente. Precisamos de outra abordagem.
-        
-        # ✅ ALTERNATIVA: Iterar sobre SERVIÇOS e suas migrações/provisionamentos
-        for service in Service.all():
-            if service.id not in service_metadata:
-                continue  # Serviço sem usuário associado
-            
-            meta = service_metadata[service.id]
+        # Como downtime_reasons não tem app_id, usamos o mapeamento service_id -> (app_id, access_pattern, delay_sla)
+        # ✅ OTIMIZAÇÃO: Mapeamento construído uma única vez (cenário estático) e percorrido diretamente
+        # ✅ OTIMIZAÇÃO: Sem nenhum downtime registrado, nenhum usuário tem downtime percebido (ambos são
+        # contabilizados juntos) e a análise por sessão é pulada, inclusive a construção do mapeamento
+        service_metadata = self.build_service_metadata() if self.downtime_reasons else {}
+        for meta in service_metadata.values():
             app_id = meta['app_id']
             user = meta['user']
             duration = meta['access_pattern_duration']
             delay_sla = meta['delay_sla']
             downtime_sla = meta['downtime_sla']
-            access_history = meta['access_history']
+            access_pattern = meta['access_pattern']
             
             # Obter histórico de downtime percebido (se existir)
-            if hasattr(user, '_perceived_downtime') and app_id in user._perceived_downtime:
-                total_downtime_for_app = user._perceived_downtime[app_id]
+            perceived_downtime = getattr(user, '_perceived_downtime', None)
+            if perceived_downtime is not None and app_id in perceived_downtime:
+                total_downtime_for_app = perceived_downtime[app_id]
+                
+                # Histórico por step do downtime percebido (consultado uma vez por aplicação, não por sessão)
+                downtime_history = getattr(user, 'user_perceived_downtime_history', {}).get(app_id)
+                
+                # ✅ OTIMIZAÇÃO: Soma acumulada do histórico (uma vez por aplicação): o downtime de
+                # cada sessão passa a ser a diferença de dois prefixos, sem percorrer os steps da sessão
+                # (sem histórico por step, o downtime de todas as sessões é zero)
+                if downtime_history is not None:
+                    downtime_prefix = np.concatenate(([0], np.cumsum(np.frombuffer(downtime_history, dtype=np.uint8), dtype=np.int64)))
+                else:
+                    downtime_prefix = np.zeros(1, dtype=np.int64)
                 
                 # Acumular por access_pattern e delay_sla
-                if duration not in total_perceived_downtime_per_access_pattern:
-                    total_perceived_downtime_per_access_pattern[duration] = 0
                 total_perceived_downtime_per_access_pattern[duration] += total_downtime_for_app
-                
-                if delay_sla not in total_perceived_downtime_per_delay_sla:
-                    total_perceived_downtime_per_delay_sla[delay_sla] = 0
                 total_perceived_downtime_per_delay_sla[delay_sla] += total_downtime_for_app
                 
                 # ✅ Analisar SESSÕES INDIVIDUAIS para violações de SLA
-                for session in access_history:
-                    session_start = session.get('start')
-                    session_end = session.get('end')
-                    
-                    if session_start is None or session_end is None:
-                        continue
-                    
-                    # Calcular downtime NESTA SESSÃO específica
-                    # PROBLEMA: _perceived_downtime[app_id] é um CONTADOR TOTAL, não histórico por step
-                    # Solução: Se houver user_perceived_downtime_history, usar ele
-                    session_downtime = 0
+                # ✅ OTIMIZAÇÃO: Início/fim das sessões mantidos como arrays (SoA) no próprio padrão de acesso,
+                # sincronizados apenas com as sessões novas desde a última consolidação
+                session_starts, session_ends = get_access_session_arrays(access_pattern)
+                
+                # ✅ OTIMIZAÇÃO: Downtime de todas as sessões calculado de uma vez pelo kernel vetorizado
+                _, violated_sessions = _session_downtime_kernel(
+                    session_starts, session_ends, downtime_prefix, downtime_sla
+                )
+                session_violations = int(np.count_nonzero(violated_sessions))
+                
+                # ✅ VERIFICAR SE ALGUMA SESSÃO VIOLOU O SLA DE DOWNTIME
+                if session_violations > 0:
+                    total_violations_sla_downtime += session_violations
                     
-                    if (hasattr(user, 'user_perceived_downtime_history') and 
-                        app_id in user.user_perceived_downtime_history):
-                        downtime_history = user.user_perceived_downtime_history[app_id]
-                        
-                        # Contar downtime durante esta sessão
-                        for step in range(session_start, session_end + 1):
-                            step_index = step - 1  # Histórico começa em índice 0
-                            if step_index < len(downtime_history):
-                                if downtime_history[step_index]:  # True = downtime
-                                    session_downtime += 1
+                    # Adicionar app à lista de violadores (sem duplicar)
+                    apps_violations_sla_downtime[app_id] = None
                     
-                    # ✅ VERIFICAR SE ESTA SESSÃO VIOLOU O SLA DE DOWNTIME
-                    if session_downtime > downtime_sla:
-                        total_violations_sla_downtime += 1
-                        
-                        # Adicionar app à lista de violadores (sem duplicar)
-                        if app_id not in apps_violations_sla_downtime:
-                            apps_violations_sla_downtime.append(app_id)
-                        
-                        # Contabilizar por access pattern
-                        if duration not in total_violations_per_access_pattern:
-                            total_violations_per_access_pattern[duration] = 0
-                        total_violations_per_access_pattern[duration] += 1
-                        
-                        # Contabilizar por delay SLA
-                        if delay_sla not in total_violations_per_delay_sla:
-                            total_violations_per_delay_sla[delay_sla] = 0
-                        total_violations_per_delay_sla[delay_sla] += 1
+                    # Contabilizar por access pattern e por delay SLA
+                    total_violations_per_access_pattern[duration] += session_violations
+                    total_violations_per_delay_sla[delay_sla] += session_violations
 
         return {
             "total_simulation_steps": self.simulation_steps,
@@ -291,18 +451,18 @@ class SimulationMetrics:
             "total_perceived_downtime_per_access_pattern": dict(total_perceived_downtime_per_access_pattern),
             "total_perceived_downtime_per_delay_sla": dict(total_perceived_downtime_per_delay_sla),
             "total_downtime_sla_violations": total_violations_sla_downtime,
-            "apps_violations_sla_downtime": apps_violations_sla_downtime,   
+            "apps_violations_sla_downtime": list(apps_violations_sla_downtime),   
             "downtime_violations_per_access_pattern": dict(total_violations_per_access_pattern),
             "downtime_violations_per_delay_sla": dict(total_violations_per_delay_sla),
 
             "=========== Infrastructure metrics ===========": None,
             "total_servers_per_model": dict(self.total_servers_per_model),
-            "total_overloaded_servers": self.total_overloaded_servers,
+            "total_overloaded_servers": int(total_overloaded_servers),
             "average_overall_occupation": avg_overall_occupation,
             "average_occupation_per_model": avg_occupation_per_model,
             "average_available_overall_occupation": avg_available_overall_occupation,
             "average_available_occupation_per_model": avg_available_occupation_per_model,
-            "total_power_consumption": self.total_power_consumption,
+            "total_power_consumption": float(total_power_consumption),
             "total_power_consumption_per_model": total_power_per_model,
 
             "=========== Downtime Analysis ===========": None,
@@ -312,17 +472,22 @@ class SimulationMetrics:
 
 _simulation_metrics = SimulationMetrics()
 _predict_failures_log_guard = set()
+# ✅ OTIMIZAÇÃO: Chaves do guard em ordem de inserção (steps crescentes); a limpeza remove
+# apenas as chaves expiradas do início da fila (O(1) amortizado), sem reconstruir o conjunto
+_predict_failures_log_guard_queue = deque()
+
+
+def _remember_predict_failures_log(log_key):
+    """Registra uma chave (step, server_id, horizon) no guard de logs de previsões."""
+    _predict_failures_log_guard.add(log_key)
+    _predict_failures_log_guard_queue.append(log_key)
 
-def _cleanup_predict_failures_log_guard(current_step):
-    """Limpa guard de logs de previsões antigas."""
-    global _predict_failures_log_guard
-    
-    if current_step % 100 == 0:
-        cutoff = current_step - 100
-        _predict_failures_log_guard = {k for k in _predict_failures_log_guard if k[0] >= cutoff}
-        
-        # ✅ Log opcional (comentar em produção)
-        # print(f"[CLEANUP] Guard de predict_failures limpo (mantendo últimos 100 steps)")
+
+def _cleanup_predict_failures_log_guard(current_step, window=100):
+    """Limpa guard de logs de previsões antigas (mantendo apenas os últimos `window` steps)."""
+    cutoff = current_step - window
+    while _predict_failures_log_guard_queue and _predict_failures_log_guard_queue[0][0] < cutoff:
+        _predict_failures_log_guard.discard(_predict_failures_log_guard_queue.popleft())
 
 
 def get_simulation_metrics():
@@ -348,20 +513,26 @@ def display_topology(topology: object, output_filename: str = "topology"):
     colors = []
     sizes = []
 
+    # ✅ OTIMIZAÇÃO: Coordenadas dos usuários calculadas uma vez (teste de pertinência O(1) por nó)
+    user_coordinates = {tuple(user.coordinates) for user in User.all()}
+
     for node in topology.nodes():
         positions[node] = node.coordinates
         labels[node] = node.id
-        node_size = 500 if any(user.coordinates == node.coordinates for user in User.all()) else 100
+        node_size = 500 if tuple(node.coordinates) in user_coordinates else 100
         sizes.append(node_size)
 
-        if len(node.base_station.edge_servers) and sum(len(s.container_registries) for s in node.base_station.edge_servers) == 0:
-            node_server = node.base_station.edge_servers[0]
+        edge_servers = node.base_station.edge_servers
+        container_registries = sum(len(s.container_registries) for s in edge_servers) if edge_servers else 0
+
+        if edge_servers and container_registries == 0:
+            node_server = edge_servers[0]
             if node_server.model_name == "PowerEdge R620":
                 colors.append("green")
             elif node_server.model_name == "SGI":
                 colors.append("red")
 
-        elif len(node.base_station.edge_servers) and sum(len(s.container_registries) for s in node.base_station.edge_servers) > 0:
+        elif edge_servers and container_registries > 0:
             colors.append("blue")
         else:
             colors.append("black")
@@ -397,24 +568,21 @@ def uniform(n_items: int, valid_values: list, shuffle_distribution: bool = True)
     Returns:
         uniform_distribution (list): List of values arranged according to the uniform distribution.
     """
-    if not isinstance(valid_values, list) or isinstance(valid_values, list) and len(valid_values) == 0:
+    if not isinstance(valid_values, list) or len(valid_values) == 0:
         raise Exception("You must inform a list of valid values within the 'valid_values' attribute.")
 
     # Number of occurrences that will be created of each item in the "valid_values" list
-    distribution = [int(n_items / len(valid_values)) for _ in range(0, len(valid_values))]
+    occurrences = int(n_items / len(valid_values))
 
     # List with size "n_items" that will be populated with "valid_values" according to the uniform distribution
+    # ✅ OTIMIZAÇÃO: Repetição por multiplicação de listas (em C), em vez de um append por item
     uniform_distribution = []
-
-    for i, value in enumerate(valid_values):
-        for _ in range(0, int(distribution[i])):
-            uniform_distribution.append(value)
+    for value in valid_values:
+        uniform_distribution.extend([value] * occurrences)
 
     # Computing leftover randomly to avoid disturbing the distribution
     leftover = n_items % len(valid_values)
-    for i in range(leftover):
-        random_valid_value = choice(valid_values)
-        uniform_distribution.append(random_valid_value)
+    uniform_distribution.extend([choice(valid_values) for _ in range(leftover)])
 
     # Shuffling distribution values in case 'shuffle_distribution' parameter is True
     if shuffle_distribution:
@@ -439,6 +607,23 @@ def min_max_norm(x, minimum, maximum):
     return (x - minimum) / (maximum - minimum)
 
 
+def min_max_norm_array(x, minimum, maximum) -> np.ndarray:
+    """Vectorized version of min_max_norm() for a batch of values.
+
+    Args:
+        x (array-like): Values that must be normalized.
+        minimum (float): Minimum value known.
+        maximum (float): Maximum value known.
+
+    Returns:
+        (np.ndarray): Normalized values.
+    """
+    x = np.asarray(x, dtype=float)
+    if minimum == maximum:
+        return np.ones_like(x)
+    return (x - minimum) / (maximum - minimum)
+
+
 def find_minimum_and_maximum(metadata: list):
     """Finds the minimum and maximum values of a list of dictionaries.
 
@@ -453,9 +638,31 @@ def find_minimum_and_maximum(metadata: list):
         "maximum": {},
     }
 
+    if not metadata:
+        return min_and_max
+
+    # ✅ OTIMIZAÇÃO: Atributos numéricos (presentes em todos os registros) reduzidos por coluna com NumPy
+    numeric_attrs = [
+        attr_name
+        for attr_name, attr_value in metadata[0].items()
+        if attr_name != "object" and isinstance(attr_value, (int, float, np.number)) and not isinstance(attr_value, bool)
+    ]
+    try:
+        matrix = np.array([[metadata_item[attr_name] for attr_name in numeric_attrs] for metadata_item in metadata], dtype=float)
+    except (KeyError, TypeError, ValueError):
+        # Registros heterogêneos: todos os atributos seguem pelo caminho genérico abaixo
+        numeric_attrs = []
+    else:
+        if numeric_attrs:
+            min_and_max["minimum"].update(zip(numeric_attrs, matrix.min(axis=0).tolist()))
+            min_and_max["maximum"].update(zip(numeric_attrs, matrix.max(axis=0).tolist()))
+
+    # Demais atributos (não numéricos ou ausentes em algum registro)
+    skipped_attrs = set(numeric_attrs)
+    skipped_attrs.add("object")
     for metadata_item in metadata:
         for attr_name, attr_value in metadata_item.items():
-            if attr_name != "object" and type(attr_value) != list:
+            if attr_name not in skipped_attrs and type(attr_value) != list:
                 # Updating the attribute's minimum value
                 if attr_name not in min_and_max["minimum"] or attr_name in min_and_max["minimum"] and attr_value < min_and_max["minimum"][attr_name]:
                     min_and_max["minimum"][attr_name] = attr_value
@@ -483,6 +690,22 @@ def get_norm(metadata: dict, attr_name: str, min: dict, max: dict) -> float:
     return normalized_value
 
 
+def get_norm_array(metadata: list, attr_name: str, min: dict, max: dict) -> np.ndarray:
+    """Vectorized version of get_norm() that normalizes an attribute of a whole list of metadata dictionaries.
+
+    Args:
+        metadata (list): List of dictionaries that contains the metadata of the objects whose values are being normalized.
+        attr_name (str): Name of the attribute that must be normalized.
+        min (dict): Dictionary that contains the minimum values of the attributes.
+        max (dict): Dictionary that contains the maximum values of the attributes.
+
+    Returns:
+        (np.ndarray): Normalized values, in the same order as "metadata".
+    """
+    values = np.fromiter((metadata_item[attr_name] for metadata_item in metadata), dtype=float, count=len(metadata))
+    return min_max_norm_array(x=values, minimum=min[attr_name], maximum=max[attr_name])
+
+
 def normalize_cpu_and_memory(cpu, memory) -> float:
     """Normalizes the CPU and memory values.
 
@@ -559,17 +782,22 @@ def get_shortest_path(origin_switch: object, target_switch: object) -> list:
     if not hasattr(topology, "shortest_paths"):
         topology.shortest_paths = {}
 
-    if frozenset([origin_switch.id, target_switch.id]) in topology.shortest_paths:
-        return topology.shortest_paths[frozenset([origin_switch.id, target_switch.id])]
-    else:
+    # ✅ OTIMIZAÇÃO: Chave simétrica empacotada em um único inteiro (menor ID nos 32 bits altos),
+    # sem alocar tuplas/frozensets (IDs de switches são inteiros pequenos)
+    origin_id, target_id = origin_switch.id, target_switch.id
+    key = (origin_id << 32) | target_id if origin_id < target_id else (target_id << 32) | origin_id
+
+    shortest_path = topology.shortest_paths.get(key)
+    if shortest_path is None:
         shortest_path = nx.shortest_path(
             G=topology,
             source=origin_switch,
             target=target_switch,
             weight="delay",
         )
-        topology.shortest_paths[frozenset([origin_switch.id, target_switch.id])] = shortest_path
-        return topology.shortest_paths[frozenset([origin_switch.id, target_switch.id])]
+        topology.shortest_paths[key] = shortest_path
+
+    return shortest_path
 
 
 def get_delay(wireless_delay: int, origin_switch: object, target_switch: object) -> int:
@@ -585,41 +813,217 @@ def get_delay(wireless_delay: int, origin_switch: object, target_switch: object)
     """
     topology = origin_switch.model.topology
 
-    path = nx.shortest_path(
-        G=topology,
-        source=origin_switch,
-        target=target_switch,
-        weight="delay",
-    )
-    delay = wireless_delay + topology.calculate_path_delay(path=path)
+    # ✅ OTIMIZAÇÃO: Delay do caminho mínimo consultado na matriz all-pairs (calculada uma vez por topologia)
+    switch_index, delay_matrix = get_delay_matrix(topology)
+    delay = wireless_delay + delay_matrix[switch_index[origin_switch.id], switch_index[target_switch.id]]
 
     return delay
 
 
+def get_delay_matrix(topology: object) -> tuple:
+    """Gets the all-pairs delay matrix of the network topology (built once, as the topology is static during the simulation).
+
+    Args:
+        topology (object): Network topology.
+
+    Returns:
+        switch_index (dict): Mapping between network switch IDs and matrix rows/columns.
+        delay_matrix (np.ndarray): Matrix with the shortest-path delay between each pair of network switches.
+    """
+    if getattr(topology, "_delay_matrix", None) is None:
+        switches = list(topology.nodes())
+        switch_index = {switch.id: index for index, switch in enumerate(switches)}
+
+        # Pares sem caminho permanecem com delay infinito
+        delay_matrix = np.full((len(switches), len(switches)), np.inf)
+        for source, lengths in nx.all_pairs_dijkstra_path_length(topology, weight="delay"):
+            row = switch_index[source.id]
+            for target, length in lengths.items():
+                delay_matrix[row, switch_index[target.id]] = length
+
+        topology._switch_index = switch_index
+        topology._delay_matrix = delay_matrix
+
+    return topology._switch_index, topology._delay_matrix
+
+
+# ✅ SoA (Structure of Arrays) com os atributos estáticos dos servidores de borda
+_EDGE_SERVER_ARRAYS = {}
+
+
+def get_edge_server_arrays() -> dict:
+    """Gets a Structure-of-Arrays view of the static edge server attributes (capacity, network switch and power).
+
+    Returns:
+        arrays (dict): NumPy arrays indexed in the same order as the "servers" list.
+    """
+    global _EDGE_SERVER_ARRAYS
+
+    # Reconstruir apenas quando o conjunto de servidores muda (ex.: novo dataset)
+    servers = EdgeServer.all()
+    cached_servers = _EDGE_SERVER_ARRAYS.get("servers")
+    if _EDGE_SERVER_ARRAYS.get("count") != len(servers) or (servers and cached_servers[0] is not servers[0]):
+        topology = servers[0].model.topology if servers else None
+        switch_index = get_delay_matrix(topology)[0] if topology is not None else {}
+
+        _EDGE_SERVER_ARRAYS = {
+            "count": len(servers),
+            "servers": list(servers),
+            "cpu": np.array([s.cpu for s in servers], dtype=float),
+            "memory": np.array([s.memory for s in servers], dtype=float),
+            "disk": np.array([s.disk for s in servers], dtype=float),
+            "max_power": np.array([s.power_model_parameters["max_power_consumption"] for s in servers], dtype=float),
+            "switch_idx": np.array([switch_index[s.network_switch.id] for s in servers], dtype=np.int32),
+        }
+
+        # Índice do modelo de cada servidor (modelos na ordem da primeira ocorrência), usado com np.bincount
+        model_index = {}
+        _EDGE_SERVER_ARRAYS["model_idx"] = np.array(
+            [model_index.setdefault(s.model_name, len(model_index)) for s in servers], dtype=np.int32
+        )
+        _EDGE_SERVER_ARRAYS["model_names"] = list(model_index)
+
+        # Servidores agrupados por modelo (evita varrer todos os servidores ao filtrar por modelo)
+        servers_by_model = {model_name: [] for model_name in model_index}
+        for s in servers:
+            servers_by_model[s.model_name].append(s)
+        _EDGE_SERVER_ARRAYS["servers_by_model"] = servers_by_model
+
+        # Capacidades normalizadas são estáticas: calculadas uma única vez
+        _EDGE_SERVER_ARRAYS["capacity_norm"] = normalize_cpu_and_memory(
+            cpu=_EDGE_SERVER_ARRAYS["cpu"], memory=_EDGE_SERVER_ARRAYS["memory"]
+        )
+        _EDGE_SERVER_ARRAYS["normalized_capacity"] = np.cbrt(
+            _EDGE_SERVER_ARRAYS["cpu"] * _EDGE_SERVER_ARRAYS["memory"] * _EDGE_SERVER_ARRAYS["disk"]
+        )
+        _EDGE_SERVER_ARRAYS["index_by_id"] = {s.id: index for index, s in enumerate(servers)}
+
+    return _EDGE_SERVER_ARRAYS
+
+
+def get_available_server_mask(arrays: dict) -> np.ndarray:
+    """Gets a boolean mask of the edge servers whose status is "available" (cached until some server changes status).
+
+    Args:
+        arrays (dict): Structure of Arrays returned by get_edge_server_arrays().
+
+    Returns:
+        (np.ndarray): Boolean mask aligned with the "servers" list.
+    """
+    status_version = get_server_status_version()
+
+    if arrays.get("available_mask_version") != status_version:
+        servers = arrays["servers"]
+        arrays["available_mask"] = np.fromiter((s.status == "available" for s in servers), dtype=bool, count=len(servers))
+        arrays["available_mask_version"] = status_version
+
+    return arrays["available_mask"]
+
+
+def get_available_edge_servers() -> list:
+    """Gets the list of edge servers whose status is "available" (cached until some server changes status).
+
+    Returns:
+        (list): Available edge servers, in the same order as EdgeServer.all().
+    """
+    arrays = get_edge_server_arrays()
+    status_version = get_server_status_version()
+
+    if arrays.get("available_servers_version") != status_version:
+        mask = get_available_server_mask(arrays)
+        arrays["available_servers"] = [arrays["servers"][index] for index in np.flatnonzero(mask).tolist()]
+        arrays["available_servers_version"] = status_version
+
+    return arrays["available_servers"]
+
+
+def get_edge_server_demand_arrays(arrays: dict) -> tuple:
+    """Gets the current CPU, memory and disk demand of all edge servers as NumPy arrays.
+
+    Args:
+        arrays (dict): Structure of Arrays returned by get_edge_server_arrays().
+
+    Returns:
+        (tuple): CPU, memory and disk demand arrays aligned with the "servers" list.
+    """
+    servers = arrays["servers"]
+    count = len(servers)
+    cpu_demand = np.fromiter((s.cpu_demand for s in servers), dtype=float, count=count)
+    memory_demand = np.fromiter((s.memory_demand for s in servers), dtype=float, count=count)
+    disk_demand = np.fromiter((s.disk_demand for s in servers), dtype=float, count=count)
+    return cpu_demand, memory_demand, disk_demand
+
+
+def get_normalized_demand_array(arrays: dict) -> np.ndarray:
+    """Vectorized version of get_normalized_demand() for all edge servers.
+
+    Args:
+        arrays (dict): Structure of Arrays returned by get_edge_server_arrays().
+
+    Returns:
+        (np.ndarray): Normalized demand of each edge server.
+    """
+    cpu_demand, memory_demand, disk_demand = get_edge_server_demand_arrays(arrays)
+    return np.cbrt(cpu_demand * memory_demand * disk_demand)
+
+
+def get_normalized_free_capacity_array(arrays: dict) -> np.ndarray:
+    """Vectorized version of get_normalized_free_capacity() for all edge servers.
+
+    Args:
+        arrays (dict): Structure of Arrays returned by get_edge_server_arrays().
+
+    Returns:
+        (np.ndarray): Normalized free capacity of each edge server.
+    """
+    cpu_demand, memory_demand, disk_demand = get_edge_server_demand_arrays(arrays)
+    free_cpu = arrays["cpu"] - cpu_demand
+    free_memory = arrays["memory"] - memory_demand
+    free_disk = arrays["disk"] - disk_demand
+
+    # Retorna 0 se qualquer uma das capacidades livres for zero ou negativa
+    has_free_capacity = (free_cpu > 0) & (free_memory > 0) & (free_disk > 0)
+    return np.where(has_free_capacity, free_cpu * free_memory * free_disk, 0.0) ** (1 / 3)
+
+
 def randomized_closest_fit():
     """Encapsulates a randomized closest-fit service placement algorithm."""
+    # ✅ OTIMIZAÇÃO: Delays user -> servidor consultados na matriz all-pairs, em vez de um Dijkstra por par (serviço, servidor)
+    switch_index, delay_matrix = get_delay_matrix(Topology.first())
+    arrays = get_edge_server_arrays()
+    index_by_id = arrays["index_by_id"]
+
+    # ✅ OTIMIZAÇÃO: Imagens-modelo indexadas por digest (primeira imagem de cada digest, como no next() original)
+    # e digests das imagens presentes em cada host (atualizados à medida que novas imagens são criadas)
+    image_by_digest = {}
+    for container_image in ContainerImage.all():
+        image_by_digest.setdefault(container_image.digest, container_image)
+    host_image_digests = {}
+
+    # Registro de servidores lido uma única vez; a ordem aleatória continua sendo sorteada por serviço
+    # (mesma sequência de sorteios do random, preservando a reprodutibilidade por seed)
+    all_edge_servers = EdgeServer.all()
+    edge_server_count = len(all_edge_servers)
+
     services = sample(Service.all(), Service.count())
     for service in services:
         app = service.application
         user = app.users[0]
         user_switch = user.base_station.network_switch
+        user_delays = delay_matrix[switch_index[user_switch.id]]
+
+        # ✅ OTIMIZAÇÃO: Capacidade livre normalizada de todos os servidores em uma única passada vetorizada
+        free_capacities = arrays["normalized_capacity"] - get_normalized_demand_array(arrays)
 
         edge_servers = []
-        for edge_server in sample(EdgeServer.all(), EdgeServer.count()):
-            path = nx.shortest_path(
-                G=Topology.first(),
-                source=user_switch,
-                target=edge_server.network_switch,
-                weight="delay",
-            )
-            delay = Topology.first().calculate_path_delay(path=path)
+        for edge_server in sample(all_edge_servers, edge_server_count):
+            delay = user_delays[switch_index[edge_server.network_switch.id]]
             edge_servers.append(
                 {
                     "object": edge_server,
-                    "path": path,
                     "delay": delay,
                     "violates_sla": delay > user.delay_slas[str(service.application.id)],
-                    "free_capacity": get_normalized_capacity(object=edge_server) - get_normalized_demand(object=edge_server),
+                    "free_capacity": free_capacities[index_by_id[edge_server.id]],
                 }
             )
 
@@ -655,11 +1059,12 @@ def randomized_closest_fit():
                 break
 
         # Creating an instance of the service image on its host if necessary
-        if not any(hosted_image for hosted_image in service.server.container_images if hosted_image.digest == service.image_digest):
-            template_image = next(
-                (img for img in ContainerImage.all() if img.digest == service.image_digest),
-                None,
-            )
+        hosted_digests = host_image_digests.get(service.server.id)
+        if hosted_digests is None:
+            hosted_digests = host_image_digests[service.server.id] = {image.digest for image in service.server.container_images}
+
+        if service.image_digest not in hosted_digests:
+            template_image = image_by_digest.get(service.image_digest)
 
             # Creating a ContainerImage object to represent the new image
             image = ContainerImage()
@@ -671,14 +1076,19 @@ def randomized_closest_fit():
             # Connecting the new image to the target host
             image.server = service.server
             service.server.container_images.append(image)
+            hosted_digests.add(image.digest)
 
                     
 def show_scenario_overview():
+    # Registry lists resolved once and reused by every section of the overview
+    edge_servers = EdgeServer.all()
+    services = Service.all()
+
     print("\n\n")
     print("======================")
     print("==== EDGE SERVERS ====")
     print("======================")
-    for edge_server in EdgeServer.all():
+    for edge_server in edge_servers:
         edge_server_metadata = {
             "base_station": edge_server.base_station,
             "capacity": [edge_server.cpu, edge_server.memory, edge_server.disk],
@@ -693,15 +1103,15 @@ def show_scenario_overview():
     print("======================")
     print("==== APPLICATIONS ====")
     print("======================")
-    print(f"Number of Applications/Services/Users: {Application.count()}/{Service.count()}/{User.count()}")
+    print(f"Number of Applications/Services/Users: {Application.count()}/{len(services)}/{User.count()}")
     for application in Application.all():
         user = application.users[0]
         service = application.services[0]
-        image = ContainerImage.find_by(attribute_name="digest", attribute_value=service.image_digest)
+        image = _get_image_by_digest(service.image_digest)
         if service.server:
             application_metadata = {
-                "delay_sla": user.delay_slas[str(application.id)],
-                "delay": user.delays[str(application.id)],
+                "delay_sla": user.delay_slas[_app_id_str(application)],
+                "delay": user.delays[_app_id_str(application)],
                 "image": image.name,
                 "state": service.state,
                 "demand": [service.cpu_demand, service.memory_demand],
@@ -710,8 +1120,8 @@ def show_scenario_overview():
         
         else:
             application_metadata = {
-                "delay_sla": user.delay_slas[str(application.id)],
-                "delay": user.delays[str(application.id)],
+                "delay_sla": user.delay_slas[_app_id_str(application)],
+                "delay": user.delays[_app_id_str(application)],
                 "image": image.name,
                 "state": service.state,
                 "demand": [service.cpu_demand, service.memory_demand],
@@ -737,28 +1147,35 @@ def show_scenario_overview():
     #### DATASET ANALYSIS ####
     ##########################
     # Calculating the network delay between users and edge servers (useful for defining reasonable delay SLAs)
+    # ✅ OTIMIZAÇÃO: Delays lidos da matriz de caminhos mínimos entre todos os pares (calculada uma única vez),
+    # em vez de um Dijkstra por par (usuário, servidor)
+    switch_index, delay_matrix = get_delay_matrix(Topology.first())
+    server_columns = [switch_index[edge_server.network_switch.id] for edge_server in edge_servers]
+
     users = []
     for user in User.all():
         user_metadata = {
             "object": user,
-            "sla": user.delay_slas[str(user.applications[0].id)],
+            "sla": user.delay_slas[_app_id_str(user.applications[0])],
             "all_delays": [],
             "hosts_that_meet_the_sla": [],
         }
-        edge_servers = []
-        for edge_server in EdgeServer.all():
-            path = nx.shortest_path(G=Topology.first(), source=user.base_station.network_switch, target=edge_server.network_switch, weight="delay")
-            path_delay = Topology.first().calculate_path_delay(path=path)
-            user_metadata["all_delays"].append(path_delay)
+        user_delays = delay_matrix[switch_index[user.base_station.network_switch.id], server_columns]
+        user_metadata["all_delays"] = user_delays.tolist()
+        for edge_server, path_delay in zip(edge_servers, user_metadata["all_delays"]):
             if user_metadata["sla"] >= path_delay:
                 user_metadata["hosts_that_meet_the_sla"].append(edge_server)
 
-        user_metadata["min_delay"] = min(user_metadata["all_delays"])
-        user_metadata["max_delay"] = max(user_metadata["all_delays"])
-        user_metadata["avg_delay"] = sum(user_metadata["all_delays"]) / len(user_metadata["all_delays"])
-        user_metadata["delays"] = {}
-        for delay in sorted(list(set(user_metadata["all_delays"]))):
-            user_metadata["delays"][delay] = user_metadata["all_delays"].count(delay)
+        # ✅ OTIMIZAÇÃO: Estatísticas e histograma de delays calculados com reduções NumPy
+        # (np.unique ordena e conta em O(k log k), em vez de um list.count por valor distinto)
+        user_metadata["min_delay"] = float(user_delays.min())
+        user_metadata["max_delay"] = float(user_delays.max())
+        user_metadata["avg_delay"] = float(user_delays.mean())
+        delay_values, delay_counts = np.unique(user_delays, return_counts=True)
+        user_metadata["delays"] = dict(zip(delay_values.tolist(), delay_counts.tolist()))
+
+        # Chave de ordenação pré-calculada (SLA, número de hosts que atendem ao SLA)
+        user_metadata["_sort_key"] = (user_metadata["sla"], len(user_metadata["hosts_that_meet_the_sla"]))
 
         users.append(user_metadata)
 
@@ -766,11 +1183,11 @@ def show_scenario_overview():
     print("=================================================================")
     print("==== NETWORK DISTANCE (DELAY) BETWEEN USERS AND EDGE SERVERS ====")
     print("=================================================================")
-    users = sorted(users, key=lambda user_metadata: (user_metadata["sla"], len(user_metadata["hosts_that_meet_the_sla"])))
+    users.sort(key=itemgetter("_sort_key"))
     for index, user_metadata in enumerate(users, 1):
         user_attrs = {
             "object": user_metadata["object"],
-            "sla": user_metadata["object"].delay_slas[str(user_metadata["object"].applications[0].id)],
+            "sla": user_metadata["object"].delay_slas[_app_id_str(user_metadata["object"].applications[0])],
             "hosts_that_meet_the_sla": len(user_metadata["hosts_that_meet_the_sla"]),
             "min": user_metadata["min_delay"],
             "max": user_metadata["max_delay"],
@@ -786,15 +1203,20 @@ def show_scenario_overview():
     # Calculating the infrastructure occupation and information about the services
     edge_server_cpu_capacity = 0
     edge_server_memory_capacity = 0
+    idle_edge_servers = 0
     service_cpu_demand = 0
     service_memory_demand = 0
 
-    for edge_server in EdgeServer.all():
+    # Single pass over the edge servers (capacity of non-registry servers and idle count)
+    for edge_server in edge_servers:
         if len(edge_server.container_registries) == 0:
             edge_server_cpu_capacity += edge_server.cpu
             edge_server_memory_capacity += edge_server.memory
+        if edge_server.cpu_demand == 0:
+            idle_edge_servers += 1
 
-    for service in Service.all():
+    # Single pass over the services (CPU and memory demand)
+    for service in services:
         service_cpu_demand += service.cpu_demand
         service_memory_demand += service.memory_demand
 
@@ -807,17 +1229,17 @@ def show_scenario_overview():
     print("==== INFRASTRUCTURE OCCUPATION OVERVIEW ====")
     print("============================================")
     print("============================================")
-    print(f"Edge Servers: {EdgeServer.count()}")
+    print(f"Edge Servers: {len(edge_servers)}")
     print(f"\tCPU Capacity: {edge_server_cpu_capacity}")
     print(f"\tRAM Capacity: {edge_server_memory_capacity}")
 
     print("")
 
-    print(f"Idle Edge Servers: {sum([1 for s in EdgeServer.all() if s.cpu_demand == 0])}")
+    print(f"Idle Edge Servers: {idle_edge_servers}")
 
     print("")
 
-    print(f"Services: {Service.count()}")
+    print(f"Services: {len(services)}")
     print(f"\tCPU Demand: {service_cpu_demand}")
 
     print(f"\nOverall Occupation")
@@ -835,21 +1257,33 @@ def find_shortest_path(origin_network_switch: object, target_network_switch: obj
     Returns:
         path (list): Shortest path between the origin and target network switches.
     """
+    return _get_shortest_path_entry(origin_network_switch, target_network_switch)[0]
+
+
+def _get_shortest_path_entry(origin_network_switch: object, target_network_switch: object) -> tuple:
+    """Gets the cached (path, delay) entry of the shortest path between two network switches (computed on the first request).
+
+    Args:
+        origin_network_switch (object): Origin network switch.
+        target_network_switch (object): Target network switch.
+
+    Returns:
+        entry (tuple): Shortest path between the network switches and its delay.
+    """
     topology = origin_network_switch.model.topology
-    path = []
 
     if not hasattr(topology, "delay_shortest_paths"):
         topology.delay_shortest_paths = {}
 
     key = (origin_network_switch, target_network_switch)
 
-    if key in topology.delay_shortest_paths.keys():
-        path = topology.delay_shortest_paths[key]
-    else:
+    # ✅ OTIMIZAÇÃO: Delay do caminho armazenado junto com o caminho (somado uma única vez por par)
+    entry = topology.delay_shortest_paths.get(key)
+    if entry is None:
         path = nx.shortest_path(G=topology, source=origin_network_switch, target=target_network_switch, weight="delay")
-        topology.delay_shortest_paths[key] = path
+        entry = topology.delay_shortest_paths[key] = (path, topology.calculate_path_delay(path=path))
 
-    return path
+    return entry
 
 
 def calculate_path_delay(origin_network_switch: object, target_network_switch: object) -> int:
@@ -862,12 +1296,7 @@ def calculate_path_delay(origin_network_switch: object, target_network_switch: o
     Returns:
         delay (int): Delay between the origin and target network switches.
     """
-    topology = origin_network_switch.model.topology
-
-    path = find_shortest_path(origin_network_switch=origin_network_switch, target_network_switch=target_network_switch)
-    delay = topology.calculate_path_delay(path=path)
-
-    return delay
+    return _get_shortest_path_entry(origin_network_switch, target_network_switch)[1]
 
 
 def sign(value: int):
@@ -879,20 +1308,16 @@ def sign(value: int):
     Returns:
         (int): Sign of the passed value.
     """
-    if value > 0:
-        return 1
-    if value < 0:
-        return -1
-    return 0
+    return (value > 0) - (value < 0)
 
 def deprovision_service(service, reason):
     """Libera recursos e remove o serviço da infraestrutura."""
     server = service.server
-    if server is None and not hasattr(service, "_pending_origin_server"):
+    pending_origin = getattr(service, "_pending_origin_server", None)
+    if server is None and pending_origin is None:
         return False
 
-    print(f"[LOG] Desprovisionando serviço {service.id} do servidor {server.id if server else 'None'}")
-    print(f"      Razão: {reason}")
+    logger.debug("[LOG] Desprovisionando serviço %s do servidor %s (razão: %s)", service.id, server.id if server else "None", reason)
 
     # Remover do servidor atual
     if server:
@@ -908,14 +1333,14 @@ def deprovision_service(service, reason):
         cpu_after = server.cpu - server.cpu_demand
         mem_after = server.memory - server.memory_demand
 
-        print(f"[LOG] ✓ Removido da lista do servidor {server.id}")
-        print(f"[LOG] Recursos do servidor de origem {server.id}:")
-        print(f"      ANTES: CPU disponível={cpu_before}, MEM disponível={mem_before}")
-        print(f"      LIBERADO: CPU={service.cpu_demand}, MEM={service.memory_demand}")
-        print(f"      DEPOIS: CPU disponível={cpu_after}, MEM disponível={mem_after}")
+        logger.debug("[LOG] ✓ Removido da lista do servidor %s", server.id)
+        logger.debug(
+            "[LOG] Recursos do servidor de origem %s: ANTES: CPU disponível=%s, MEM disponível=%s | "
+            "LIBERADO: CPU=%s, MEM=%s | DEPOIS: CPU disponível=%s, MEM disponível=%s",
+            server.id, cpu_before, mem_before, service.cpu_demand, service.memory_demand, cpu_after, mem_after,
+        )
 
     # Limpar residual no servidor de origem (quando migração cancelada)
-    pending_origin = getattr(service, "_pending_origin_server", None)
     if pending_origin and pending_origin is not server:
         if service in pending_origin.services:
             pending_origin.services.remove(service)
@@ -926,18 +1351,18 @@ def deprovision_service(service, reason):
         cpu_after = pending_origin.cpu - pending_origin.cpu_demand
         mem_after = pending_origin.memory - pending_origin.memory_demand
 
-        print(f"[LOG] Recursos do servidor de origem {pending_origin.id}:")
-        print(f"      DEPOIS DO AJUSTE: CPU disponível={cpu_after}, MEM disponível={mem_after}")
+        logger.debug(
+            "[LOG] Recursos do servidor de origem %s: DEPOIS DO AJUSTE: CPU disponível=%s, MEM disponível=%s",
+            pending_origin.id, cpu_after, mem_after,
+        )
 
     # Limpar relacionamentos e flags
     service.server = None
     service._available = False
-    if hasattr(service, "_pending_deprovision"):
-        delattr(service, "_pending_deprovision")
-    if hasattr(service, "_deprovision_reason"):
-        delattr(service, "_deprovision_reason")
-    if hasattr(service, "_pending_origin_server"):
-        delattr(service, "_pending_origin_server")
+    # ✅ OTIMIZAÇÃO: Flags com valor padrão None na classe Service (atribuição direta, sem hasattr/delattr)
+    service._pending_deprovision = None
+    service._deprovision_reason = None
+    service._pending_origin_server = None
 
     return True
 
@@ -953,48 +1378,151 @@ def user_set_communication_path(self, app: object, communication_path: list = []
         communication_path (list): Updated communication path.
     """
     topology = Topology.first()
+    app_id = _app_id_str(app)
 
-    # Releasing links used in the past to connect the user with its application
-    if app in self.communication_paths:
-        path = [[NetworkSwitch.find_by_id(i) for i in p] for p in self.communication_paths[str(app.id)]]
-        topology._release_communication_path(communication_path=path, app=app)
+    # ✅ OTIMIZAÇÃO: caminhos também mantidos como objetos (evita reidratar IDs com find_by_id)
+    if not hasattr(self, "_communication_path_objects"):
+        self._communication_path_objects = {}
+
+    # ✅ OTIMIZAÇÃO: enlaces do caminho anterior calculados uma única vez (para liberar/reservar apenas a diferença);
+    # só os enlaces vindos do cache de objetos foram reservados por esta função na chamada anterior
+    previous_path_ids = self.communication_paths.get(app_id)
+    previous_path_objects, previous_path_allocated = _get_path_objects(self, app_id, previous_path_ids)
+    previous_links = _get_path_links(previous_path_objects)
+    allocated_links = set(previous_links) if previous_path_allocated else set()
 
     # Defining communication path
     if len(communication_path) > 0:
-        self.communication_paths[str(app.id)] = communication_path
+        self.communication_paths[app_id] = communication_path
+        self._communication_path_objects.pop(app_id, None)
+        new_links = None
     else:
-        self.communication_paths[str(app.id)] = []
+        self.communication_paths[app_id] = []
+        path_objects = []
+        self._communication_path_objects[app_id] = (self.communication_paths[app_id], path_objects)
 
         service_hosts_base_stations = [service.server.base_station for service in app.services if service.server]
         communication_chain = [self.base_station] + service_hosts_base_stations
 
-        # Defining a set of links to connect the items in the application's service chain
-        for i in range(len(communication_chain) - 1):
-
-            # Defining origin and target nodes
-            origin = communication_chain[i]
-            target = communication_chain[i + 1]
-
-            # Finding and storing the best communication path between the origin and target nodes
-            if origin == target:
-                path = []
-            else:
-                path = find_shortest_path(origin_network_switch=origin.network_switch, target_network_switch=target.network_switch)
+        # ✅ OTIMIZAÇÃO: Usuário na mesma estação base de todos os hosts da cadeia: todos os trechos são vazios
+        # (sem consultas ao cache de caminhos nem conversão de switches)
+        if all(origin is target for origin, target in zip(communication_chain, communication_chain[1:])):
+            for _ in range(len(communication_chain) - 1):
+                self.communication_paths[app_id].append([])
+                path_objects.append([])
+            new_links = set()
+        else:
+            # Defining a set of links to connect the items in the application's service chain
+            for i in range(len(communication_chain) - 1):
 
-            # Adding the best path found to the communication path
-            self.communication_paths[str(app.id)].append([network_switch.id for network_switch in path])
+                # Defining origin and target nodes
+                origin = communication_chain[i]
+                target = communication_chain[i + 1]
 
-            # Computing the new demand of chosen links
-            path = [[NetworkSwitch.find_by_id(i) for i in p] for p in self.communication_paths[str(app.id)]]
-            topology._allocate_communication_path(communication_path=path, app=app)
+                # Finding and storing the best communication path between the origin and target nodes
+                if origin == target:
+                    path = []
+                else:
+                    path = find_shortest_path(origin_network_switch=origin.network_switch, target_network_switch=target.network_switch)
+
+                # Adding the best path found to the communication path
+                self.communication_paths[app_id].append([network_switch.id for network_switch in path])
+                path_objects.append(list(path))
+
+            new_links = _get_path_links(path_objects)
+
+    # Releasing links used in the past to connect the user with its application (only those not reused by the new path)
+    # (testa o ID capturado antes de sobrescrever o caminho: as chaves de communication_paths são str(app.id))
+    if previous_path_ids is not None:
+        links_to_release = previous_links
+        if new_links is not None:
+            links_to_release -= new_links
+        allocated_links -= links_to_release
+        if links_to_release:
+            topology._release_communication_path(communication_path=[list(link) for link in links_to_release], app=app)
+
+    # Computing the new demand of chosen links (only links that are not already reserved for the app)
+    if new_links is not None:
+        links_to_allocate = new_links - allocated_links
+        if links_to_allocate:
+            topology._allocate_communication_path(communication_path=[list(link) for link in links_to_allocate], app=app)
 
     # Computing application's delay
     self._compute_delay(app=app, metric="latency")
 
-    communication_path = self.communication_paths[str(app.id)]
+    communication_path = self.communication_paths[app_id]
     return communication_path
 
 
+def user_peek_delay(self, app: object) -> float:
+    """Computes the delay between the user and its application without (re)allocating the communication path links.
+
+    Args:
+        app (object): User application.
+
+    Returns:
+        delay (float): Wireless delay plus the shortest-path delay of each hop of the application's service chain.
+    """
+    switch_index, delay_matrix = get_delay_matrix(Topology.first())
+
+    communication_chain = [self.base_station] + [service.server.base_station for service in app.services if service.server]
+
+    delay = self.base_station.wireless_delay
+    for origin, target in zip(communication_chain, communication_chain[1:]):
+        if origin != target:
+            delay += delay_matrix[switch_index[origin.network_switch.id], switch_index[target.network_switch.id]]
+
+    return float(delay)
+
+
+# ✅ CACHE GLOBAL de switches por ID
+_NETWORK_SWITCH_CACHE = {}
+
+def _get_network_switch_by_id(switch_id):
+    """Retorna switch usando cache (substitui a varredura linear de NetworkSwitch.find_by_id)."""
+    network_switches = NetworkSwitch.all()
+
+    # Topologia reconstruída (ex.: novo dataset): descartar switches da topologia anterior
+    if network_switches and _NETWORK_SWITCH_CACHE.get(network_switches[0].id) is not network_switches[0]:
+        _NETWORK_SWITCH_CACHE.clear()
+
+    if switch_id not in _NETWORK_SWITCH_CACHE:
+        for network_switch in network_switches:
+            _NETWORK_SWITCH_CACHE[network_switch.id] = network_switch
+    
+    return _NETWORK_SWITCH_CACHE.get(switch_id)
+
+
+def _get_path_objects(user, app_id, path_ids):
+    """
+    Retorna o caminho de comunicação (listas de switches) correspondente aos IDs armazenados.
+    
+    Returns:
+        tuple: (caminho em objetos, True se veio do cache da última chamada de set_communication_path)
+    """
+    if path_ids is None:
+        return [], False
+    
+    # O cache só vale se a lista de IDs não foi substituída externamente (ex.: user_step)
+    cached = user._communication_path_objects.get(app_id)
+    if cached is not None and cached[0] is path_ids:
+        return cached[1], True
+    
+    # Caminho definido externamente (IDs): reidratar via cache de switches
+    return [[_get_network_switch_by_id(i) for i in p] for p in path_ids], False
+
+
+def _get_path_links(communication_path):
+    """Converte um caminho de comunicação (listas de switches) no conjunto de enlaces (pares de switches) utilizados."""
+    links = set()
+    
+    for path in communication_path:
+        for node1, node2 in zip(path, path[1:]):
+            links.add((node1, node2) if node1.id <= node2.id else (node2, node1))
+    
+    return links
+
+
 # ============================================================================
 # NETWORK AWARENESS HELPER (NEW)
 # ============================================================================
@@ -1006,36 +1534,45 @@ def get_path_bottleneck(topology, source_node, target_node):
     """
     try:
         # EdgeSimPy uses shortest path by default
-        path = nx.shortest_path(topology, source=source_node, target=target_node)
+        # ✅ OTIMIZAÇÃO: Caminho (em número de saltos) memoizado por par de nós (topologia estática durante a simulação)
+        if not hasattr(topology, "_hop_shortest_paths"):
+            topology._hop_shortest_paths = {}
         
-        min_available_bw = float('inf')
+        key = (source_node, target_node)
+        path = topology._hop_shortest_paths.get(key)
+        if path is None:
+            path = topology._hop_shortest_paths[key] = nx.shortest_path(topology, source=source_node, target=target_node)
         
-        # Iterate over links in the path
-        for i in range(len(path) - 1):
-            u = path[i]
-            v = path[i+1]
-            
-            # Get link data from NetworkX graph
-            edge_data = topology.get_edge_data(u, v)
+        # Get link data from NetworkX graph for every link in the path
+        edges_data = [topology.get_edge_data(u, v) for u, v in zip(path, path[1:])]
+        link_objects = [edge_data.get('object') if edge_data else None for edge_data in edges_data]
+        
+        if link_objects and all(link_objects):
+            # ✅ OTIMIZAÇÃO: Todos os enlaces com objeto NetworkLink: banda disponível (capacidade - demanda atual)
+            # calculada e reduzida de uma vez com NumPy
+            bandwidth = np.fromiter((link.bandwidth for link in link_objects), dtype=np.float64, count=len(link_objects))
+            bandwidth_demand = np.fromiter((link.bandwidth_demand for link in link_objects), dtype=np.float64, count=len(link_objects))
+            min_available_bw = float((bandwidth - bandwidth_demand).min())
+        else:
+            min_available_bw = _INF
             
-            if edge_data:
-                # Try to access the NetworkLink object directly
-                link_obj = edge_data.get('object')
-                
-                if link_obj:
-                    # Real-time calculation: Capacity - Current Demand
-                    available = link_obj.bandwidth - link_obj.bandwidth_demand
-                else:
-                    # Fallback to metadata
-                    bandwidth = edge_data.get('bandwidth', 12.5) # Default 100Mbps = 12.5MB/s
-                    demand = edge_data.get('bandwidth_demand', 0)
-                    available = bandwidth - demand
-                
-                if available < min_available_bw:
-                    min_available_bw = available
+            # Iterate over links in the path
+            for edge_data, link_obj in zip(edges_data, link_objects):
+                if edge_data:
+                    if link_obj:
+                        # Real-time calculation: Capacity - Current Demand
+                        available = link_obj.bandwidth - link_obj.bandwidth_demand
+                    else:
+                        # Fallback to metadata
+                        bandwidth = edge_data.get('bandwidth', 12.5) # Default 100Mbps = 12.5MB/s
+                        demand = edge_data.get('bandwidth_demand', 0)
+                        available = bandwidth - demand
+                    
+                    if available < min_available_bw:
+                        min_available_bw = available
         
         # If path is just the node itself (local), return infinite or max internal speed
-        if min_available_bw == float('inf'):
+        if min_available_bw == _INF:
             return 125.0 # 1000 Mbps (internal)
             
         return max(0.1, min_available_bw) # Avoid division by zero
@@ -1044,9 +1581,36 @@ def get_path_bottleneck(topology, source_node, target_node):
         return 0.1 # Return minimal bandwidth on error
 
 
+def _interval_contains(access, current_step):
+    """Verifica se o intervalo de acesso (start/end) contém o step."""
+    return access["start"] <= current_step <= access["end"]
+
+
+def refresh_active_applications(user, current_step):
+    """
+    Memoiza (por step) o conjunto de aplicações que o usuário está acessando.
+    
+    Chamado uma vez por usuário no início do monitoramento de downtime; as
+    consultas seguintes de is_user_accessing_application no mesmo step viram
+    um teste de pertinência em conjunto.
+    """
+    active = frozenset(
+        app_id
+        for app_id, access_pattern in user.access_patterns.items()
+        if access_pattern.history and _interval_contains(access_pattern.history[-1], current_step)
+    )
+    user._active_apps_at_step = (current_step, active)
+    return active
+
+
 def is_user_accessing_application(user, application, current_step):
     """Verifica se usuário está acessando aplicação no step atual."""
-    app_id = str(application.id)
+    app_id = _app_id_str(application)
+    
+    # ✅ OTIMIZAÇÃO: usar índice de aplicações ativas do step (se já construído)
+    active_apps_at_step = getattr(user, "_active_apps_at_step", None)
+    if active_apps_at_step is not None and active_apps_at_step[0] == current_step:
+        return app_id in active_apps_at_step[1]
     
     if app_id not in user.access_patterns:
         return False
@@ -1055,10 +1619,7 @@ def is_user_accessing_application(user, application, current_step):
     if not access_pattern.history:
         return False
     
-    last_access = access_pattern.history[-1]
-    is_accessing = last_access["start"] <= current_step <= last_access["end"]
-    
-    return is_accessing
+    return _interval_contains(access_pattern.history[-1], current_step)
 
 
 def get_sla_violations(user) -> dict:
@@ -1069,6 +1630,14 @@ def get_sla_violations(user) -> dict:
     delay_violations_per_access_pattern = {}
 
     current_step = user.model.schedule.steps
+
+    # Cache de delays por aplicação: {app_id: (matriz de delays, assinatura de posicionamento, delay)}
+    cached_delays = user.__dict__.get("_cached_delay")
+    if cached_delays is None:
+        cached_delays = user._cached_delay = {}
+
+    # A matriz de delays funciona como token de versão: reconstruí-la invalida os delays memorizados
+    _, delay_matrix = get_delay_matrix(Topology.first())
     
     # Collecting delay SLA metrics
     for app in user.applications:
@@ -1077,8 +1646,9 @@ def get_sla_violations(user) -> dict:
             continue
 
         service = app.services[0]
-        delay_sla = user.delay_slas[str(app.id)]
-        access_pattern = user.access_patterns[str(app.id)]
+        app_id = _app_id_str(app)
+        delay_sla = user.delay_slas[app_id]
+        access_pattern = user.access_patterns[app_id]
         duration = access_pattern.duration_values[0]
 
         # 🛑 CORREÇÃO CRÍTICA:
@@ -1086,17 +1656,26 @@ def get_sla_violations(user) -> dict:
         # O delay é INFINITO (serviço inacessível).
         # Antes, isso calculava apenas "latência de rede", ignorando que o servidor estava morto.
         if not service.server or not service.server.available:
-            delay = float('inf')
+            delay = _INF
         else:
-            user.set_communication_path(app=app)
-            delay = user._compute_delay(app=app, metric="latency")
+            # ✅ OTIMIZAÇÃO: reutiliza o delay enquanto a assinatura de posicionamento não mudar
+            # (estação base do usuário + servidor de cada serviço); só mede de novo após migração/mobilidade
+            placement_sig = (user.base_station, *(s.server for s in app.services))
+            cached_delay = cached_delays.get(app_id)
+            if cached_delay is not None and cached_delay[0] is delay_matrix and cached_delay[1] == placement_sig:
+                delay = cached_delay[2]
+            else:
+                # Apenas mede o delay (sem liberar/realocar enlaces da topologia)
+                delay = user_peek_delay(user, app)
+                cached_delays[app_id] = (delay_matrix, placement_sig, delay)
         
         # Lógica de Live Migration (Opcional, para refinar):
         # Se for Live Migration, o service.server aponta para ORIGEM.
         # Se a origem está viva (server.available=True), o delay acima (calculado para origem) está CORRETO.
         # Então não precisamos de lógica extra aqui, o check de 'service.server.available' já cobre.
 
-        if delay > delay_sla or isinf(delay):
+        # Delay infinito sempre viola (inclusive quando o SLA também é infinito)
+        if delay > delay_sla or delay == _INF:
             delay_sla_violations += 1
             # ...existing code... (contabilização nos dicionários)
             delay_violations_per_delay_sla[delay_sla] = delay_violations_per_delay_sla.get(delay_sla, 0) + 1
@@ -1109,188 +1688,54 @@ def get_sla_violations(user) -> dict:
     }
 
 
-def update_user_perceived_downtime_for_current_step(current_step):
-    """
-    Atualiza downtime percebido de forma CENTRALIZADA e CONSISTENTE.
-    
-    REGRAS CORRIGIDAS:
-    1. Downtime SOMENTE quando delay = inf E usuário está acessando
-    2. Classificar causa usando is_service_available_for_user()
-    3. Contabilizar por usuário e globalmente
+# Usuários cujo rastreamento de downtime percebido já foi inicializado
+_DOWNTIME_TRACKING_USERS = []
+
+def initialize_perceived_downtime_tracking(users: list):
+    """Inicializa (uma vez por conjunto de usuários) os dicionários de downtime percebido e o histórico de cada aplicação.
+
+    Args:
+        users (list): Usuários da simulação.
     """
-    
-    metrics = get_simulation_metrics()
-    total_downtime_this_step = 0
-    
-    # ✅ REMOVER logs excessivos (só manter se DEBUG ativo)
-    DEBUG_DOWNTIME = False  # Alterar para True se precisar debugar
-    
-    if DEBUG_DOWNTIME:
-        print(f"\n{'='*70}")
-        print(f"[DEBUG_DOWNTIME] === MONITORANDO O DOWNTIME PERCEBIDO - STEP {current_step} ===")
-        print(f"{'='*70}")
-    
-    for user in User.all():
+    global _DOWNTIME_TRACKING_USERS
+
+    # Reinicializar apenas quando o registro de usuários muda (ex.: novo dataset)
+    if len(_DOWNTIME_TRACKING_USERS) == len(users) and (not users or _DOWNTIME_TRACKING_USERS[0] is users[0]):
+        return
+
+    for user in users:
         if not hasattr(user, '_perceived_downtime'):
             user._perceived_downtime = {}
-        
-        # ✅ GARANTIR: Inicializar user_perceived_downtime_history
         if not hasattr(user, 'user_perceived_downtime_history'):
             user.user_perceived_downtime_history = {}
-        
+
         for app in user.applications:
-            app_id = str(app.id)
-            service = app.services[0]
-            
-            # ✅ GARANTIR: Inicializar histórico para este app
-            if app_id not in user.user_perceived_downtime_history:
-                user.user_perceived_downtime_history[app_id] = []
-            
-            # ✅ REGRA: Só conta downtime se usuário ESTÁ acessando
-            if not is_user_accessing_application(user, app, current_step):
-                # ✅ IMPORTANTE: Adicionar False ao histórico mesmo quando não está acessando
-                # Isso mantém sincronização entre step e índice do array
-                user.user_perceived_downtime_history[app_id].append(False)
-                continue
-            
-            # ✅ Verificar disponibilidade
-            is_available, unavailability_reason = is_service_available_for_user(
-                service, user, app, current_step
-            )
-            
-            # ✅ CRÍTICO: Adicionar ao histórico (True = downtime, False = disponível)
-            user.user_perceived_downtime_history[app_id].append(not is_available)
-            
-            if not is_available:
-                # ✅ DOWNTIME DETECTADO
-                total_downtime_this_step += 1
-                
-                # Contabilizar por usuário (para compatibilidade)
-                if app_id not in user._perceived_downtime:
-                    user._perceived_downtime[app_id] = 0
-                user._perceived_downtime[app_id] += 1
-                
-                # ✅ Classificar causa DETALHADA
-                detailed_cause = _classify_downtime_cause_v2(
-                    user, app, service, current_step, unavailability_reason
-                )
-                
-                # Contabilizar globalmente por causa
-                if detailed_cause not in metrics.downtime_reasons:
-                    metrics.downtime_reasons[detailed_cause] = 0
-                metrics.downtime_reasons[detailed_cause] += 1
-                
-                # ✅ LOG (só primeiras 3 ocorrências de cada causa)
-                if DEBUG_DOWNTIME and metrics.downtime_reasons[detailed_cause] <= 3:
-                    server_info = f"{service.server.id} (disponível: {service.server.available})" if service.server else "None"
-                    
-                    print(f"[DEBUG_DOWNTIME] User {user.id} | App {app.id} | Service {service.id}")
-                    print(f"                 Causa: {detailed_cause}")
-                    print(f"                 Delay atual: {user.delays.get(app_id, 0)}")
-                    print(f"                 Status serviço: available={service._available}")
-                    print(f"                 Servidor: {server_info}")
-    
-    # ✅ Atualizar total global
-    metrics.total_perceived_downtime += total_downtime_this_step
-    
-    if DEBUG_DOWNTIME:
-        print(f"{'='*70}\n")
-    
-    # ✅ Log periódico (simplificado)
-    if current_step % 100 == 0 and total_downtime_this_step > 0:
-        print(f"[DOWNTIME_SUMMARY] Step {current_step}: {total_downtime_this_step} steps de downtime")
-        print(f"                   Total acumulado: {metrics.total_perceived_downtime}")
+            # ✅ OTIMIZAÇÃO: Histórico compacto (1 byte por step: 1 = downtime, 0 = disponível)
+            user.user_perceived_downtime_history.setdefault(_app_id_str(app), bytearray())
 
+    _DOWNTIME_TRACKING_USERS = list(users)
+
+
+# ✅ OTIMIZAÇÃO: IDs das aplicações na fila de espera global, montados uma vez por step
+# (cada verificação passa a ser O(1), em vez de uma varredura da fila por evento de downtime)
+_waiting_queue_snapshot = (None, frozenset())
+
+def _is_application_in_waiting_queue(application_id, current_step):
+    """Verifica se uma aplicação está na fila de espera global (snapshot da fila reaproveitado durante o step)."""
+    global _waiting_queue_snapshot
+
+    if _waiting_queue_snapshot[0] != current_step:
+        from simulator.algorithms.trust_edge import get_waiting_queue
+        _waiting_queue_snapshot = (current_step, frozenset(item["application"].id for item in get_waiting_queue()))
+
+    return application_id in _waiting_queue_snapshot[1]
+
+
+def _reset_waiting_queue_snapshot():
+    """Descarta o snapshot da fila de espera (a fila pode ter mudado desde a última contabilização)."""
+    global _waiting_queue_snapshot
+    _waiting_queue_snapshot = (None, frozenset())
 
-def _classify_downtime_cause(user, app, service, current_step):
-    """
-    Classifica causa do downtime em categorias detalhadas.
-    
-    Retorna string com a categoria (ex: "migration_downloading_layers").
-    """
-    # Verificar se há migração ativa
-    if hasattr(service, '_Service__migrations') and service._Service__migrations:
-        migration = service._Service__migrations[-1]
-        
-        if migration.get("end") is None:  # Migração ativa
-            status = migration.get("status", "unknown")
-            origin = migration.get("origin")
-            
-            # ✅ CORRIGIDO: Usar original_migration_reason com fallback robusto
-            original_reason = migration.get("original_migration_reason")
-            
-            # ✅ FALLBACK: Se original_reason for None/vazio, tentar inferir
-            if not original_reason or original_reason == "unknown":
-                migration_reason = migration.get("migration_reason", "unknown")
-                
-                # Tentar inferir da migration_reason
-                if migration_reason == "server_failed":
-                    # Verificar se é Cold Migration
-                    if migration.get("is_cold_migration", False):
-                        original_reason = "server_failed_unpredicted"
-                    elif migration.get("is_recovery_after_prevention", False):
-                        original_reason = "low_reliability"  # Assumir low_reliability como padrão
-                    else:
-                        original_reason = "server_failed_unpredicted"  # Conservador
-                else:
-                    original_reason = migration_reason if migration_reason else "unknown"
-                
-                # ✅ LOG DE DEBUG
-                print(f"[CLASSIFY_DOWNTIME] ⚠️ original_reason vazio! Inferido: '{original_reason}' (migration_reason: '{migration_reason}')")
-            
-            # ✅ MIGRAÇÃO ATIVA
-            if origin is None:
-                # PROVISIONAMENTO
-                if status == "waiting":
-                    # ✅ Verificar se está na fila de espera GLOBAL
-                    from simulator.algorithms.trust_edge_v3 import is_application_in_waiting_queue
-                    if is_application_in_waiting_queue(app.id):
-                        return "provisioning_waiting_in_global_queue"
-                    else:
-                        return "provisioning_waiting_in_download_queue"
-                
-                elif status == "pulling_layers":
-                    return "provisioning_downloading_layers"
-                
-                else:
-                    return "provisioning_other"
-            
-            else:
-                # MIGRAÇÃO (origin != None)
-                
-                if status == "waiting":
-                    # ✅ Verificar se está na fila de espera GLOBAL
-                    from simulator.algorithms.trust_edge_v3 import is_application_in_waiting_queue
-                    if is_application_in_waiting_queue(app.id):
-                        return f"migration_{original_reason}_waiting_in_global_queue"
-                    else:
-                        return f"migration_{original_reason}_waiting_in_download_queue"
-                
-                elif status == "pulling_layers":
-                    # Cold migration (origem indisponível)
-                    if not origin.available:
-                        return f"migration_{original_reason}_downloading_layers_cold"
-                    else:
-                        # Não deveria estar indisponível (Live Migration)
-                        return f"migration_{original_reason}_downloading_layers_live_error"
-                
-                elif status == "migrating_service_state":
-                    return f"migration_{original_reason}_cutover"
-                
-                else:
-                    return f"migration_{original_reason}_other"
-    
-    # ✅ SEM MIGRAÇÃO ATIVA → Serviço órfão ou servidor falhou
-    if service.server is None or not service.server.available:
-        # Verificar se está na fila de espera
-        from simulator.algorithms.trust_edge_v3 import is_application_in_waiting_queue
-        if is_application_in_waiting_queue(app.id):
-            return "server_failure_orphaned_in_queue"
-        else:
-            return "server_failure_orphaned_no_migration_yet"
-    
-    # ✅ CASO NÃO CLASSIFICADO
-    return "downtime_unclassified"
 
 def get_user_perceived_downtime_count(application):
     """
@@ -1306,9 +1751,9 @@ def get_user_perceived_downtime_count(application):
     
     for user in application.users:
         if (hasattr(user, "user_perceived_downtime_history") and 
-            str(application.id) in user.user_perceived_downtime_history):
+            _app_id_str(application) in user.user_perceived_downtime_history):
             # Contar apenas os valores True (downtime percebido)
-            user_downtime = sum(1 for status in user.user_perceived_downtime_history[str(application.id)] if status)
+            user_downtime = user.user_perceived_downtime_history[_app_id_str(application)].count(1)
             total_perceived_downtime += user_downtime
     
     return total_perceived_downtime
@@ -1318,13 +1763,46 @@ def get_user_perceived_downtime_count(application):
 # FAILURE RELIABILITY TRACKING (Reliability at failure instant)
 # ============================================================================
 
-_failure_reliability_events = []   # [{server_id, step, reliability_pct}]
+class FailureReliabilityEvents:
+    """Eventos de confiabilidade no instante das falhas, armazenados em colunas NumPy (SoA).
+
+    ✅ OTIMIZAÇÃO: Cada coluna (server_id, step, reliability_pct) é um array contíguo com
+    crescimento amortizado (dobra a capacidade quando cheio), em vez de um dicionário por evento.
+    """
+
+    __slots__ = ("server_ids", "steps", "reliabilities", "n")
+
+    def __init__(self, capacity: int = 64):
+        self.server_ids = np.empty(capacity, dtype=np.int32)
+        self.steps = np.empty(capacity, dtype=np.int32)
+        self.reliabilities = np.empty(capacity, dtype=float)
+        self.n = 0
+
+    def __len__(self) -> int:
+        return self.n
+
+    def append(self, server_id: int, step: int, reliability_pct: float):
+        """Registra um evento, redimensionando as colunas quando necessário."""
+        if self.n == self.server_ids.size:
+            capacity = 2 * self.server_ids.size
+            self.server_ids = np.resize(self.server_ids, capacity)
+            self.steps = np.resize(self.steps, capacity)
+            self.reliabilities = np.resize(self.reliabilities, capacity)
+
+        self.server_ids[self.n] = server_id
+        self.steps[self.n] = step
+        self.reliabilities[self.n] = reliability_pct
+        self.n += 1
+
+
+_failure_reliability_events = FailureReliabilityEvents()
+_RELIABILITY_BUCKET_LABELS = tuple(f"{i*10}-{i*10+10}%" for i in range(10))  # Faixas de 10% do histograma
 _failure_reliability_seen = set()  # {(server_id, failure_start_step)}
 
 def init_failure_reliability_tracking():
     """Reseta buffers de rastreamento de confiabilidade em falhas."""
     global _failure_reliability_events, _failure_reliability_seen
-    _failure_reliability_events = []
+    _failure_reliability_events = FailureReliabilityEvents()
     _failure_reliability_seen = set()
 
 def record_server_failure_reliability(current_step, horizon=50):
@@ -1332,29 +1810,34 @@ def record_server_failure_reliability(current_step, horizon=50):
     Registra a confiabilidade do servidor no exato step em que a falha inicia.
     Usa failure_trace (planejado) para identificar o início da falha.
     """
-    for server in EdgeServer.all():
-        # Flatten do trace de falhas
+    # Apenas falhas que começam neste step (steps negativos pertencem ao histórico pré-carregado)
+    if current_step < 0:
+        return
+
+    for server in get_step_registries()[1]:
         if not hasattr(server, "failure_model") or not server.failure_model.failure_trace:
             continue
 
-        flatten_trace = [f for group in server.failure_model.failure_trace for f in group]
-        for failure in flatten_trace:
-            starts_at = failure["failure_starts_at"]
-            # Apenas falhas que começam neste step e que ainda não foram registradas
-            if starts_at != current_step or starts_at < 0:
-                continue
+        # ✅ OTIMIZAÇÃO: Conjunto dos inícios de falha planejados, reconstruído apenas quando novos
+        # grupos são adicionados ao trace (sem achatar o trace a cada step para cada servidor)
+        failure_model = server.failure_model
+        failure_starts = getattr(failure_model, "_flat_failure_starts", None)
+        if failure_starts is None or failure_starts[0] != len(failure_model.failure_trace):
+            failure_starts = failure_model._flat_failure_starts = (
+                len(failure_model.failure_trace),
+                frozenset(f["failure_starts_at"] for group in failure_model.failure_trace for f in group),
+            )
+        if current_step not in failure_starts[1]:
+            continue
 
-            key = (server.id, starts_at)
-            if key in _failure_reliability_seen:
-                continue
+        # Falhas já registradas não são contabilizadas novamente
+        key = (server.id, current_step)
+        if key in _failure_reliability_seen:
+            continue
 
-            reliability_pct = get_server_conditional_reliability_weibull(server, horizon) 
-            _failure_reliability_events.append({
-                "server_id": server.id,
-                "step": starts_at,
-                "reliability_pct": reliability_pct
-            })
-            _failure_reliability_seen.add(key)
+        reliability_pct = get_server_conditional_reliability_weibull(server, horizon) 
+        _failure_reliability_events.append(server.id, current_step, reliability_pct)
+        _failure_reliability_seen.add(key)
 
 def print_failure_reliability_summary():
     """
@@ -1364,20 +1847,20 @@ def print_failure_reliability_summary():
         print("\n[FAILURE_RELIABILITY] Nenhuma falha registrada.")
         return
 
-    # Histograma GLOBAL por faixa de 10%
-    global_bins = {f"{i*10}-{i*10+10}%": 0 for i in range(10)}
-    # Histograma POR SERVIDOR
-    per_server_bins = {}  # server_id -> {bucket_label: count}
+    # ✅ OTIMIZAÇÃO: Histogramas (global e por servidor) calculados com np.bincount / np.add.at
+    n_events = len(_failure_reliability_events)
+    reliabilities = _failure_reliability_events.reliabilities[:n_events]
+    server_ids = _failure_reliability_events.server_ids[:n_events]
+    buckets = np.minimum(9, reliabilities // 10).astype(np.int64)
 
-    for evt in _failure_reliability_events:
-        bucket = min(9, int(evt["reliability_pct"] // 10))
-        label = f"{bucket*10}-{bucket*10+10}%"
-        global_bins[label] += 1
+    # Histograma GLOBAL por faixa de 10%
+    global_counts = np.bincount(buckets, minlength=10)
+    global_bins = dict(zip(_RELIABILITY_BUCKET_LABELS, global_counts.tolist()))
 
-        sid = evt["server_id"]
-        if sid not in per_server_bins:
-            per_server_bins[sid] = {f"{i*10}-{i*10+10}%": 0 for i in range(10)}
-        per_server_bins[sid][label] += 1
+    # Histograma POR SERVIDOR (linhas na ordem crescente de ID)
+    unique_server_ids, server_rows = np.unique(server_ids, return_inverse=True)
+    per_server_counts = np.zeros((unique_server_ids.size, 10), dtype=np.int64)
+    np.add.at(per_server_counts, (server_rows, buckets), 1)
 
     global_dominant_bucket = max(global_bins.items(), key=lambda x: x[1])
 
@@ -1387,13 +1870,12 @@ def print_failure_reliability_summary():
 
     # Faixa dominante por servidor
     print("\n[FAILURE_RELIABILITY] Faixa dominante POR SERVIDOR:")
-    for sid in sorted(per_server_bins.keys()):
-        bins = per_server_bins[sid]
-        dominant = max(bins.items(), key=lambda x: x[1])
-        if dominant[1] == 0:
+    for sid, counts in zip(unique_server_ids.tolist(), per_server_counts):
+        dominant = int(counts.argmax())
+        if counts[dominant] == 0:
             # nenhum evento registrado para este servidor (só por segurança)
             continue
-        print(f"  - Servidor {sid}: faixa dominante {dominant[0]} (ocorrências: {dominant[1]})")
+        print(f"  - Servidor {sid}: faixa dominante {_RELIABILITY_BUCKET_LABELS[dominant]} (ocorrências: {counts[dominant]})")
 
     # Histograma global (para referência)
     print("\n[FAILURE_RELIABILITY] Histograma global por faixa de 10%:")
@@ -1413,26 +1895,63 @@ def get_server_total_failures(server):
     """Retorna número total de falhas de um servidor."""
     return len(server.failure_model.failure_history)
 
+def _summarize_failure_history(failure_model):
+    """Retorna (número de falhas, downtime total) do histórico de falhas, calculados em uma única passada.
+
+    ✅ OTIMIZAÇÃO: Memoizado no próprio failure model; como o histórico é append-only, o seu tamanho
+    funciona como versão (MTTR, MTBF, uptime/downtime e disponibilidade reaproveitam o mesmo resumo).
+    """
+    history_length = len(failure_model.failure_history)
+    summary = getattr(failure_model, "_history_summary", None)
+    if summary is None or summary[0] != history_length:
+        failure_starts, becomes_available = failure_model.get_history_arrays()
+        # Downtime inteiro (como no histórico original); infinito apenas para falhas sem fim definido
+        total_downtime = float((becomes_available - failure_starts).sum())
+        if math.isfinite(total_downtime):
+            total_downtime = int(total_downtime)
+        summary = failure_model._history_summary = (history_length, failure_starts.size, total_downtime)
+    return summary[1], summary[2]
+
+def _mttr_kernel(n_failures, total_downtime):
+    """Kernel numérico do MTTR (média dos tempos de reparo)."""
+    if n_failures == 0:
+        return 0
+    return total_downtime / n_failures
+
+def _mtbf_kernel(n_failures, total_downtime, initial_step, current_step):
+    """Kernel numérico do MTBF (uptime do histórico / número de falhas)."""
+    if n_failures == 0:
+        return float("inf")
+    total_time_span = abs(initial_step - current_step) + 1
+    return (total_time_span - total_downtime) / n_failures
+
+def _failure_rate_kernel(mtbf):
+    """Kernel numérico da taxa de falha (1 / MTBF)."""
+    return 1 / mtbf if mtbf != 0 and mtbf != float("inf") else 0
+
+def _conditional_reliability_kernel(failure_rate, upcoming_instants):
+    """Kernel numérico da confiabilidade condicional exponencial (em %)."""
+    if failure_rate == 0:
+        return 100.0  # Máxima confiabilidade
+    return math.exp(-failure_rate * upcoming_instants) * 100
+
+def _trust_cost_kernel(failure_rate, mtbf, time_since_repair):
+    """Kernel numérico do custo de risco instantâneo."""
+    # Casos especiais
+    if failure_rate == 0 or mtbf == float("inf"):
+        return 0
+    if time_since_repair == 0:
+        return float("inf")  # Servidor em falha
+    # Cálculo do risco baseado na proporção tempo/MTBF
+    return failure_rate * (time_since_repair / mtbf)
+
 def get_server_mttr(server):
     """Calcula Mean Time To Repair (MTTR) do servidor."""
-    history = server.failure_model.failure_history
-    repair_times = []
-    
-    for failure_occurrence in history:
-        repair_times.append(failure_occurrence["becomes_available_at"] - failure_occurrence["failure_starts_at"])
-    
-    return sum(repair_times) / len(repair_times) if repair_times else 0
+    return _mttr_kernel(*_summarize_failure_history(server.failure_model))
 
 def get_server_downtime_history(server):
     """Calcula downtime total do histórico completo."""
-    total_downtime = 0
-    
-    for failure_occurrence in server.failure_model.failure_history:
-        failure_start = failure_occurrence["failure_starts_at"]
-        failure_end = failure_occurrence["becomes_available_at"]
-        total_downtime += failure_end - failure_start
-    
-    return total_downtime
+    return _summarize_failure_history(server.failure_model)[1]
 
 def get_server_uptime_history(server):
     """Calcula uptime total do histórico completo."""
@@ -1446,34 +1965,24 @@ def get_server_uptime_history(server):
 
 def get_server_downtime_simulation(server):
     """Calcula downtime durante a simulação."""
-    return sum(1 for available in server.available_history if available is False)
+    return server.available_history.count(False)
 
 def get_server_uptime_simulation(server):
     """Calcula uptime durante a simulação."""
-    return sum(1 for available in server.available_history if available is True)
+    return server.available_history.count(True)
 
 def get_server_mtbf(server):
     """Calcula Mean Time Between Failures (MTBF)."""
-    number_of_failures = len(server.failure_model.failure_history)
-    
-    if number_of_failures == 0:
-        return float("inf")
-    
-    return get_server_uptime_history(server) / number_of_failures
+    n_failures, total_downtime = _summarize_failure_history(server.failure_model)
+    return _mtbf_kernel(n_failures, total_downtime, server.failure_model.initial_failure_time_step, server.model.schedule.steps + 1)
 
 def get_server_failure_rate(server):
     """Calcula taxa de falha do servidor."""
-    mtbf = get_server_mtbf(server)
-    return 1 / mtbf if mtbf != 0 and mtbf != float("inf") else 0
+    return _failure_rate_kernel(get_server_mtbf(server))
 
 def get_server_conditional_reliability(server, upcoming_instants):
     """Calcula confiabilidade condicional para instantes futuros."""
-    server_failure_rate = get_server_failure_rate(server)
-    
-    if server_failure_rate == 0:
-        return 100.0  # Máxima confiabilidade
-    
-    return (math.exp(-server_failure_rate * upcoming_instants)) * 100
+    return _conditional_reliability_kernel(get_server_failure_rate(server), upcoming_instants)
 
 def get_time_since_last_repair(server):
     """
@@ -1481,26 +1990,31 @@ def get_time_since_last_repair(server):
     
     ✅ CORREÇÃO: Para servidores que nunca falharam na simulação atual,
     usa o tempo desde a última falha do HISTÓRICO.
+    
+    O histórico é cronológico (append-only), então a falha mais recente é
+    sempre o último registro: consulta O(1), sem ordenar/varrer o histórico.
     """
     current_step = server.model.schedule.steps + 1
     
     # Verificar se tem falhas no histórico da SIMULAÇÃO ATUAL
-    if hasattr(server, 'failure_model') and server.failure_model.failure_history:
-        # Obter última falha do histórico
-        last_failure = server.failure_model.failure_history[-1]
+    failure_model = getattr(server, 'failure_model', None)
+    if failure_model is not None and failure_model.failure_history:
+        # Obter última falha do histórico (uma única busca por chave)
+        last_failure = failure_model.failure_history[-1]
+        last_repair = last_failure['becomes_available_at']
         
         # Se a falha está no PASSADO (histórico pré-carregado)
-        if last_failure['becomes_available_at'] < 0:
+        if last_repair < 0:
             # Servidor nunca falhou na simulação atual
             # Usar tempo desde o início da simulação
             return current_step
         
         # Se já falhou na simulação atual
-        if last_failure['becomes_available_at'] < current_step:
-            return current_step - last_failure['becomes_available_at']
+        if last_repair < current_step:
+            return current_step - last_repair
         
         # Se está em falha AGORA
-        if last_failure['failure_starts_at'] <= current_step < last_failure['becomes_available_at']:
+        if last_failure['failure_starts_at'] <= current_step < last_repair:
             return 0  # Acabou de falhar
     
     # Fallback: Servidor nunca falhou (nem no histórico)
@@ -1514,8 +2028,10 @@ def get_server_availability(server: object) -> float:
     
     Availability = MTBF / (MTBF + MTTR)
     """
-    mtbf = get_server_mtbf(server)
-    mttr = get_server_mttr(server)
+    # ✅ OTIMIZAÇÃO: MTBF e MTTR derivados do mesmo resumo memoizado do histórico
+    n_failures, total_downtime = _summarize_failure_history(server.failure_model)
+    mtbf = _mtbf_kernel(n_failures, total_downtime, server.failure_model.initial_failure_time_step, server.model.schedule.steps + 1)
+    mttr = _mttr_kernel(n_failures, total_downtime)
     
     if mtbf == float('inf'):
         return 100.0
@@ -1550,122 +2066,84 @@ def estimate_weibull_parameters_from_history(server, window_size=10):
     if not failure_history or len(failure_history) < 2:
         return _default_weibull_params()
     
-    # ✅ NOVO: Usar apenas as N falhas mais recentes (janela deslizante)
-    sorted_failures = sorted(failure_history, key=lambda f: f['failure_starts_at'])
-    recent_failures = sorted_failures[-window_size:] if len(sorted_failures) > window_size else sorted_failures
-    
-    tbf_data = []
-    ttr_data = []
-    
-    for i in range(len(recent_failures)):
-        current_failure = recent_failures[i]
-        
-        # Tempo de reparo (TTR)
-        ttr = current_failure['becomes_available_at'] - current_failure['failure_starts_at']
-        if ttr > 0:
-            ttr_data.append(ttr)
-        
-        # Tempo entre falhas (TBF)
-        if i > 0:
-            previous_failure = recent_failures[i-1]
-            tbf = current_failure['failure_starts_at'] - previous_failure['becomes_available_at']
-            if tbf > 0:
-                tbf_data.append(tbf)
+    tbf_data, ttr_data, window_size_used = _extract_tbf_ttr(server.failure_model, window_size)
     
     if len(tbf_data) < 2:
         return _default_weibull_params()
     
-    # Estimação via Maximum Likelihood (MLE)
-    try:
-        tbf_array = np.array(tbf_data)
-        shape_c, loc, scale_lambda = stats.weibull_min.fit(tbf_array, floc=0)
-        
-        # Validação básica
-        if shape_c <= 0 or scale_lambda <= 0 or np.isnan(shape_c) or np.isnan(scale_lambda):
-            raise ValueError("Parâmetros inválidos")
-        
-        # Teste de qualidade (Kolmogorov-Smirnov)
-        quality = _assess_estimation_quality(tbf_array, shape_c, scale_lambda)
-        
-    except Exception:
-        # Fallback: Método dos Momentos
-        shape_c, scale_lambda = _estimate_weibull_method_of_moments(tbf_data)
-        quality = "fallback"
+    shape_c, scale_lambda, quality = _fit_weibull_mle(tbf_data, ttr_data)
     
     # Calcular MTBF e MTTR
-    mtbf_estimated = scale_lambda * np.math.gamma(1 + 1/shape_c)
-    mttr_mean = np.mean(ttr_data) if ttr_data else 1.0
+    # ✅ OTIMIZAÇÃO: Γ(1 + 1/c) calculado uma vez e guardado junto dos parâmetros (reusado por predict_next_n_failures)
+    gamma_factor = math.gamma(1 + 1/shape_c)
+    mtbf_estimated = scale_lambda * gamma_factor
+    mttr_mean = np.mean(ttr_data) if ttr_data.size else 1.0
     
     return {
         'tbf_shape': shape_c,
         'tbf_scale': scale_lambda,
+        '_gamma_factor': gamma_factor,
         'mtbf_estimated': mtbf_estimated,
         'ttr_mean': mttr_mean,
         'sample_size': len(tbf_data),
         'estimation_quality': quality,
-        'window_size_used': len(recent_failures)  # ✅ NOVO: Rastrear tamanho da janela
+        'window_size_used': window_size_used  # ✅ NOVO: Rastrear tamanho da janela
     }
+
+
+def _extract_tbf_ttr(failure_model, window_size):
+    """
+    Extrai os tempos entre falhas (TBF) e de reparo (TTR) das N falhas mais recentes.
     
-    # ═══════════════════════════════════════════════════════════════
-    # EXTRAIR TEMPOS ENTRE FALHAS (TBF)
-    # ═══════════════════════════════════════════════════════════════
-    tbf_data = []
-    ttr_data = []
-    
-    sorted_history = sorted(failure_history, key=lambda f: f['failure_starts_at'])
+    Returns:
+        tuple: (TBF positivos, TTR positivos, número de falhas na janela)
+    """
+    # ✅ OTIMIZAÇÃO: TBF/TTR extraídos com operações vetoriais sobre os arrays do histórico
+    # (sincronizados incrementalmente pelo failure model), sem laço Python nem consultas a dicionários
+    failure_starts, becomes_available = failure_model.get_history_arrays()
     
-    for i in range(len(sorted_history)):
-        current_failure = sorted_history[i]
-        
-        # Tempo de reparo
-        ttr = current_failure['becomes_available_at'] - current_failure['failure_starts_at']
-        ttr_data.append(ttr)
-        
-        # Tempo entre falhas (TBF)
-        if i > 0:
-            previous_failure = sorted_history[i-1]
-            tbf = current_failure['failure_starts_at'] - previous_failure['becomes_available_at']
-            if tbf > 0:
-                tbf_data.append(tbf)
+    # ✅ NOVO: Usar apenas as N falhas mais recentes (janela deslizante)
+    # ✅ OTIMIZAÇÃO: O histórico é cronológico (append-only) na prática; a ordenação estável só é
+    # feita se algum registro estiver fora de ordem, senão a janela é uma fatia (view) dos arrays
+    if np.all(failure_starts[1:] >= failure_starts[:-1]):
+        recent_starts = failure_starts[-window_size:]
+        recent_ends = becomes_available[-window_size:]
+    else:
+        recent_order = np.argsort(failure_starts, kind="stable")[-window_size:]
+        recent_starts = failure_starts[recent_order]
+        recent_ends = becomes_available[recent_order]
     
-    # ═══════════════════════════════════════════════════════════════
-    # ESTIMAR PARÂMETROS WEIBULL PARA TBF
-    # ═══════════════════════════════════════════════════════════════
-    if len(tbf_data) < 2:
-        return _default_weibull_params()
+    # Tempo de reparo (TTR) e tempo entre falhas (TBF), apenas valores positivos
+    ttr_data = recent_ends - recent_starts
+    tbf_data = recent_starts[1:] - recent_ends[:-1]
     
-    tbf_array = np.array(tbf_data)
+    return tbf_data[tbf_data > 0], ttr_data[ttr_data > 0], len(recent_starts)
+
+
+def _fit_weibull_mle(tbf_data, ttr_data):
+    """
+    Ajusta a distribuição Weibull aos TBFs via Maximum Likelihood (MLE).
     
+    Returns:
+        tuple: (shape_c, scale_lambda, qualidade da estimação)
+    """
     try:
-        # MLE (Maximum Likelihood Estimation)
-        shape_c, loc, scale_lambda = stats.weibull_min.fit(tbf_array, floc=0)
-        
-        # Validação
-        if shape_c <= 0 or scale_lambda <= 0 or not np.isfinite(shape_c) or not np.isfinite(scale_lambda):
-            return _estimate_weibull_method_of_moments(tbf_data, ttr_data)
-        
-        # Estatísticas TTR
-        ttr_mean = np.mean(ttr_data) if ttr_data else 50.0
-        ttr_std = np.std(ttr_data) if len(ttr_data) > 1 else 20.0
+        shape_c, loc, scale_lambda = stats.weibull_min.fit(tbf_data, floc=0)
         
-        # Calcular MTBF estimado
-        mtbf_estimated = scale_lambda * math.gamma(1 + 1/shape_c)
+        # Validação básica
+        if shape_c <= 0 or scale_lambda <= 0 or np.isnan(shape_c) or np.isnan(scale_lambda):
+            raise ValueError("Parâmetros inválidos")
         
-        # Avaliar qualidade
+        # Teste de qualidade (Kolmogorov-Smirnov)
         quality = _assess_estimation_quality(tbf_data, shape_c, scale_lambda)
         
-        return {
-            'tbf_shape': shape_c,
-            'tbf_scale': scale_lambda,
-            'ttr_mean': ttr_mean,
-            'ttr_std': ttr_std,
-            'sample_size': len(tbf_data),
-            'estimation_quality': quality,
-            'mtbf_estimated': mtbf_estimated,
-        }
-        
-    except Exception as e:
-        return _estimate_weibull_method_of_moments(tbf_data, ttr_data)
+    except Exception:
+        # Fallback: Método dos Momentos
+        moments = _estimate_weibull_method_of_moments(tbf_data, ttr_data)
+        shape_c, scale_lambda = moments['tbf_shape'], moments['tbf_scale']
+        quality = "fallback"
+    
+    return shape_c, scale_lambda, quality
 
 
 def _default_weibull_params():
@@ -1696,7 +2174,7 @@ def _estimate_weibull_method_of_moments(tbf_data, ttr_data):
     
     scale_lambda = mean_tbf / math.gamma(1 + 1/shape_c)
     
-    ttr_mean = np.mean(ttr_data) if ttr_data else 50.0
+    ttr_mean = np.mean(ttr_data) if ttr_data.size else 50.0
     ttr_std = np.std(ttr_data) if len(ttr_data) > 1 else 20.0
     
     return {
@@ -1721,7 +2199,13 @@ def _assess_estimation_quality(tbf_data, shape_c, scale_lambda):
     
     try:
         # Teste Kolmogorov-Smirnov
-        ks_statistic, p_value = stats.kstest(tbf_data, 'weibull_min', args=(shape_c, 0, scale_lambda))
+        # ✅ OTIMIZAÇÃO: Estatística D calculada diretamente com a CDF Weibull vetorizada (sem o despacho
+        # genérico de kstest/weibull_min); o p-valor usa a mesma distribuição exata (kstwo) do kstest
+        sorted_tbf = np.sort(np.asarray(tbf_data, dtype=float))
+        cdf = 1.0 - np.exp(-((sorted_tbf / scale_lambda) ** shape_c))
+        empirical_cdf = np.arange(1, n + 1) / n
+        ks_statistic = max((empirical_cdf - cdf).max(), (cdf - (empirical_cdf - 1.0 / n)).max())
+        p_value = float(np.clip(stats.kstwo.sf(ks_statistic, n), 0, 1))
         
         if p_value > 0.10:
             return 'excellent'
@@ -1737,18 +2221,41 @@ def _assess_estimation_quality(tbf_data, shape_c, scale_lambda):
 # CONFIABILIDADE CONDICIONAL COM WEIBULL
 # ============================================================================
 
+# ✅ CACHE da confiabilidade condicional Weibull, válido apenas dentro do step corrente
+_conditional_reliability_cache = {}  # {(server_id, upcoming_instants, tamanho do histórico): confiabilidade}
+_conditional_reliability_cache_step = None
+
 def get_server_conditional_reliability_weibull(server, upcoming_instants):
     """
     Calcula confiabilidade condicional usando parâmetros Weibull estimados.
     
     R(t+Δt | t) = exp[-((t+Δt)/λ)^c + (t/λ)^c]
     """
+    global _conditional_reliability_cache_step
+
     # 1. Estimar parâmetros do histórico (com cache)
     if not hasattr(server, 'model') or not server.model:
         current_step = 0
     else:
         current_step = server.model.schedule.steps
     
+    # ✅ OTIMIZAÇÃO: Memoização por step (o tamanho do histórico invalida a entrada se uma falha for registrada no step)
+    if current_step != _conditional_reliability_cache_step:
+        _conditional_reliability_cache.clear()
+        _conditional_reliability_cache_step = current_step
+
+    failure_model = getattr(server, "failure_model", None)
+    cache_key = (server.id, upcoming_instants, len(failure_model.failure_history) if failure_model else 0)
+    cached_reliability = _conditional_reliability_cache.get(cache_key)
+    if cached_reliability is None:
+        cached_reliability = _conditional_reliability_cache[cache_key] = _conditional_reliability_weibull_kernel(
+            server, current_step, upcoming_instants
+        )
+    return cached_reliability
+
+
+def _conditional_reliability_weibull_kernel(server, current_step, upcoming_instants):
+    """Calcula (sem memoização) a confiabilidade condicional Weibull do servidor no step."""
     params = get_cached_weibull_parameters(server, current_step)
     
     shape_c = params['tbf_shape']
@@ -1874,13 +2381,18 @@ def predict_next_n_failures(server, n_failures=3, max_horizon=200):
     """
     params = get_cached_weibull_parameters(server, server.model.schedule.steps)
     
+    # ✅ OTIMIZAÇÃO: Mensagens de diagnóstico via logger.debug (formatação preguiçosa e sem a
+    # contabilidade do log guard quando o nível DEBUG está desabilitado)
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    
     # ✅ DEBUG: Verificar qualidade da estimação
     if params.get('sample_size', 0) == 0:
-        print(f"[PREDICT_FAILURES] ⚠️ Server {server.id}: SEM DADOS históricos (sample_size=0)")
+        if debug_enabled:
+            logger.debug("[PREDICT_FAILURES] ⚠️ Server %s: SEM DADOS históricos (sample_size=0)", server.id)
         return []
     
-    if params.get('estimation_quality') in ['insufficient', 'poor']:
-        print(f"[PREDICT_FAILURES] ⚠️ Server {server.id}: Estimação {params['estimation_quality']} (sample={params['sample_size']})")
+    if debug_enabled and params.get('estimation_quality') in ['insufficient', 'poor']:
+        logger.debug("[PREDICT_FAILURES] ⚠️ Server %s: Estimação %s (sample=%s)", server.id, params['estimation_quality'], params['sample_size'])
     
     shape_c = params['tbf_shape']
     scale_lambda = params['tbf_scale']
@@ -1891,27 +2403,34 @@ def predict_next_n_failures(server, n_failures=3, max_horizon=200):
     
     if time_since_repair == float('inf'):
         time_since_repair = 0
-        print(f"[PREDICT_FAILURES] Server {server.id}: Nunca falhou ainda (time_since_repair=inf)")
-    
-    # ✅ LIMPEZA PERIÓDICA (adicionar AQUI)
-    _cleanup_predict_failures_log_guard(current_step)
+        if debug_enabled:
+            logger.debug("[PREDICT_FAILURES] Server %s: Nunca falhou ainda (time_since_repair=inf)", server.id)
     
-    log_key = (current_step, server.id, max_horizon)
-    should_log = log_key not in _predict_failures_log_guard
-    if should_log:
-        _predict_failures_log_guard.add(log_key)
+    should_log = False
+    if debug_enabled:
+        # ✅ LIMPEZA PERIÓDICA (adicionar AQUI)
+        _cleanup_predict_failures_log_guard(current_step)
+        
+        log_key = (current_step, server.id, max_horizon)
+        should_log = log_key not in _predict_failures_log_guard
+        if should_log:
+            _remember_predict_failures_log(log_key)
 
     predictions = []
     cumulative_time = time_since_repair
     failures_checked = 0
     failures_beyond_horizon = 0
     
+    # ✅ OTIMIZAÇÃO: Tempo esperado até a falha não depende de i (calculado uma única vez)
+    try:
+        gamma_factor = params.get('_gamma_factor')
+        if gamma_factor is None:
+            gamma_factor = math.gamma(1 + 1/shape_c)
+        expected_ttf = scale_lambda * gamma_factor
+    except (OverflowError, ValueError):
+        expected_ttf = scale_lambda
+    
     for i in range(1, n_failures + 1):
-        try:
-            expected_ttf = scale_lambda * math.gamma(1 + 1/shape_c)
-        except (OverflowError, ValueError):
-            expected_ttf = scale_lambda
-        
         predicted_time = int(current_step + cumulative_time + expected_ttf)
         horizon = predicted_time - current_step
         
@@ -1919,7 +2438,7 @@ def predict_next_n_failures(server, n_failures=3, max_horizon=200):
         if horizon > max_horizon:
             failures_beyond_horizon += 1
             if should_log:
-                print(f"[PREDICT_FAILURES] Server {server.id} - Failure {i}: {horizon} steps (além do horizonte)")
+                logger.debug("[PREDICT_FAILURES] Server %s - Failure %s: %s steps (além do horizonte)", server.id, i, horizon)
             cumulative_time += expected_ttf + ttr_mean
             continue
 
@@ -1944,19 +2463,17 @@ def predict_next_n_failures(server, n_failures=3, max_horizon=200):
             'failure_sequence': i
         })
         
-        print(f"                   ✅ DENTRO do horizonte - Prob: {probability:.1f}%")
-        
         # Atualizar tempo acumulado (TTF + TTR)
         cumulative_time += expected_ttf + ttr_mean
     
         if should_log:
-            print(f"                   ✅ DENTRO do horizonte - Prob: {probability:.1f}%")
+            logger.debug("                   ✅ DENTRO do horizonte - Prob: %.1f%%", probability)
 
     if should_log:
-        print(f"[PREDICT_FAILURES] Server {server.id} - Resumo:")
-        print(f"                   Falhas verificadas: {failures_checked}")
-        print(f"                   Além do horizonte: {failures_beyond_horizon}")
-        print(f"                   Dentro do horizonte: {len(predictions)}")
+        logger.debug(
+            "[PREDICT_FAILURES] Server %s - Resumo: Falhas verificadas: %s | Além do horizonte: %s | Dentro do horizonte: %s",
+            server.id, failures_checked, failures_beyond_horizon, len(predictions),
+        )
 
     return predictions
 
@@ -1993,24 +2510,124 @@ def reset_weibull_estimation_cache():
     """Limpa cache de estimações (útil entre simulações)."""
     global _weibull_estimation_cache
     _weibull_estimation_cache = {}
+    _conditional_reliability_cache.clear()
 
 
 def get_server_trust_cost(server):
     """Calcula custo de risco instantâneo do servidor."""
-    failure_rate = get_server_failure_rate(server)
-    time_since_repair = get_time_since_last_repair(server)
     mtbf = get_server_mtbf(server)
-    
-    # Casos especiais
-    if failure_rate == 0 or mtbf == float("inf"):
-        return 0
-    
-    if time_since_repair == 0:
-        return float("inf")  # Servidor em falha
-    
-    # Cálculo do risco baseado na proporção tempo/MTBF
-    proportion = time_since_repair / mtbf
-    return failure_rate * proportion
+    return _trust_cost_kernel(_failure_rate_kernel(mtbf), mtbf, get_time_since_last_repair(server))
+
+
+@dataclass(slots=True)
+class ServerStats:
+    """Métricas de confiabilidade de um servidor calculadas em conjunto (ver compute_server_stats)."""
+
+    total_failures: int
+    mttr: float
+    mtbf: float
+    failure_rate: float
+    reliability_10: float
+    reliability_60: float
+    time_since_last_repair: float
+    trust_cost: float
+    uptime_history: float
+    downtime_history: float
+    uptime_simulation: int
+    downtime_simulation: int
+
+
+def compute_server_stats(server) -> ServerStats:
+    """Calcula todas as métricas de confiabilidade de um servidor com uma única leitura do histórico de falhas.
+
+    Equivalente a chamar get_server_mttr(), get_server_mtbf(), get_server_trust_cost() etc. separadamente,
+    mas sem reler o histórico (e recalcular MTBF/taxa de falha) a cada métrica.
+
+    Args:
+        server (EdgeServer): Servidor analisado.
+
+    Returns:
+        ServerStats: Métricas de confiabilidade do servidor no step atual.
+    """
+    failure_model = server.failure_model
+    available_history = server.available_history
+    total_failures = len(failure_model.failure_history)
+    current_step = server.model.schedule.steps + 1
+
+    # ✅ OTIMIZAÇÃO: Memoização por step (invalidada também se os históricos crescerem dentro do step)
+    cache_key = (current_step, total_failures, len(available_history))
+    cached_stats = getattr(server, "_stats_cache", None)
+    if cached_stats is not None and cached_stats[0] == cache_key:
+        return cached_stats[1]
+
+    n_failures, downtime_history = _summarize_failure_history(failure_model)
+
+    if total_failures:
+        uptime_history = abs(failure_model.initial_failure_time_step - current_step) + 1 - downtime_history
+    else:
+        uptime_history = float("inf")
+
+    mtbf = _mtbf_kernel(n_failures, downtime_history, failure_model.initial_failure_time_step, current_step)
+    failure_rate = _failure_rate_kernel(mtbf)
+    time_since_last_repair = get_time_since_last_repair(server)
+
+    stats = ServerStats(
+        total_failures=total_failures,
+        mttr=_mttr_kernel(n_failures, downtime_history),
+        mtbf=mtbf,
+        failure_rate=failure_rate,
+        reliability_10=_conditional_reliability_kernel(failure_rate, 10),
+        reliability_60=_conditional_reliability_kernel(failure_rate, 60),
+        time_since_last_repair=time_since_last_repair,
+        trust_cost=_trust_cost_kernel(failure_rate, mtbf, time_since_last_repair),
+        uptime_history=uptime_history,
+        downtime_history=downtime_history,
+        uptime_simulation=available_history.count(True),
+        downtime_simulation=available_history.count(False),
+    )
+    server._stats_cache = (cache_key, stats)
+    return stats
+
+
+def compute_all_server_stats(servers: list) -> Iterator:
+    """Calcula o ServerStats de cada servidor.
+
+    Args:
+        servers (list): Servidores analisados.
+
+    Returns:
+        (Iterator): ServerStats de cada servidor, na mesma ordem de "servers".
+    """
+    return map(compute_server_stats, servers)
+
+
+# Rótulos (na ordem de exibição) usados ao serializar um ServerStats em display_simulation_metrics
+_SERVER_STATS_LABELS = (
+    ("Risk Cost", "trust_cost"),
+    ("Simulation Uptime", "uptime_simulation"),
+    ("Simulation Downtime", "downtime_simulation"),
+    ("History Uptime", "uptime_history"),
+    ("History Downtime", "downtime_history"),
+    ("MTBF", "mtbf"),
+    ("MTTR", "mttr"),
+    ("Failure Rate", "failure_rate"),
+    ("Reliability_10", "reliability_10"),
+    ("Reliability_60", "reliability_60"),
+    ("Time Since Last Repair", "time_since_last_repair"),
+    ("Total Failures", "total_failures"),
+)
+
+
+def server_stats_to_dict(stats: ServerStats) -> dict:
+    """Converte um ServerStats no dicionário rotulado exibido por display_simulation_metrics.
+
+    Args:
+        stats (ServerStats): Métricas de confiabilidade do servidor.
+
+    Returns:
+        (dict): Métricas indexadas pelos rótulos de exibição.
+    """
+    return {label: getattr(stats, field) for label, field in _SERVER_STATS_LABELS}
 
 def get_application_delay_cost(app: object) -> float:
     """
@@ -2026,29 +2643,37 @@ def get_application_delay_cost(app: object) -> float:
     - App B (SLA 30): 1 servidor atende   -> Score = 1/1 = 1.0 (Prioridade 5x maior)
     """
     user = app.users[0]
-    delay_sla = user.delay_slas[str(app.id)]
+    delay_sla = user.delay_slas[_app_id_str(app)]
+    
+    # ✅ OTIMIZAÇÃO: score memoizado por step (status dos servidores só muda entre steps)
+    current_step = user.model.schedule.steps
+    cached_score = getattr(app, "_delay_score_cache", None)
+    if cached_score is not None and cached_score[0] == current_step:
+        return cached_score[1]
     
     # Identificar componentes de rede
     user_switch = user.base_station.network_switch
     wireless_delay = user.base_station.wireless_delay
     
     # Filtrar apenas servidores funcionais
-    available_servers = [s for s in EdgeServer.all() if s.status == "available"]
+    arrays = get_edge_server_arrays()
+    is_available = get_available_server_mask(arrays)
     
-    viable_servers_count = 0
+    # Calcular delay total de todos os servidores usando a matriz de delays da topologia
+    switch_index, delay_matrix = get_delay_matrix(user_switch.model.topology)
+    total_delays = delay_matrix[switch_index[user_switch.id], arrays["switch_idx"][is_available]] + wireless_delay
     
-    for edge_server in available_servers:
-        # Calcular delay total usando a topologia
-        total_delay = get_delay(
-            wireless_delay=wireless_delay,
-            origin_switch=user_switch,
-            target_switch=edge_server.network_switch
-        )
-        
-        # Verificar se este servidor atende ao SLA
-        if total_delay <= delay_sla:
-            viable_servers_count += 1
+    # Contar servidores que atendem ao SLA
+    viable_servers_count = int(np.count_nonzero(total_delays <= delay_sla))
+    
+    score = _get_delay_scarcity_score(viable_servers_count)
+    app._delay_score_cache = (current_step, score)
     
+    return score
+
+
+def _get_delay_scarcity_score(viable_servers_count: int) -> float:
+    """Converte a contagem de servidores viáveis no score de escassez de get_application_delay_cost()."""
     # Calcular Score de Escassez
     if viable_servers_count == 0:
         # Caso Crítico: Nenhuma opção viável.
@@ -2061,7 +2686,7 @@ def get_application_delay_cost(app: object) -> float:
 def get_application_access_intensity_score(app: object) -> float:
     """Calcula score de intensidade de acesso (MAIOR = mais intenso)."""
     user = app.users[0]
-    access_pattern = user.access_patterns[str(app.id)]
+    access_pattern = user.access_patterns[_app_id_str(app)]
     
     duration = access_pattern.duration_values[0]
     interval = access_pattern.interval_values[0]
@@ -2081,30 +2706,45 @@ def get_application_access_intensity_score(app: object) -> float:
     return intensity_score
 
 def get_host_candidates(user: object, service: object) -> list:
-    """Obtém lista de candidatos para hospedar serviço."""
+    """
+    Obtém lista de candidatos para hospedar serviço.
+    
+    Os candidatos são dicionários (e não NamedTuple/__slots__) de propósito:
+    sort_host_candidates() e find_migration_target() adicionam e alteram
+    chaves (projected_queue_size, *_norm, reliability_value) e
+    find_minimum_and_maximum() percorre .items() de cada registro.
+    """
     host_candidates = []
 
     app = service.application
     user = app.users[0]
 
-    available_servers = [s for s in EdgeServer.all() 
-                        if s.status == "available" and get_normalized_free_capacity(s) > 0]
-    
-    for edge_server in available_servers:
-        # Calcular delay e violações SLA
-        path_delay = get_delay(
-            wireless_delay=user.base_station.wireless_delay,
-            origin_switch=user.base_station.network_switch,
-            target_switch=edge_server.network_switch
-            )
-        
-        sla_violations = 1 if path_delay > user.delay_slas[str(service.application.id)] else 0
-        
-        # Calcular métricas do servidor
-        user_access_patterns = user.access_patterns[str(service.application.id)]
-        service_expected_duration = user_access_patterns.duration_values[0]
-        power_consumption = edge_server.power_model_parameters["max_power_consumption"]
-        
+    # ✅ OTIMIZAÇÃO: métricas de delay, SLA e capacidade calculadas de forma vetorizada (SoA)
+    arrays = get_edge_server_arrays()
+    servers = arrays["servers"]
+
+    free_capacities = get_normalized_free_capacity_array(arrays)
+    is_available = get_available_server_mask(arrays)
+    candidate_indices = np.nonzero(is_available & (free_capacities > 0))[0]
+
+    user_switch = user.base_station.network_switch
+    switch_index, delay_matrix = get_delay_matrix(user_switch.model.topology)
+    path_delays = delay_matrix[switch_index[user_switch.id], arrays["switch_idx"][candidate_indices]] + user.base_station.wireless_delay
+    sla_violations_per_server = (path_delays > user.delay_slas[str(service.application.id)]).astype(np.int8)
+
+    # Métricas que dependem apenas da aplicação (fora do loop)
+    user_access_patterns = user.access_patterns[str(service.application.id)]
+    service_expected_duration = user_access_patterns.duration_values[0]
+
+    for index, path_delay, sla_violations, free_capacity, power_consumption in zip(
+        candidate_indices.tolist(),
+        path_delays.tolist(),
+        sla_violations_per_server.tolist(),
+        free_capacities[candidate_indices].tolist(),
+        arrays["max_power"][candidate_indices].tolist(),
+    ):
+        edge_server = servers[index]
+
         # ✅ NOVO: Calcular tempo REAL de provisionamento
         provisioning_estimate = estimate_provisioning_time_for_server(
             target_server=edge_server,
@@ -2126,23 +2766,23 @@ def get_host_candidates(user: object, service: object) -> list:
         trust_cost = 1.0 - (real_weibull_reliability / 100.0)
         
         # ✅ SUBSTITUIR: amount_of_uncached_layers POR métricas reais
-        service_image = ContainerImage.find_by(attribute_name="digest", attribute_value=service.image_digest)
-        service_layers = [ContainerLayer.find_by(attribute_name="digest", attribute_value=digest) 
-                         for digest in service_image.layers_digests]
+        # ✅ OTIMIZAÇÃO: lookups por digest em dicionário/conjunto em vez de varreduras lineares
+        service_image = _get_image_by_digest(service.image_digest)
+        layer_size_by_digest = _get_image_layer_sizes(service_image)
         
-        uncached_layers = [layer for layer in service_layers 
-                          if not any(cached.digest == layer.digest for cached in edge_server.container_layers)]
+        cached_digests = get_cached_layer_digests(edge_server)
+        uncached_digests = [digest for digest in service_image.layers_digests if digest not in cached_digests]
         
         # ✅ NOVAS MÉTRICAS:
-        amount_of_uncached_layers = len(uncached_layers)  # Contagem (compatibilidade)
-        total_uncached_mb = sum(layer.size for layer in uncached_layers)  # TAMANHO TOTAL
+        amount_of_uncached_layers = len(uncached_digests)  # Contagem (compatibilidade)
+        total_uncached_mb = sum(layer_size_by_digest[digest] for digest in uncached_digests)  # TAMANHO TOTAL
         estimated_provisioning_time = provisioning_estimate['total_time_steps']  # TEMPO ESTIMADO
         
         host_candidates.append({
             "object": edge_server,
             "overall_delay": path_delay,
             "sla_violations": sla_violations,
-            "free_capacity": get_normalized_free_capacity(edge_server),
+            "free_capacity": free_capacity,
             "trust_cost": trust_cost,
             "power_consumption": power_consumption,
             "reliability_value": real_weibull_reliability,
@@ -2175,7 +2815,57 @@ def _get_layer_by_digest(digest):
             _LAYER_CACHE[layer.digest] = layer
         print(f"[LAYER_CACHE] Índice construído: {len(_LAYER_CACHE)} camadas")
     
-    return _LAYER_CACHE.get(digest)
+    layer = _LAYER_CACHE.get(digest)
+    if layer is None:
+        # Camada criada após a construção do índice
+        layer = ContainerLayer.find_by(attribute_name="digest", attribute_value=digest)
+        if layer is not None:
+            _LAYER_CACHE[digest] = layer
+    
+    return layer
+
+# ✅ CACHE GLOBAL de imagens por digest
+_IMAGE_CACHE = {}
+
+def _get_image_by_digest(digest):
+    """
+    Retorna imagem usando cache (mesma imagem que ContainerImage.find_by retornaria).
+    Cache construído no primeiro acesso e persiste durante simulação.
+    """
+    global _IMAGE_CACHE
+    
+    # Construir cache na primeira vez (mantendo a primeira imagem de cada digest)
+    if not _IMAGE_CACHE:
+        for image in ContainerImage.all():
+            _IMAGE_CACHE.setdefault(image.digest, image)
+    
+    image = _IMAGE_CACHE.get(digest)
+    if image is None:
+        image = ContainerImage.find_by(attribute_name="digest", attribute_value=digest)
+        if image is not None:
+            _IMAGE_CACHE[digest] = image
+    
+    return image
+
+def _get_image_layer_sizes(image):
+    """
+    Retorna {digest: tamanho} das camadas da imagem.
+    Calculado uma vez por imagem (camadas de uma imagem não mudam durante a simulação).
+    """
+    layer_size_by_digest = getattr(image, "_layer_size_by_digest", None)
+    if layer_size_by_digest is None:
+        layer_size_by_digest = {}
+        for digest in image.layers_digests:
+            layer = _get_layer_by_digest(digest)
+            if layer is not None:
+                layer_size_by_digest[digest] = layer.size
+        image._layer_size_by_digest = layer_size_by_digest
+    
+    return layer_size_by_digest
+
+def get_cached_layer_digests(server):
+    """Retorna o conjunto de digests das camadas presentes no servidor (consulta O(1) por camada)."""
+    return {layer.digest for layer in server.container_layers}
 
 def estimate_migration_time_in_steps(target_server, service, bandwidth_mbps=100.0):
     """
@@ -2205,23 +2895,22 @@ def estimate_migration_time_in_steps(target_server, service, bandwidth_mbps=100.
     BANDWIDTH_MB_PER_SEC = bandwidth_mbps / 8.0
     
     # 1. Identificar imagem e camadas
-    service_image = ContainerImage.find_by(attribute_name="digest", attribute_value=service.image_digest)
+    service_image = _get_image_by_digest(service.image_digest)
     if not service_image:
         result = {'total_time_steps': float('inf'), 'bottleneck': 'no_image'}
         _provisioning_time_cache[cache_key] = result  # ✅ AGORA É SEGURO
         return result
     
     # ✅ OTIMIZAÇÃO: Usar cache de layers
-    service_layers = [_get_layer_by_digest(digest) 
-                     for digest in service_image.layers_digests]
-    service_layers = [l for l in service_layers if l is not None]
+    layer_size_by_digest = _get_image_layer_sizes(service_image)
     
     # 2. Calcular tamanho total a baixar
-    total_size_mb = 0
-    for layer in service_layers:
-        is_cached = any(cached.digest == layer.digest for cached in target_server.container_layers)
-        if not is_cached:
-            total_size_mb += layer.size
+    cached_digests = get_cached_layer_digests(target_server)
+    total_size_mb = sum(
+        layer_size_by_digest[digest]
+        for digest in service_image.layers_digests
+        if digest in layer_size_by_digest and digest not in cached_digests
+    )
             
     # 3. Converter para steps
     if total_size_mb == 0:
@@ -2254,7 +2943,7 @@ def _cleanup_provisioning_time_cache(current_step):
     
     if current_step % 10 == 0:  # Limpar a cada 10 steps
         cutoff = current_step - 2  # Manter apenas últimos 2 steps
-        keys_to_remove = [k for k in _provisioning_time_cache.keys() if k[2] < cutoff]
+        keys_to_remove = [k for k in _provisioning_time_cache if k[2] < cutoff]
         
         for key in keys_to_remove:
             del _provisioning_time_cache[key]
@@ -2308,7 +2997,7 @@ def estimate_provisioning_time_for_server(target_server, service, verbose=False)
         _provisioning_time_cache[cache_key] = result  # ✅ AGORA É SEGURO
         return result
     
-    service_image = ContainerImage.find_by(attribute_name="digest", attribute_value=service.image_digest)
+    service_image = _get_image_by_digest(service.image_digest)
     if not service_image:
         result = {'total_time_steps': float('inf'), 'bottleneck': 'no_image'}
         _provisioning_time_cache[cache_key] = result  # ✅ AGORA É SEGURO
@@ -2319,11 +3008,8 @@ def estimate_provisioning_time_for_server(target_server, service, verbose=False)
                      for digest in service_image.layers_digests]
     service_layers = [l for l in service_layers if l is not None]  # Filtrar None
     
-    cached_layers = [layer for layer in service_layers 
-                     if any(cached.digest == layer.digest for cached in target_server.container_layers)]
-    
-    uncached_layers = [layer for layer in service_layers 
-                       if layer not in cached_layers]
+    cached_digests = get_cached_layer_digests(target_server)
+    uncached_layers = [layer for layer in service_layers if layer.digest not in cached_digests]
     
     if not uncached_layers:
         result = {
@@ -2342,13 +3028,13 @@ def estimate_provisioning_time_for_server(target_server, service, verbose=False)
     
     if config["enable_registry"]:
         available_registries = [
-            reg.server for reg in ContainerRegistry.all() 
+            (reg.server, get_cached_layer_digests(reg.server)) for reg in ContainerRegistry.all() 
             if reg.available and reg.server
         ]
     
     if config["enable_p2p"]:
         available_p2p_servers = [
-            s for s in EdgeServer.all() 
+            (s, get_cached_layer_digests(s)) for s in EdgeServer.all() 
             if s.available and s.id != target_server.id
         ]
     
@@ -2362,12 +3048,12 @@ def estimate_provisioning_time_for_server(target_server, service, verbose=False)
         sources = []
         
         # ✅ OTIMIZAÇÃO: Usar listas pré-filtradas
-        for server in available_registries:
-            if any(l.digest == layer.digest for l in server.container_layers):
+        for server, server_digests in available_registries:
+            if layer.digest in server_digests:
                 sources.append(('registry', server))
         
-        for server in available_p2p_servers:
-            if any(l.digest == layer.digest for l in server.container_layers):
+        for server, server_digests in available_p2p_servers:
+            if layer.digest in server_digests:
                 sources.append(('p2p', server))
         
         if not sources:
@@ -2443,7 +3129,7 @@ def estimate_provisioning_time_for_server(target_server, service, verbose=False)
     
     if verbose:
         print(f"[ESTIMATE_PROVISIONING] Servidor {target_server.id}:")
-        print(f"  Camadas cacheadas: {len(cached_layers)}/{len(service_layers)}")
+        print(f"  Camadas cacheadas: {len(service_layers) - len(uncached_layers)}/{len(service_layers)}")
         print(f"  Camadas para baixar: {len(uncached_layers)} ({total_mb_to_download:.2f} MB)")
         print(f"  Fila de download: {current_queue_size}/{max_concurrent}")
         print(f"  Tempo de espera na fila: {queue_delay} steps")
@@ -2579,31 +3265,24 @@ def is_ongoing_failure(server, current_step=None):
     if not server.failure_model.failure_history:
         return False
     
-    flatten_failure_trace = [item for failure_group in server.failure_model.failure_trace for item in failure_group]
-    
-    ongoing_failure = next(
-        (failure for failure in flatten_failure_trace
-         if failure["failure_starts_at"] <= current_step < failure["becomes_available_at"]),
-        None,
-    )
-    
-    return ongoing_failure is not None
+    # ✅ OTIMIZAÇÃO: busca binária (falhas do trace são ordenadas e disjuntas no tempo)
+    return server.failure_model.get_failure_at(current_step) is not None
 
 def is_making_request(user, current_step):
     """Verifica se usuário está fazendo nova requisição."""
     for app in user.applications:
-        last_access = user.access_patterns[str(app.id)].history[-1]
+        last_access = user.access_patterns[_app_id_str(app)].history[-1]
         if current_step == last_access["start"]:
             return True
     return False
 
 def get_application_downtime(application):
     """Calcula downtime da aplicação durante simulação."""
-    return sum(1 for status in application.availability_history if status is False)
+    return application.availability_history.count(0)
 
 def get_application_uptime(application):
     """Calcula uptime da aplicação durante simulação."""
-    return sum(1 for status in application.availability_history if status is True)
+    return application.availability_history.count(1)
 
 def get_user_perceived_downtime(application):
     """Calcula downtime percebido pelo usuário."""
@@ -2614,216 +3293,251 @@ def get_user_perceived_downtime(application):
 # DISPLAY AND MONITORING FUNCTIONS
 # ============================================================================
 
+def stream_json(out, sections: dict):
+    """Writes a JSON object (indent=2) incrementally, so large sections never need to be fully built in memory.
+
+    Args:
+        out (TextIO): Output stream (e.g., sys.stdout).
+        sections (dict): Top-level entries. Iterator values are streamed as JSON objects from their (key, value)
+            pairs, one entry at a time; any other value is serialized as is.
+    """
+    out.write("{")
+    for section_index, (key, value) in enumerate(sections.items()):
+        out.write(",\n  " if section_index else "\n  ")
+        out.write(f"{dumps(key)}: ")
+
+        if not isinstance(value, Iterator):
+            out.write(dumps(value, indent=2).replace("\n", "\n  "))
+            continue
+
+        out.write("{")
+        is_empty = True
+        for item_key, item_value in value:
+            out.write("\n    " if is_empty else ",\n    ")
+            out.write(f"{dumps(item_key)}: {dumps(item_value, indent=2).replace(chr(10), chr(10) + '    ')}")
+            is_empty = False
+        out.write("}" if is_empty else "\n  }")
+
+    out.write("\n}\n" if sections else "}\n")
+
+
+def _labelled_rows(prefix: str, rows, labels: tuple):
+    """Converts (id, *values) tuple rows into the ("<prefix> <id>", {label: value}) entries expected by stream_json().
+
+    Args:
+        prefix (str): Entity name used in the entry key (e.g., "Application").
+        rows (Iterable): Tuples whose first item is the entity ID, followed by one value per label.
+        labels (tuple): Labels of the values, in the same order as in the rows.
+    """
+    for entity_id, *values in rows:
+        yield f"{prefix} {entity_id}", dict(zip(labels, values))
+
+
 def display_simulation_metrics(simulation_parameters):
     """Exibe métricas detalhadas da simulação."""
-    current_step = simulation_parameters.get("current_step")
-    
     # Métricas de servidores
-    server_metrics = {}
-    for server in EdgeServer.all():
-        server_metrics[f"Server {server.id}"] = {
-            "Risk Cost": get_server_trust_cost(server),
-            "Simulation Uptime": get_server_uptime_simulation(server),
-            "Simulation Downtime": get_server_downtime_simulation(server),
-            "History Uptime": get_server_uptime_history(server),
-            "History Downtime": get_server_downtime_history(server),
-            "MTBF": get_server_mtbf(server),
-            "MTTR": get_server_mttr(server),
-            "Failure Rate": get_server_failure_rate(server),
-            "Reliability_10": get_server_conditional_reliability(server, 10),
-            "Reliability_60": get_server_conditional_reliability(server, 60),
-            "Time Since Last Repair": get_time_since_last_repair(server),
-            "Total Failures": get_server_total_failures(server)
-        }
+    # ✅ OTIMIZAÇÃO: Métricas mantidas como ServerStats (slots) e convertidas em dict só na serialização
+    servers = EdgeServer.all()
+    server_metrics = (
+        (f"Server {server.id}", server_stats_to_dict(stats))
+        for server, stats in zip(servers, compute_all_server_stats(servers))
+    )
     
-    # Métricas de aplicações
-    application_metrics = {}
-    for application in Application.all():
-        application_metrics[f"Application {application.id}"] = {
-            "Uptime": get_application_uptime(application),
-            "Downtime": get_application_downtime(application)
-        }
+    # Métricas de aplicações (linhas em tupla, rotuladas apenas na serialização)
+    application_rows = (
+        (application.id, get_application_uptime(application), get_application_downtime(application))
+        for application in Application.all()
+    )
+    application_metrics = _labelled_rows("Application", application_rows, ("Uptime", "Downtime"))
     
     # Métricas de usuários
-    user_metrics = {}
     total_perceived_downtime = 0
-    for user in User.all():
-        user_entry = {}
-        for application in user.applications:
-            perceived_downtime = get_user_perceived_downtime(application)
-            user_entry[f"Application {application.id} Perceived Downtime"] = perceived_downtime
-            total_perceived_downtime += perceived_downtime
-        user_metrics[f"User {user.id}"] = user_entry
-    
-    # # Métricas da fila de espera
-    # waiting_queue_metrics = {
-    #     "Total Applications in Queue": len(_waiting_queue),
-    #     "Applications by Priority": {}
-    # }
-    
-    # if _waiting_queue:
-    #     priorities = {}
-    #     for item in _waiting_queue:
-    #         priority = int(item["priority_score"] // 100)  # Agrupa por centenas
-    #         priorities[priority] = priorities.get(priority, 0) + 1
-    #     waiting_queue_metrics["Applications by Priority"] = priorities
+
+    def user_metrics():
+        nonlocal total_perceived_downtime
+        for user in User.all():
+            user_entry = {
+                f"Application {application.id} Perceived Downtime": get_user_perceived_downtime(application)
+                for application in user.applications
+            }
+            total_perceived_downtime += sum(user_entry.values())
+            yield f"User {user.id}", user_entry
     
     metrics = {
         "Simulation Parameters": simulation_parameters,
         "Infrastructure": f"{Application.count()}/{Service.count()}/{User.count()}/{EdgeServer.count()}",
-        #"Waiting Queue": waiting_queue_metrics,
         "Server Metrics": server_metrics,
         "Application Metrics": application_metrics,
-        "User Perceived Downtime": user_metrics,
+        "User Perceived Downtime": user_metrics(),
     }
     
-    print(dumps(metrics, indent=4))
-    print(f"Total Perceived Downtime: {total_perceived_downtime}")
+    # ✅ OTIMIZAÇÃO: JSON (indent=2) emitido incrementalmente, uma entidade por vez, sem montar o dicionário completo
+    # (o json da stdlib já serializa float("inf") como Infinity, sem necessidade de tratamento extra)
+    stream_json(sys.stdout, metrics)
+    sys.stdout.write(f"Total Perceived Downtime: {total_perceived_downtime}\n")
+
+# Templates pré-formatados da tabela de display_reliability_metrics
+_RELIABILITY_HEADER = f"{'Rank':^5}|{'ID':^5}|{'Status':^10}|{'Custo Risco':^12}|{'Taxa Falha':^12}|{'T.Últ.Rep':^10}|{'MTBF':^10}|{'MTTR':^8}|{'Falhas':^8}|{'Conf.10':^8}|{'Conf.60':^8}|"
+_RELIABILITY_ROW = "{:^5}|{:^5}|{:^10}|{:^12}|{:^12.6f}|{:^10}|{:^10}|{:^8.2f}|{:^8}|{:^8.2f}|{:^8.2f}|".format
+
 
 def display_reliability_metrics(parameters: dict = {}):
     """Exibe resumo das métricas de confiabilidade."""
     current_step = parameters.get("current_step")
     
-    print(f"\n\nStep: {current_step}")
-    print("=" * 125)
-    print("MÉTRICAS DOS SERVIDORES DISPONÍVEIS".center(125))
-    print("=" * 125)
+    # ✅ OTIMIZAÇÃO: Linhas acumuladas e emitidas em uma única escrita no stdout
+    lines = [
+        f"\n\nStep: {current_step}",
+        "=" * 125,
+        "MÉTRICAS DOS SERVIDORES DISPONÍVEIS".center(125),
+        "=" * 125,
+    ]
     
-    available_servers = [s for s in EdgeServer.all() if s.status == "available"]
-    servers = sorted(available_servers, key=lambda s: get_server_trust_cost(s))
+    # ✅ OTIMIZAÇÃO: Decorate-sort-undecorate (métricas calculadas uma vez e reaproveitadas na tabela)
+    available_servers = get_available_edge_servers()
+    ranked_servers = list(zip(compute_all_server_stats(available_servers), available_servers))
+    ranked_servers.sort(key=lambda entry: entry[0].trust_cost)
     
     # Cabeçalho
-    header = f"{'Rank':^5}|{'ID':^5}|{'Status':^10}|{'Custo Risco':^12}|{'Taxa Falha':^12}|{'T.Últ.Rep':^10}|{'MTBF':^10}|{'MTTR':^8}|{'Falhas':^8}|{'Conf.10':^8}|{'Conf.60':^8}|"
-    print(header)
-    print("-" * 125)
+    lines.append(_RELIABILITY_HEADER)
+    lines.append("-" * 125)
     
-    for rank, server in enumerate(servers, 1):
-        mtbf = get_server_mtbf(server)
-        time_since_repair = get_time_since_last_repair(server)
-        risk_cost = get_server_trust_cost(server)
+    for rank, (stats, server) in enumerate(ranked_servers, 1):
+        mtbf = stats.mtbf
+        time_since_repair = stats.time_since_last_repair
+        risk_cost = stats.trust_cost
         
         # Formatação especial para valores infinitos
         mtbf_str = "∞" if mtbf == float("inf") else f"{mtbf:.2f}"
         time_repair_str = "Never" if time_since_repair == float("inf") else f"{time_since_repair:.2f}"
         risk_cost_str = "Mínimo" if risk_cost == 0 else f"{risk_cost:.4f}"
         
-        row = f"{rank:^5}|{server.id:^5}|{server.status:^10}|{risk_cost_str:^12}|{get_server_failure_rate(server):^12.6f}|{time_repair_str:^10}|{mtbf_str:^10}|{get_server_mttr(server):^8.2f}|{get_server_total_failures(server):^8}|{get_server_conditional_reliability(server, 10):^8.2f}|{get_server_conditional_reliability(server, 60):^8.2f}|"
-        print(row)
+        lines.append(
+            _RELIABILITY_ROW(
+                rank, server.id, server.status, risk_cost_str, stats.failure_rate, time_repair_str,
+                mtbf_str, stats.mttr, stats.total_failures, stats.reliability_10, stats.reliability_60,
+            )
+        )
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def display_application_info():
     """Exibe informações sobre aplicações e servidores."""
-    print("\n" + "=" * 50)
-    print("INFORMAÇÕES DE APLICAÇÕES E SERVIDORES".center(50))
-    print("=" * 50)
+    # ✅ OTIMIZAÇÃO: Linhas acumuladas e emitidas em uma única escrita no stdout
+    lines = [
+        "\n" + "=" * 50,
+        "INFORMAÇÕES DE APLICAÇÕES E SERVIDORES".center(50),
+        "=" * 50,
+    ]
     
     header = f"{'App ID':^12}|{'Server ID':^12}|{'User ID':^12}|{'Status':^10}"
-    print(header)
-    print("-" * 50)
+    lines.append(header)
+    lines.append("-" * 50)
     
     for application in Application.all():
         service = application.services[0] if application.services else None
         server_id = service.server.id if service and service.server else "N/A"
+        status = "Online" if application.availability_status else "Offline"
         
         users = application.users
         if users:
             for user in users:
-                status = "Online" if application.availability_status else "Offline"
                 row = f"{application.id:^12}|{server_id:^12}|{user.id:^12}|{status:^10}"
-                print(row)
+                lines.append(row)
         else:
-            status = "Online" if application.availability_status else "Offline"
             row = f"{application.id:^12}|{server_id:^12}|{'N/A':^12}|{status:^10}"
-            print(row)
+            lines.append(row)
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # ============================================================================
 # INFRASTRUCTURE COLLECTION FUNCTIONS
 # ============================================================================
+def _infrastructure_usage_kernel(capacity, cpu, memory, disk, cpu_demand, memory_demand, disk_demand, available, model_idx, n_models):
+    """Kernel numérico das métricas de uso da infraestrutura (somente arrays NumPy, sem objetos Python).
+
+    Returns:
+        (tuple): Soma da ocupação por modelo, número de servidores sobrecarregados e contagens por modelo
+            de servidores totais, disponíveis e ativos (com alguma demanda).
+    """
+    # Occupation (servidores indisponíveis não contribuem)
+    demand = normalize_cpu_and_memory(cpu=cpu_demand, memory=memory_demand)
+    server_occupation = np.where(available, demand / capacity * 100, 0.0)
+
+    # Overloaded edge servers
+    overloaded = available & ((cpu < cpu_demand) | (memory < memory_demand) | (disk < disk_demand))
+
+    # Active servers: cada servidor é visitado uma vez, então basta contar (sem conjuntos de IDs)
+    active = available & ((cpu_demand > 0) | (memory_demand > 0) | (disk_demand > 0))
+
+    return (
+        np.bincount(model_idx, weights=server_occupation, minlength=n_models),
+        int(np.count_nonzero(overloaded)),
+        np.bincount(model_idx, minlength=n_models),
+        np.bincount(model_idx[available], minlength=n_models),
+        np.bincount(model_idx[active], minlength=n_models),
+    )
+
+
 def get_infrastructure_usage_metrics() -> dict:
     """Method that collects a set of infrastructure metrics."""
     
-    # Declaring infrastructure metrics
-    overloaded_edge_servers = 0
-    overall_occupation = 0
-    occupation_per_model = {}
+    # ✅ OTIMIZAÇÃO: Aritmética por servidor vetorizada sobre o SoA (Structure of Arrays) dos servidores
+    arrays = get_edge_server_arrays()
+    model_names = arrays["model_names"]
+    model_idx = arrays["model_idx"]
+    available = get_available_server_mask(arrays)
+    cpu_demand, memory_demand, disk_demand = get_edge_server_demand_arrays(arrays)
+
+    n_models = len(model_names)
+    occupation_sums, overloaded_edge_servers, total_counts, available_counts, active_counts = _infrastructure_usage_kernel(
+        arrays["capacity_norm"], arrays["cpu"], arrays["memory"], arrays["disk"], cpu_demand, memory_demand, disk_demand, available, model_idx, n_models
+    )
+    overall_occupation = float(occupation_sums.sum())
+
+    # Occupation and number of servers per Server Model
+    total_servers_per_model = dict(zip(model_names, total_counts.tolist()))
+    available_servers_per_model = dict(zip(model_names, available_counts.tolist()))
+    occupation_per_model = dict(zip(model_names, occupation_sums.tolist()))
+    available_occupation_per_model = dict(occupation_per_model)
+
+    # Active servers per model (only models with at least one active server)
+    active_servers_per_model = {
+        model_name: count for model_name, count in zip(model_names, active_counts.tolist()) if count > 0
+    }
+
+    # Power consumption per Server Model
     overall_power_consumption = 0
     power_consumption_per_server_model = {}
-    active_servers_per_model = {}
-    total_servers_per_model = {}
-    available_overall_occupation = 0
-    available_occupation_per_model = {}
-    available_servers_per_model = {}
-
-    # Counter total servers per model
-    for edge_server in EdgeServer.all():
-        if edge_server.model_name not in total_servers_per_model:
-            total_servers_per_model[edge_server.model_name] = 0
-        total_servers_per_model[edge_server.model_name] += 1
-        
-        if edge_server.model_name not in occupation_per_model:
-            occupation_per_model[edge_server.model_name] = 0
-
-        # Inicializar ocupação para servidores disponíveis
-        if edge_server.model_name not in available_occupation_per_model:
-            available_occupation_per_model[edge_server.model_name] = 0
-        
-        # Contar servidores disponíveis por modelo
-        if edge_server.status == "available":
-            if edge_server.model_name not in available_servers_per_model:
-                available_servers_per_model[edge_server.model_name] = 0
-            available_servers_per_model[edge_server.model_name] += 1
-
-    # Collecting infrastructure metrics
-    for edge_server in EdgeServer.all():
-        if edge_server.status == "available":
-        
-            # Overall Occupation
-            capacity = normalize_cpu_and_memory(cpu=edge_server.cpu, memory=edge_server.memory)
-            demand = normalize_cpu_and_memory(cpu=edge_server.cpu_demand, memory=edge_server.memory_demand)
-            server_occupation = demand / capacity * 100
-            overall_occupation += server_occupation
-            available_overall_occupation += server_occupation
-            overall_power_consumption += edge_server.get_power_consumption()
-
-            # Number of overloaded edge servers
-            free_cpu = edge_server.cpu - edge_server.cpu_demand
-            free_memory = edge_server.memory - edge_server.memory_demand
-            free_disk = edge_server.disk - edge_server.disk_demand
-            if free_cpu < 0 or free_memory < 0 or free_disk < 0:
-                overloaded_edge_servers += 1
-
-            # Occupation per Server Model
-            occupation_per_model[edge_server.model_name] += server_occupation
-            available_occupation_per_model[edge_server.model_name] += server_occupation
-
-            # Power consumption per Server Model
-            if edge_server.model_name not in power_consumption_per_server_model.keys():
-                power_consumption_per_server_model[edge_server.model_name] = []
-            power_consumption_per_server_model[edge_server.model_name].append(edge_server.get_power_consumption())
-
-            # Active servers per model (servers with any demand > 0)
-            if edge_server.cpu_demand > 0 or edge_server.memory_demand > 0 or edge_server.disk_demand > 0:
-                if edge_server.model_name not in active_servers_per_model:
-                    active_servers_per_model[edge_server.model_name] = set()
-                active_servers_per_model[edge_server.model_name].add(edge_server.id)
+
+    # ✅ OTIMIZAÇÃO: Itera apenas os servidores disponíveis (lista em cache até algum servidor mudar de status)
+    for edge_server in get_available_edge_servers():
+        model_name = edge_server.model_name
+        power_consumption = edge_server.get_power_consumption()
+        overall_power_consumption += power_consumption
+
+        # Power consumption per Server Model (apenas o total do step; amostras individuais não são consumidas)
+        power_consumption_per_server_model[model_name] = power_consumption_per_server_model.get(model_name, 0) + power_consumption
 
     # Aggregating overall metrics for this step
-    overall_occupation = overall_occupation / EdgeServer.count() if EdgeServer.count() > 0 else 0
+    n_servers = arrays["count"]
+    overall_occupation = overall_occupation / n_servers if n_servers > 0 else 0
 
     # Convert occupation per model to averages for this step
-    for model_name in occupation_per_model.keys():
+    for model_name, occupation_sum in occupation_per_model.items():
         total_servers = total_servers_per_model[model_name]
-        occupation_per_model[model_name] = occupation_per_model[model_name] / total_servers if total_servers > 0 else 0
+        occupation_per_model[model_name] = occupation_sum / total_servers if total_servers > 0 else 0
 
     # Calcular available_overall_occupation como média ponderada
     total_weighted_occupation = 0
     total_available_servers = 0
     
-    for model_name in available_occupation_per_model.keys():
+    for model_name, occupation_sum in available_occupation_per_model.items():
         available_servers_for_model = available_servers_per_model.get(model_name, 0)
         if available_servers_for_model > 0:
             # Ocupação média deste modelo
-            model_avg_occupation = available_occupation_per_model[model_name] / available_servers_for_model
+            model_avg_occupation = occupation_sum / available_servers_for_model
             available_occupation_per_model[model_name] = model_avg_occupation
             
             # Contribuir para média ponderada global
@@ -2838,10 +3552,6 @@ def get_infrastructure_usage_metrics() -> dict:
         if total_available_servers > 0 else 0
     )
 
-    # Convert active servers sets to counts
-    for model_name in active_servers_per_model.keys():
-        active_servers_per_model[model_name] = len(active_servers_per_model[model_name])
-
     metrics = {
         "overloaded_edge_servers": overloaded_edge_servers,
         "overall_occupation": overall_occupation,
@@ -2878,7 +3588,7 @@ def collect_all_sla_violations():
     
     for user in User.all():
         for app in user.applications:
-            app_id = str(app.id)
+            app_id = _app_id_str(app)
             if app_id in user.delays:
                 delay = user.delays[app_id]
                 if delay != float('inf') and delay > 0:
@@ -2981,6 +3691,18 @@ def is_service_available_for_user(service, user, application, current_step):
     if not is_user_accessing_application(user, application, current_step):
         return (False, "user_not_accessing")
     
+    return _get_service_availability_state(service, get_migration_config())
+
+
+def _get_service_availability_state(service, migration_config):
+    """
+    Regras 2-5 de is_service_available_for_user(), que dependem apenas do estado
+    do serviço (e não do usuário). Permite calcular o estado uma única vez por
+    serviço em cada step.
+    
+    Retorna:
+        (bool, str): (disponível?, razão_da_indisponibilidade)
+    """
     # Regra 2: Serviço deve ter servidor
     if not service.server:
         return (False, "no_server_allocated")
@@ -2994,11 +3716,8 @@ def is_service_available_for_user(service, user, application, current_step):
         last_migration = service._Service__migrations[-1]
         
         if last_migration.get("end") is None:  # Migração ativa
-            from simulator.extensions.service_extensions import get_migration_config
-            config = get_migration_config()
-            
             # ✅ LIVE MIGRATION: Serviço pode estar disponível na origem
-            if config["enable_live_migration"]:
+            if migration_config["enable_live_migration"]:
                 origin = last_migration.get("origin")
                 
                 # Verificar se serviço ESTÁ na origem E origem disponível
@@ -3058,9 +3777,10 @@ def update_all_user_delays(current_step):
     
     Esta função DEVE SER CHAMADA por TODOS os algoritmos para garantir consistência.
     """
-    for user in User.all():
+    users, _, _ = get_step_registries()
+    for user in users:
         for app in user.applications:
-            app_id = str(app.id)
+            app_id = _app_id_str(app)
             
             delay, unavailability_reason = calculate_user_delay_for_application(
                 user, app, current_step
@@ -3095,14 +3815,16 @@ def collect_sla_violations_for_current_step():
     """
     from simulator.helper_functions import get_simulation_metrics
     
-    current_step = Topology.first().model.schedule.steps + 1
+    model = Topology.first().model
+    current_step = model.schedule.steps + 1
     metrics = get_simulation_metrics()
     
     total_violations_this_step = 0
     
-    for user in User.all():
+    users, _, _ = get_step_registries(model)
+    for user in users:
         for app in user.applications:
-            app_id = str(app.id)
+            app_id = _app_id_str(app)
             
             # ✅ REGRA 4: Pular se usuário não está acessando
             if not is_user_accessing_application(user, app, current_step):
@@ -3119,21 +3841,8 @@ def collect_sla_violations_for_current_step():
             if current_delay == float('inf'):
                 total_violations_this_step += 1
                 
-                # Contabilizar por aplicação
-                if app_id not in metrics.delay_violations_per_application:
-                    metrics.delay_violations_per_application[app_id] = 0
-                metrics.delay_violations_per_application[app_id] += 1
-                
-                # Contabilizar por SLA
-                sla_key = str(delay_sla)
-                if sla_key not in metrics.delay_violations_per_delay_sla:
-                    metrics.delay_violations_per_delay_sla[sla_key] = 0
-                metrics.delay_violations_per_delay_sla[sla_key] += 1
-                
-                # ✅ CORREÇÃO: Contabilizar por access pattern
-                if duration not in metrics.delay_violations_per_access_pattern:
-                    metrics.delay_violations_per_access_pattern[duration] = 0
-                metrics.delay_violations_per_access_pattern[duration] += 1
+                # Contabilizar por aplicação, por SLA e (✅ CORREÇÃO) por access pattern
+                metrics.add_delay_violation(app_id, str(delay_sla), duration)
                 
                 continue
             
@@ -3141,24 +3850,11 @@ def collect_sla_violations_for_current_step():
             if current_delay > delay_sla:
                 total_violations_this_step += 1
                 
-                # Contabilizar por aplicação
-                if app_id not in metrics.delay_violations_per_application:
-                    metrics.delay_violations_per_application[app_id] = 0
-                metrics.delay_violations_per_application[app_id] += 1
-                
-                # Contabilizar por SLA
-                sla_key = str(delay_sla)
-                if sla_key not in metrics.delay_violations_per_delay_sla:
-                    metrics.delay_violations_per_delay_sla[sla_key] = 0
-                metrics.delay_violations_per_delay_sla[sla_key] += 1
-                
-                # ✅ CORREÇÃO: Contabilizar por access pattern
-                if duration not in metrics.delay_violations_per_access_pattern:
-                    metrics.delay_violations_per_access_pattern[duration] = 0
-                metrics.delay_violations_per_access_pattern[duration] += 1
+                # Contabilizar por aplicação, por SLA e (✅ CORREÇÃO) por access pattern
+                metrics.add_delay_violation(app_id, str(delay_sla), duration)
     
     # ✅ Armazenar total
-    metrics.total_delay_sla_violations += total_violations_this_step
+    metrics.add_delay_sla_violations(total_violations_this_step)
     
     # ✅ Log periódico
     if current_step % 100 == 0:
@@ -3182,49 +3878,53 @@ def update_user_perceived_downtime_for_current_step(current_step):
     
     metrics = get_simulation_metrics()
     total_downtime_this_step = 0
+    _reset_waiting_queue_snapshot()
     
-    print(f"\n{'='*70}")
-    print(f"[DEBUG_DOWNTIME] === MONITORANDO O DOWNTIME PERCEBIDO - STEP {current_step} ===")
-    print(f"{'='*70}")
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
     
-    for user in User.all():
-        if not hasattr(user, '_perceived_downtime'):
-            user._perceived_downtime = {}
+    # ✅ OTIMIZAÇÃO: estado de disponibilidade calculado uma vez por serviço no step
+    migration_config = get_migration_config()
+    service_states = {}
+    if debug_enabled:
+        logger.debug("[DEBUG_DOWNTIME] === MONITORANDO O DOWNTIME PERCEBIDO - STEP %s ===", current_step)
+    
+    # ✅ OTIMIZAÇÃO: Dicionários e históricos inicializados uma única vez (sem hasattr/membership no laço)
+    users = get_step_registries()[0]
+    initialize_perceived_downtime_tracking(users)
+    
+    for user in users:
+        # ✅ Índice de aplicações ativas construído uma vez por usuário/step
+        refresh_active_applications(user, current_step)
         
-        # ✅ CORREÇÃO: Inicializar user_perceived_downtime_history
-        if not hasattr(user, 'user_perceived_downtime_history'):
-            user.user_perceived_downtime_history = {}
+        perceived_downtime = user._perceived_downtime
+        downtime_histories = user.user_perceived_downtime_history
         
         for app in user.applications:
-            app_id = str(app.id)
+            app_id = _app_id_str(app)
             service = app.services[0]
-            
-            # ✅ Inicializar histórico para este app (se não existir)
-            if app_id not in user.user_perceived_downtime_history:
-                user.user_perceived_downtime_history[app_id] = []
+            downtime_history = downtime_histories[app_id]
             
             # ✅ REGRA: Só conta downtime se usuário ESTÁ acessando
             if not is_user_accessing_application(user, app, current_step):
                 # ✅ CORREÇÃO: Adicionar False ao histórico mesmo quando não está acessando
-                user.user_perceived_downtime_history[app_id].append(False)
+                downtime_history.append(False)
                 continue
             
-            # ✅ Verificar disponibilidade
-            is_available, unavailability_reason = is_service_available_for_user(
-                service, user, app, current_step
-            )
+            # ✅ Verificar disponibilidade (usuário já confirmado como acessando acima)
+            service_state = service_states.get(service.id)
+            if service_state is None:
+                service_state = service_states[service.id] = _get_service_availability_state(service, migration_config)
+            is_available, unavailability_reason = service_state
             
             # ✅ CORREÇÃO: Adicionar ao histórico (True = downtime, False = disponível)
-            user.user_perceived_downtime_history[app_id].append(not is_available)
+            downtime_history.append(not is_available)
             
             if not is_available:
                 # ✅ DOWNTIME DETECTADO
                 total_downtime_this_step += 1
                 
-                # Contabilizar por usuário (para compatibilidade)
-                if app_id not in user._perceived_downtime:
-                    user._perceived_downtime[app_id] = 0
-                user._perceived_downtime[app_id] += 1
+                # Contabilizar por usuário (para compatibilidade; chave criada apenas no primeiro downtime)
+                perceived_downtime[app_id] = perceived_downtime.get(app_id, 0) + 1
                 
                 # ✅ Classificar causa DETALHADA
                 detailed_cause = _classify_downtime_cause_v2(
@@ -3232,24 +3932,19 @@ def update_user_perceived_downtime_for_current_step(current_step):
                 )
                 
                 # Contabilizar globalmente por causa
-                if detailed_cause not in metrics.downtime_reasons:
-                    metrics.downtime_reasons[detailed_cause] = 0
-                metrics.downtime_reasons[detailed_cause] += 1
+                metrics.add_downtime_reason(detailed_cause)
                 
                 # ✅ LOG (só primeiras ocorrências para não poluir)
-                if metrics.downtime_reasons[detailed_cause] <= 3:
+                if debug_enabled and metrics.downtime_reasons[detailed_cause] <= 3:
                     server_info = f"{service.server.id} (disponível: {service.server.available})" if service.server else "None"
                     
-                    print(f"[DEBUG_DOWNTIME] User {user.id} | App {app.id} | Service {service.id}")
-                    print(f"                 Causa: {detailed_cause}")
-                    print(f"                 Delay atual: {user.delays.get(app_id, 0)}")
-                    print(f"                 Status serviço: available={service._available}")
-                    print(f"                 Servidor: {server_info}")
+                    logger.debug(
+                        "[DEBUG_DOWNTIME] User %s | App %s | Service %s | Causa: %s | Delay atual: %s | Status serviço: available=%s | Servidor: %s",
+                        user.id, app.id, service.id, detailed_cause, user.delays.get(app_id, 0), service._available, server_info,
+                    )
     
     # ✅ Atualizar total global
-    metrics.total_perceived_downtime += total_downtime_this_step
-    
-    print(f"{'='*70}\n")
+    metrics.add_perceived_downtime(total_downtime_this_step)
     
     # ✅ Log periódico
     if current_step % 100 == 0:
@@ -3271,9 +3966,7 @@ def _classify_downtime_cause_v2(user, app, service, current_step, unavailability
     
     # ✅ CASO 1: Sem servidor alocado
     if unavailability_reason == "no_server_allocated":
-        from simulator.algorithms.trust_edge_v3 import is_application_in_waiting_queue
-        
-        if is_application_in_waiting_queue(app.id):
+        if _is_application_in_waiting_queue(app.id, current_step):
             return "waiting_queue_global"
         
         if not hasattr(service, '_Service__migrations') or len(service._Service__migrations) == 0:
@@ -3521,7 +4214,7 @@ def validate_tracking_consistency(current_step):
     
     for user in User.all():
         for app in user.applications:
-            app_id = str(app.id)
+            app_id = _app_id_str(app)
             service = app.services[0]
             
             if not is_user_accessing_application(user, app, current_step):
@@ -3612,7 +4305,7 @@ def diagnose_downtime_sla_violations():
     
     for user in User.all():
         for app in user.applications:
-            app_id = str(app.id)
+            app_id = _app_id_str(app)
             
             # Obter metadados
             access_pattern = user.access_patterns[app_id]